@@ -0,0 +1,269 @@
+#!/usr/bin/env python
+"""Benchmarks for the client's overhead, throughput and memory use.
+
+Everything runs against tests/fakeserver.py, so no network is needed:
+
+    python benchmarks/bench.py run -o results.json
+    python benchmarks/bench.py run --quick -o new.json
+    python benchmarks/bench.py compare results.json new.json
+
+compare exits with status 1 if any metric got worse by more than the
+threshold (10% by default), so it can gate changes to api_class.mustache or
+the transport.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import requests
+from requests.adapters import BaseAdapter
+
+from trello import TrelloApi
+from tests.fakeserver import FakeTrello, FakeTrelloServer, H2Server, self_signed_cert
+from trello.http2 import http2_available
+from trello.transport import Transport
+
+# Metrics where a bigger number is better; everything else is a cost.
+HIGHER_IS_BETTER = ('calls_per_second',)
+
+class CannedAdapter(BaseAdapter):
+    # Answers every request with the same bytes, so timing a generated method
+    # measures only the client: URL formatting, the params dict, the
+    # transport and JSON decoding.
+    def __init__(self, content):
+        super(CannedAdapter, self).__init__()
+        self.content = content
+
+    def send(self, request, **kwargs):
+        resp = requests.Response()
+        resp.status_code = 200
+        resp._content = self.content
+        resp._content_consumed = True
+        resp.request = request
+        resp.url = request.url
+        return resp
+
+    def close(self):
+        pass
+
+def _client(adapter, **transport_options):
+    transport = Transport(**transport_options)
+    transport.mount('https://', adapter)
+    return TrelloApi('0' * 32, '0' * 64, transport=transport)
+
+def _best_of(repeat, func):
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def bench_call_overhead(quick):
+    number = 2000 if quick else 20000
+    card = json.dumps({'id': '5a' * 12, 'name': 'Card', 'idList': '5b' * 12, 'idMembers': [], 'closed': False}).encode()
+    api = _client(CannedAdapter(card))
+    cases = {
+        'cards.get': lambda: api.cards.get('5a' * 12),
+        'cards.get+params': lambda: api.cards.get('5a' * 12, fields='name,idList', members='true', checklists='all'),
+        'boards.get_card_idCard': lambda: api.boards.get_card_idCard('5a' * 12, '5c' * 12),
+        'cards.update': lambda: api.cards.update('5a' * 12, name='New name', closed='false'),
+    }
+    results = {}
+    for name, call in cases.items():
+        def run():
+            for _ in range(number):
+                call()
+        results[name] = {'us_per_call': _best_of(3, run) / number * 1e6}
+    return results
+
+def bench_import_time(quick):
+    code = 'import time; t = time.perf_counter(); import trello; print(time.perf_counter() - t)'
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    samples = []
+    for _ in range(3 if quick else 10):
+        out = subprocess.check_output([sys.executable, '-c', code], cwd=root)
+        samples.append(float(out))
+    return {'import trello': {'ms': min(samples) * 1e3}}
+
+def bench_throughput(quick, concurrencies=(1, 8, 64), latency=0.02):
+    fake = FakeTrello(latency=latency, seed=1)
+    board = fake.seed_board(cards=200, lists=4)
+    card_ids = [card['id'] for card in fake._child_objects('cards', 'idBoard', board['id'])]
+    calls = 100 if quick else 400
+    results = {}
+    with FakeTrelloServer(fake) as server:
+        for concurrency in concurrencies:
+            api = TrelloApi('0' * 32, '0' * 64, transport=Transport(server.url, pool_maxsize=max(concurrency, 10)))
+            ids = (card_ids * (calls // len(card_ids) + 1))[:calls]
+            started = time.perf_counter()
+            for _ in api.map(api.cards.get, ids, concurrency=concurrency):
+                pass
+            elapsed = time.perf_counter() - started
+            api._transport.close()
+            results['cards.get x{}'.format(concurrency)] = {'calls_per_second': calls / elapsed}
+    return results
+
+def bench_board_memory(quick):
+    sizes = (1000, 10000) if quick else (1000, 10000, 100000)
+    results = {}
+    for size in sizes:
+        fake = FakeTrello(seed=1)
+        board = fake.seed_board(cards=size, lists=8, members=8, labels=6)
+        raw = fake.handle('GET', '/1/boards/{}/cards'.format(board['id']), {})[2]
+        payload = json.dumps(raw).encode()
+        del raw
+        api = _client(CannedAdapter(payload))
+        tracemalloc.start()
+        started = time.perf_counter()
+        cards = api.boards.get_card(board['id'])
+        elapsed = time.perf_counter() - started
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        results['boards.get_card {}'.format(size)] = {
+            'peak_mb': peak / 1e6,
+            'retained_mb': current / 1e6,
+            'payload_mb': len(payload) / 1e6,
+            'decode_ms': elapsed * 1e3,
+        }
+        del cards
+    return results
+
+def _client_sockets(port):
+    # Established client-side TCP connections to port, from /proc (Linux).
+    count = 0
+    for table in ('/proc/net/tcp', '/proc/net/tcp6'):
+        try:
+            with open(table) as fd:
+                next(fd)
+                for line in fd:
+                    fields = line.split()
+                    if int(fields[2].rsplit(':', 1)[1], 16) == port and fields[3] == '01':
+                        count += 1
+        except (IOError, OSError):
+            return None
+    return count
+
+def bench_http2(quick, concurrency=64, latency=0.02):
+    # Socket count and throughput of a 64-way fan-out over HTTP/1.1 and
+    # HTTP/2 against the same server. Needs httpx[http2], hypercorn and the
+    # openssl command.
+    try:
+        import hypercorn  # noqa: F401
+    except ImportError:
+        sys.stderr.write('skipping http2: requires hypercorn\n')
+        return {}
+    if not http2_available():
+        sys.stderr.write('skipping http2: requires httpx[http2]\n')
+        return {}
+    fake = FakeTrello(latency=latency, seed=1)
+    board = fake.seed_board(cards=200, lists=4)
+    card_ids = [card['id'] for card in fake._child_objects('cards', 'idBoard', board['id'])]
+    calls = 400 if quick else 2000
+    ids = (card_ids * (calls // len(card_ids) + 1))[:calls]
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        certfile, keyfile = self_signed_cert(directory)
+        with H2Server(fake, certfile, keyfile) as server:
+            for label, http2 in (('http/1.1', False), ('h2', True)):
+                transport = Transport(server.url, pool_maxsize=concurrency, http2=http2)
+                # REQUESTS_CA_BUNDLE and friends would override verify.
+                transport.session.trust_env = False
+                transport.session.verify = certfile
+                api = TrelloApi('0' * 32, '0' * 64, transport=transport)
+                list(api.map(api.cards.get, ids[:concurrency], concurrency=concurrency))
+                started = time.perf_counter()
+                for _ in api.map(api.cards.get, ids, concurrency=concurrency):
+                    pass
+                elapsed = time.perf_counter() - started
+                results['cards.get x{} {}'.format(concurrency, label)] = {
+                    'calls_per_second': calls / elapsed,
+                    'sockets': _client_sockets(server.port),
+                }
+                transport.close()
+    return results
+
+BENCHMARKS = {
+    'call_overhead': bench_call_overhead,
+    'import_time': bench_import_time,
+    'throughput': bench_throughput,
+    'board_memory': bench_board_memory,
+    'http2': bench_http2,
+}
+
+def run(args):
+    names = args.only or list(BENCHMARKS)
+    results = {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'quick': args.quick,
+            'time': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        },
+        'results': {},
+    }
+    for name in names:
+        sys.stderr.write('running {}...\n'.format(name))
+        results['results'][name] = BENCHMARKS[name](args.quick)
+    text = json.dumps(results, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, 'w') as fd:
+            fd.write(text + '\n')
+    print(text)
+
+def compare(args):
+    with open(args.baseline) as fd:
+        baseline = json.load(fd)['results']
+    with open(args.candidate) as fd:
+        candidate = json.load(fd)['results']
+    regressions = 0
+    print('{:<45} {:>12} {:>12} {:>8}'.format('metric', 'baseline', 'candidate', 'change'))
+    for group in sorted(set(baseline) & set(candidate)):
+        for case in sorted(set(baseline[group]) & set(candidate[group])):
+            for metric in sorted(set(baseline[group][case]) & set(candidate[group][case])):
+                old, new = baseline[group][case][metric], candidate[group][case][metric]
+                if old is None or new is None:
+                    # Not measured on that run (e.g. no /proc to count sockets).
+                    continue
+                change = (new - old) / old if old else 0.0
+                worse = -change if metric in HIGHER_IS_BETTER else change
+                flag = ''
+                if worse > args.threshold:
+                    flag = '  REGRESSION'
+                    regressions += 1
+                print('{:<45} {:>12.3f} {:>12.3f} {:>+7.1%}{}'.format('{} {} {}'.format(group, case, metric)[:45], old, new, change, flag))
+    if regressions:
+        print('{} regression(s) above {:.0%}'.format(regressions, args.threshold))
+        return 1
+    return 0
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest='command')
+    run_parser = commands.add_parser('run', help='run the benchmarks')
+    run_parser.add_argument('-o', '--output', help='write the JSON results here')
+    run_parser.add_argument('--quick', action='store_true', help='fewer iterations and smaller boards')
+    run_parser.add_argument('--only', action='append', choices=sorted(BENCHMARKS), help='run only this benchmark (repeatable)')
+    compare_parser = commands.add_parser('compare', help='compare two result files')
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('candidate')
+    compare_parser.add_argument('--threshold', type=float, default=0.1, help='relative change counted as a regression (default 0.1)')
+    args = parser.parse_args()
+    if args.command == 'run':
+        run(args)
+    elif args.command == 'compare':
+        sys.exit(compare(args))
+    else:
+        parser.print_help()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,32 @@
+import pytest
+
+from trello import TrelloApi, Transport
+from tests.fakeserver import FakeTrello, FakeTrelloAdapter, FakeTrelloServer
+
+
+@pytest.fixture
+def fake():
+    return FakeTrello(seed=1)
+
+
+@pytest.fixture
+def connect(fake):
+    # Returns a client whose requests are answered in-process by fake (or
+    # by adapter), through a Transport made with the given options.
+    def connect(adapter=None, **options):
+        transport = Transport(**options)
+        transport.mount('https://', adapter if adapter is not None else FakeTrelloAdapter(fake))
+        return TrelloApi('key', 'token', transport=transport)
+    return connect
+
+
+@pytest.fixture
+def api(connect):
+    return connect()
+
+
+@pytest.fixture
+def server(fake):
+    # fake served over HTTP, for code that runs in other processes.
+    with FakeTrelloServer(fake) as server:
+        yield server
@@ -0,0 +1,977 @@
+import asyncio
+import email.parser
+import itertools
+import json
+import os
+import random
+import socket
+import subprocess
+import threading
+import time
+import zlib
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+CARD_FILTERS = ('all', 'open', 'closed', 'visible', 'none')
+ACTIONS_DEFAULT_LIMIT = 50
+ACTIONS_MAX_LIMIT = 1000
+LABEL_COLORS = ('green', 'yellow', 'orange', 'red', 'purple', 'blue', 'sky', 'lime', 'pink', 'black')
+
+# Which fields of each kind of object link it to a parent, so children can be
+# listed without scanning the whole collection.
+PARENT_FIELDS = {
+    'boards': ('idOrganization',),
+    'lists': ('idBoard',),
+    'cards': ('idBoard', 'idList'),
+    'checklists': ('idBoard', 'idCard'),
+    'labels': ('idBoard',),
+    'notifications': ('idMember',),
+    'webhooks': ('idModel',),
+}
+
+class FakeTrelloError(Exception):
+    def __init__(self, status, message):
+        super(FakeTrelloError, self).__init__(message)
+        self.status = status
+
+class FakeTrello(object):
+    """An in-memory model of the Trello REST API behind the ``/1/...`` routes.
+
+    Keeps boards, lists, cards, checklists, labels, members, organizations,
+    actions, notifications and webhooks, records actions for changes the way
+    Trello does, and answers ``/1/batch``. ``latency`` (plus or minus
+    ``jitter``) is added to every request; ``rate_limit=(requests, seconds)``
+    answers 429 once a token exceeds its quota, and ``error_rate`` fails that
+    share of requests with ``error_status``. :meth:`fail` injects failures
+    for particular endpoints.
+
+    Serve it over HTTP with :class:`FakeTrelloServer`, or in-process (no
+    sockets) with :class:`FakeTrelloAdapter`.
+    """
+
+    def __init__(self, latency=0.0, jitter=0.0, rate_limit=None, error_rate=0.0, error_status=500, seed=None):
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_limit = rate_limit
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.base_url = 'https://trello.com'
+        self.requests = 0
+        self._random = random.Random(seed)
+        self._ids = itertools.count(1)
+        self._objects = defaultdict(dict)
+        # parent -> {child id: None}; dicts keep insertion order and make
+        # moving a card between lists O(1).
+        self._children = defaultdict(lambda: defaultdict(dict))
+        self._actions = []
+        self._unsorted = False
+        self._actions_by = defaultdict(lambda: defaultdict(list))
+        self._files = {}
+        self._failures = []
+        self._windows = defaultdict(deque)
+        self._lock = threading.RLock()
+        self.me = self.add_member('me', full_name='Fake Member')
+
+    # -- seeding ---------------------------------------------------------
+
+    def new_id(self, when=None):
+        # Trello ids start with the creation time, so they sort by age.
+        seconds = int(when if when is not None else time.time())
+        return '{:08x}{:016x}'.format(seconds, next(self._ids))
+
+    def add_member(self, username, full_name=None):
+        member = {'id': self.new_id(), 'username': username, 'fullName': full_name or username, 'initials': username[:2].upper(), 'idBoards': [], 'idOrganizations': []}
+        self._insert('members', member)
+        return member
+
+    def add_organization(self, name, display_name=None):
+        org = {'id': self.new_id(), 'name': name, 'displayName': display_name or name, 'desc': '', 'idBoards': [], 'idMembers': [self.me['id']]}
+        self._insert('organizations', org)
+        self.me['idOrganizations'].append(org['id'])
+        return org
+
+    def seed_board(self, name='Board', cards=1000, lists=5, members=5, labels=6, checklists_per_card=0, check_items=3, moves_per_card=0, history_days=365, idOrganization=None):
+        """Creates a board with ``cards`` cards spread over ``lists`` lists.
+
+        Every card gets a ``createCard`` action and ``moves_per_card``
+        ``updateCard`` list moves, spread over the last ``history_days``
+        days, so action histories look like real ones. Seeding 100k cards
+        with one move each takes several seconds.
+        """
+        with self._lock:
+            now = time.time()
+            start = now - history_days * 86400
+            board = self._new_board(name, idOrganization, when=start)
+            member_ids = [self.me['id']] + [self.add_member('{}-member{}'.format(board['id'][-6:], i))['id'] for i in range(members - 1)]
+            for member_id in member_ids:
+                self._member_join(board, member_id)
+            label_ids = [self._new_label(board['id'], 'label {}'.format(i), LABEL_COLORS[i % len(LABEL_COLORS)])['id'] for i in range(labels)]
+            list_ids = [self._new_list(board['id'], 'List {}'.format(i), pos=(i + 1) * 16384, when=start)['id'] for i in range(lists)]
+            rand = self._random
+            for i in range(cards):
+                created = start + rand.random() * (now - start) * 0.9
+                first_list = list_ids[0] if moves_per_card else rand.choice(list_ids)
+                card = self._new_card(first_list, 'Card {}'.format(i), pos=(i + 1) * 16384, when=created, member=rand.choice(member_ids))
+                if member_ids:
+                    card['idMembers'] = rand.sample(member_ids, min(len(member_ids), rand.randint(0, 2)))
+                if label_ids:
+                    card['idLabels'] = rand.sample(label_ids, min(len(label_ids), rand.randint(0, 2)))
+                when = created
+                for _ in range(moves_per_card):
+                    when += rand.random() * (now - when) / 2
+                    self._update_card(card, {'idList': rand.choice(list_ids)}, when=when, member=rand.choice(member_ids))
+                for c in range(checklists_per_card):
+                    checklist = self._new_checklist(card['id'], 'Checklist {}'.format(c))
+                    for n in range(check_items):
+                        self._new_check_item(checklist, 'Item {}'.format(n), state=rand.choice(('complete', 'incomplete')))
+            return board
+
+    # -- request handling ------------------------------------------------
+
+    def fail(self, prefix, status=503, count=None, method=None, delay=0.0):
+        """Fails requests whose path starts with ``prefix`` (e.g.
+        ``'/1/search'``) with ``status``, ``count`` times or until
+        :meth:`clear_failures`; ``delay`` seconds are added first."""
+        with self._lock:
+            self._failures.append([prefix, status, count, method, delay])
+
+    def clear_failures(self):
+        with self._lock:
+            del self._failures[:]
+
+    def handle(self, method, path, params):
+        """Returns ``(status, headers, body)`` for one request; ``body`` is a
+        JSON-serializable value, or bytes for attachment files."""
+        method = method.upper()
+        with self._lock:
+            self.requests += 1
+            injected = self._injected_failure(method, path, params.get('token'))
+        delay = self.latency + (self._random.uniform(-self.jitter, self.jitter) if self.jitter else 0.0)
+        if injected is not None:
+            delay += injected[2]
+        if delay > 0:
+            time.sleep(delay)
+        if injected is not None:
+            status, headers = injected[0], injected[1]
+            return status, headers, {'message': 'injected failure', 'error': 'ERROR'} if status != 429 else {'message': 'API_TOKEN_LIMIT_EXCEEDED', 'error': 'API_TOKEN_LIMIT_EXCEEDED'}
+        if path.startswith('/files/'):
+            return self._serve_file(path[len('/files/'):], params)
+        try:
+            with self._lock:
+                return 200, {'Content-Type': 'application/json; charset=utf-8'}, self._route(method, path, params)
+        except FakeTrelloError as error:
+            return error.status, {'Content-Type': 'text/plain; charset=utf-8'}, str(error)
+
+    def _injected_failure(self, method, path, token):
+        for failure in self._failures:
+            prefix, status, count, only, delay = failure
+            if path.startswith(prefix) and (only is None or only.upper() == method):
+                if count is not None:
+                    if count <= 0:
+                        continue
+                    failure[2] -= 1
+                return status, {}, delay
+        if self.rate_limit is not None:
+            limit, per = self.rate_limit
+            window = self._windows[token]
+            now = time.monotonic()
+            while window and window[0] <= now - per:
+                window.popleft()
+            if len(window) >= limit:
+                return 429, {'Retry-After': '{:.3f}'.format(window[0] + per - now)}, 0.0
+            window.append(now)
+        if self.error_rate and self._random.random() < self.error_rate:
+            return self.error_status, {}, 0.0
+        return None
+
+    def _serve_file(self, attachment_id, params):
+        content = self._files.get(attachment_id)
+        if content is None:
+            return 404, {}, 'file not found'
+        etag = '"{:08x}"'.format(zlib.crc32(content))
+        rng = params.get('__range__')
+        if rng and params.get('__if_range__', etag) == etag:
+            start = int(rng.split('=', 1)[1].split('-', 1)[0])
+            if start >= len(content):
+                return 416, {'Content-Range': 'bytes */{}'.format(len(content))}, ''
+            return 206, {'Content-Range': 'bytes {}-{}/{}'.format(start, len(content) - 1, len(content)), 'ETag': etag}, content[start:]
+        return 200, {'Content-Type': 'application/octet-stream', 'ETag': etag}, content
+
+    def _route(self, method, path, params):
+        parts = [part for part in path.split('/') if part]
+        if len(parts) < 2 or parts[0] != '1':
+            raise FakeTrelloError(404, 'Cannot {} {}'.format(method, path))
+        kind, rest = parts[1], parts[2:]
+        if kind == 'batch' and method == 'GET':
+            return self._batch(params)
+        if kind == 'search':
+            return self._search(rest, params)
+        if kind not in ('actions', 'boards', 'cards', 'checklists', 'labels', 'lists', 'members', 'notifications', 'organizations', 'webhooks', 'tokens'):
+            raise FakeTrelloError(404, 'Cannot {} {}'.format(method, path))
+        if not rest:
+            if method == 'POST':
+                return self._create(kind, params)
+            raise FakeTrelloError(404, 'Cannot {} {}'.format(method, path))
+        if kind == 'notifications' and rest == ['all', 'read'] and method == 'POST':
+            return self._mark_all_read(params)
+        obj = self._lookup(kind, rest[0])
+        sub = rest[1:]
+        if method == 'GET':
+            return self._get(kind, obj, sub, params)
+        if method == 'PUT':
+            return self._put(kind, obj, sub, params)
+        if method == 'POST':
+            return self._post(kind, obj, sub, params)
+        if method == 'DELETE':
+            return self._delete(kind, obj, sub, params)
+        raise FakeTrelloError(405, 'Method not allowed')
+
+    # -- reads -----------------------------------------------------------
+
+    def _get(self, kind, obj, sub, params):
+        if not sub:
+            return self._expand(kind, obj, params, '')
+        name = sub[0]
+        if kind == 'boards' and name == 'cards':
+            if len(sub) > 1 and sub[1] not in CARD_FILTERS:
+                return self._expand('cards', self._lookup('cards', sub[1]), params, '')
+            return self._cards(self._child_objects('cards', 'idBoard', obj['id']), sub[1] if len(sub) > 1 else params.get('filter', 'visible'), params, '')
+        if kind == 'lists' and name == 'cards':
+            return self._cards(self._child_objects('cards', 'idList', obj['id']), params.get('filter', 'open'), params, '')
+        if kind == 'boards' and name == 'lists':
+            if len(sub) > 1 and sub[1] not in CARD_FILTERS:
+                return self._expand('lists', self._lookup('lists', sub[1]), params, '')
+            lists = _filtered(self._child_objects('lists', 'idBoard', obj['id']), sub[1] if len(sub) > 1 else params.get('filter', 'open'))
+            return [self._expand('lists', item, params, '') for item in lists]
+        if kind in ('boards', 'cards', 'lists', 'members') and name == 'actions':
+            return self._action_page(kind, obj['id'], params, '')
+        if kind in ('boards', 'cards') and name == 'checklists':
+            parent = 'idBoard' if kind == 'boards' else 'idCard'
+            return [self._expand('checklists', item, params, '') for item in self._child_objects('checklists', parent, obj['id'])]
+        if kind == 'boards' and name == 'labels':
+            return [_fields(item, params.get('fields')) for item in self._child_objects('labels', 'idBoard', obj['id'])]
+        if kind in ('boards', 'cards', 'organizations') and name == 'members':
+            if len(sub) > 1:
+                return _fields(self._lookup('members', sub[1]), params.get('fields'))
+            return [_fields(self._objects['members'][member_id], params.get('fields')) for member_id in obj.get('idMembers', [])]
+        if kind == 'cards' and name == 'labels':
+            return [self._objects['labels'][label_id] for label_id in obj['idLabels'] if label_id in self._objects['labels']]
+        if kind == 'cards' and name == 'attachments':
+            if len(sub) > 1:
+                return _fields(_find(obj['attachments'], sub[1]), params.get('fields'))
+            return [_fields(attachment, params.get('fields')) for attachment in obj['attachments']]
+        if kind in ('cards', 'lists', 'checklists', 'labels') and name in ('board', 'list'):
+            parent = self._objects[name + 's'][obj['id' + name.title()]]
+            return self._field(parent, sub[1]) if len(sub) > 1 else _fields(parent, params.get('fields'))
+        if kind == 'checklists' and name == 'checkItems':
+            return _find(obj['checkItems'], sub[1]) if len(sub) > 1 else obj['checkItems']
+        if kind == 'checklists' and name == 'cards':
+            return [self._objects['cards'][obj['idCard']]]
+        if kind == 'members' and name == 'boards':
+            boards = [self._objects['boards'][board_id] for board_id in obj['idBoards']]
+            return [self._expand('boards', board, params, '') for board in _filtered(boards, params.get('filter', 'all'))]
+        if kind == 'members' and name == 'cards':
+            cards = [card for card in self._objects['cards'].values() if obj['id'] in card['idMembers']]
+            return self._cards(cards, params.get('filter', 'visible'), params, '')
+        if kind == 'members' and name == 'organizations':
+            return [_fields(self._objects['organizations'][org_id], params.get('fields')) for org_id in obj['idOrganizations']]
+        if kind == 'members' and name == 'notifications':
+            return self._notifications(obj, params)
+        if kind == 'organizations' and name == 'boards':
+            boards = self._child_objects('boards', 'idOrganization', obj['id'])
+            return [self._expand('boards', board, params, '') for board in _filtered(boards, params.get('filter', 'all'))]
+        if len(sub) == 1:
+            return self._field(obj, name)
+        raise FakeTrelloError(404, 'Cannot GET /1/{}/{}/{}'.format(kind, obj['id'], '/'.join(sub)))
+
+    def _expand(self, kind, obj, params, prefix):
+        # Applies the nested-resource parameters Trello supports. Nested
+        # objects read theirs with a prefix: a board's cards=open reads
+        # card_fields, card_members, card_checklists...
+        get = lambda name: params.get(prefix + name)
+        result = _fields(obj, get('fields'))
+        members = self._objects['members']
+        if kind == 'boards':
+            if get('cards') not in (None, 'none'):
+                result['cards'] = [self._expand('cards', card, params, prefix + 'card_') for card in _filtered(self._child_objects('cards', 'idBoard', obj['id']), get('cards'))]
+            if get('lists') not in (None, 'none'):
+                result['lists'] = [self._expand('lists', item, params, prefix + 'list_') for item in _filtered(self._child_objects('lists', 'idBoard', obj['id']), get('lists'))]
+            if get('checklists') not in (None, 'none'):
+                result['checklists'] = [self._expand('checklists', item, params, prefix + 'checklist_') for item in self._child_objects('checklists', 'idBoard', obj['id'])]
+            if get('labels') not in (None, 'none'):
+                result['labels'] = [_fields(item, get('label_fields')) for item in self._child_objects('labels', 'idBoard', obj['id'])]
+            if get('members') not in (None, 'none'):
+                result['members'] = [_fields(members[member_id], get('member_fields')) for member_id in obj['idMembers']]
+            if get('actions') not in (None, 'none'):
+                result['actions'] = self._action_page('boards', obj['id'], {'filter': get('actions'), 'limit': get('actions_limit')}, '')
+        elif kind == 'cards':
+            if _truthy(get('members')):
+                result['members'] = [_fields(members[member_id], get('member_fields')) for member_id in obj['idMembers'] if member_id in members]
+            if get('checklists') not in (None, 'none', 'false'):
+                result['checklists'] = [self._expand('checklists', item, params, prefix + 'checklist_') for item in self._child_objects('checklists', 'idCard', obj['id'])]
+            if _truthy(get('attachments')):
+                result['attachments'] = [_fields(attachment, get('attachment_fields')) for attachment in obj['attachments']]
+            if _truthy(get('board')):
+                result['board'] = _fields(self._objects['boards'][obj['idBoard']], get('board_fields'))
+            if _truthy(get('list')):
+                result['list'] = _fields(self._objects['lists'][obj['idList']], get('list_fields'))
+            if get('actions') not in (None, 'none'):
+                result['actions'] = self._action_page('cards', obj['id'], {'filter': get('actions'), 'limit': get('actions_limit')}, '')
+        elif kind == 'lists':
+            if get('cards') not in (None, 'none'):
+                result['cards'] = [self._expand('cards', card, params, prefix + 'card_') for card in _filtered(self._child_objects('cards', 'idList', obj['id']), get('cards'))]
+        elif kind == 'organizations':
+            if get('boards') not in (None, 'none'):
+                result['boards'] = [self._expand('boards', board, params, prefix + 'board_') for board in _filtered(self._child_objects('boards', 'idOrganization', obj['id']), get('boards'))]
+            if get('members') not in (None, 'none'):
+                result['members'] = [_fields(members[member_id], get('member_fields')) for member_id in obj['idMembers']]
+        elif kind == 'members':
+            if get('boards') not in (None, 'none'):
+                boards = [self._objects['boards'][board_id] for board_id in obj['idBoards']]
+                result['boards'] = [self._expand('boards', board, params, prefix + 'board_') for board in _filtered(boards, get('boards'))]
+        return result
+
+    def _cards(self, cards, card_filter, params, prefix):
+        cards = _filtered(cards, card_filter)
+        limit = params.get('limit')
+        if limit:
+            cards = cards[:int(limit)]
+        return [self._expand('cards', card, params, prefix) for card in cards]
+
+    def _field(self, obj, name):
+        if name not in obj:
+            raise FakeTrelloError(404, 'invalid field')
+        return {'_value': obj[name]}
+
+    def _sort_actions(self):
+        if self._unsorted:
+            key = lambda action: action['id']
+            self._actions.sort(key=key)
+            for index in self._actions_by.values():
+                for actions in index.values():
+                    actions.sort(key=key)
+            self._unsorted = False
+
+    def _action_page(self, kind, model_id, params, prefix):
+        self._sort_actions()
+        actions = self._actions_by[kind][model_id] if kind != 'members' else [action for action in self._actions if action['idMemberCreator'] == model_id]
+        types = params.get('filter')
+        if types and types not in ('all', 'true'):
+            actions = [action for action in actions if _action_matches(action, types.split(','))]
+        before, since = params.get('before'), params.get('since')
+        limit = min(int(params.get('limit') or ACTIONS_DEFAULT_LIMIT), ACTIONS_MAX_LIMIT)
+        page = int(params.get('page') or 0)
+        result = []
+        skip = page * limit
+        # Actions are kept oldest first; Trello returns newest first.
+        for action in reversed(actions):
+            if before and not _before(action, before):
+                continue
+            if since and not _before(since, action):
+                break
+            if skip:
+                skip -= 1
+                continue
+            result.append(action)
+            if len(result) >= limit:
+                break
+        return result
+
+    def _notifications(self, member, params):
+        notifications = self._child_objects('notifications', 'idMember', member['id'])
+        read_filter = params.get('read_filter', 'all')
+        if read_filter == 'unread':
+            notifications = [item for item in notifications if item['unread']]
+        elif read_filter == 'read':
+            notifications = [item for item in notifications if not item['unread']]
+        since, before = params.get('since'), params.get('before')
+        limit = int(params.get('limit') or 50)
+        result = []
+        for notification in reversed(notifications):
+            if before and notification['id'] >= before:
+                continue
+            if since and notification['id'] <= since:
+                break
+            result.append(notification)
+            if len(result) >= limit:
+                break
+        return result
+
+    def _batch(self, params):
+        urls = [url for url in params.get('urls', '').split(',') if url]
+        if len(urls) > 10:
+            raise FakeTrelloError(400, 'too many urls (max 10)')
+        results = []
+        for url in urls:
+            parts = urlsplit(url)
+            path = parts.path if parts.path.startswith('/1/') else '/1' + parts.path
+            sub_params = dict(parse_qsl(parts.query))
+            try:
+                results.append({'200': self._route('GET', path, sub_params)})
+            except FakeTrelloError as error:
+                results.append({'name': 'Error', 'message': str(error), 'statusCode': error.status})
+        return results
+
+    def _search(self, rest, params):
+        query = params.get('query', '').lower()
+        if rest == ['members']:
+            return [member for member in self._objects['members'].values() if query in member['username'].lower() or query in member['fullName'].lower()][:int(params.get('limit') or 8)]
+        limit = int(params.get('cards_limit') or 10)
+        cards = [card for card in self._objects['cards'].values() if query in card['name'].lower()][:limit]
+        boards = [board for board in self._objects['boards'].values() if query in board['name'].lower()][:int(params.get('boards_limit') or 10)]
+        return {'options': {'terms': [{'text': query}]}, 'cards': cards, 'boards': boards, 'members': [], 'organizations': []}
+
+    # -- writes ----------------------------------------------------------
+
+    def _create(self, kind, params):
+        if kind == 'boards':
+            return self._new_board(_required(params, 'name'), params.get('idOrganization'))
+        if kind == 'lists':
+            return self._new_list(self._lookup('boards', _required(params, 'idBoard'))['id'], _required(params, 'name'), pos=_position(params.get('pos')))
+        if kind == 'cards':
+            card = self._new_card(self._lookup('lists', _required(params, 'idList'))['id'], params.get('name', ''), desc=params.get('desc', ''), pos=_position(params.get('pos')))
+            for field in ('idMembers', 'idLabels'):
+                if params.get(field):
+                    card[field] = params[field].split(',')
+            return card
+        if kind == 'checklists':
+            return self._new_checklist(self._lookup('cards', _required(params, 'idCard'))['id'], params.get('name', 'Checklist'))
+        if kind == 'labels':
+            return self._new_label(self._lookup('boards', _required(params, 'idBoard'))['id'], params.get('name', ''), params.get('color'))
+        if kind == 'organizations':
+            return self.add_organization(params.get('name') or params.get('displayName'), params.get('displayName'))
+        if kind == 'webhooks':
+            webhook = {'id': self.new_id(), 'idModel': _required(params, 'idModel'), 'callbackURL': _required(params, 'callbackURL'), 'description': params.get('description', ''), 'active': True}
+            self._insert('webhooks', webhook)
+            return webhook
+        raise FakeTrelloError(404, 'Cannot POST /1/{}'.format(kind))
+
+    def _put(self, kind, obj, sub, params):
+        if sub:
+            if len(sub) == 1:
+                params = {sub[0]: params.get('value')}
+            elif kind == 'checklists' and sub[0] == 'checkItems':
+                item = _find(obj['checkItems'], sub[1])
+                item.update(_values(params, item))
+                return item
+            else:
+                raise FakeTrelloError(404, 'Cannot PUT')
+        if kind == 'cards':
+            return self._update_card(obj, _values(params, obj))
+        if kind == 'notifications' and 'unread' in params:
+            obj['unread'] = _truthy(params['unread'])
+            return obj
+        for field, value in _values(params, obj).items():
+            if field in PARENT_FIELDS.get(kind, ()):
+                self._reindex(kind, obj, field, value)
+            else:
+                obj[field] = value
+        return obj
+
+    def _post(self, kind, obj, sub, params):
+        name = sub[0] if sub else None
+        if kind == 'cards' and name == 'attachments':
+            attachment = {'id': self.new_id(), 'name': params.get('name') or params.get('__filename__') or params.get('url', 'attachment'), 'date': _iso(time.time()), 'isUpload': 'file' in params, 'mimeType': params.get('mimeType')}
+            if 'file' in params:
+                content = params['file'] if isinstance(params['file'], bytes) else params['file'].encode('utf-8')
+                self._files[attachment['id']] = content
+                attachment['bytes'] = len(content)
+                attachment['url'] = '{}/files/{}'.format(self.base_url, attachment['id'])
+            else:
+                attachment['bytes'] = None
+                attachment['url'] = params.get('url')
+            obj['attachments'].append(attachment)
+            return attachment
+        if kind == 'cards' and name in ('idMembers', 'idLabels'):
+            obj[name].append(_required(params, 'value'))
+            return obj[name]
+        if kind == 'cards' and name == 'labels':
+            label = self._new_label(obj['idBoard'], params.get('name', ''), _required(params, 'color'))
+            obj['idLabels'].append(label['id'])
+            return label
+        if kind == 'cards' and name == 'actions' and sub[1:] == ['comments']:
+            return self._record('commentCard', obj['idBoard'], card=obj, data={'text': params.get('text', '')})
+        if kind == 'cards' and name == 'checklists':
+            return self._new_checklist(obj['id'], params.get('name', 'Checklist'))
+        if kind == 'checklists' and name == 'checkItems':
+            return self._new_check_item(obj, _required(params, 'name'), state='complete' if _truthy(params.get('checked')) else 'incomplete')
+        if kind == 'boards' and name == 'lists':
+            return self._new_list(obj['id'], _required(params, 'name'), pos=_position(params.get('pos')))
+        if kind == 'boards' and name == 'labels':
+            return self._new_label(obj['id'], params.get('name', ''), params.get('color'))
+        if kind == 'lists' and name == 'cards':
+            return self._new_card(obj['id'], params.get('name', ''))
+        if kind == 'lists' and name == 'archiveAllCards':
+            for card in self._child_objects('cards', 'idList', obj['id']):
+                self._update_card(card, {'closed': True})
+            return {}
+        raise FakeTrelloError(404, 'Cannot POST /1/{}/{}/{}'.format(kind, obj['id'], '/'.join(sub)))
+
+    def _delete(self, kind, obj, sub, params):
+        if not sub:
+            self._remove(kind, obj)
+            return {'_value': None}
+        if kind == 'cards' and sub[0] in ('idMembers', 'idLabels') and len(sub) > 1:
+            if sub[1] in obj[sub[0]]:
+                obj[sub[0]].remove(sub[1])
+            return obj[sub[0]]
+        if kind == 'cards' and sub[0] == 'attachments' and len(sub) > 1:
+            obj['attachments'].remove(_find(obj['attachments'], sub[1]))
+            self._files.pop(sub[1], None)
+            return {'_value': None}
+        if kind == 'checklists' and sub[0] == 'checkItems' and len(sub) > 1:
+            obj['checkItems'].remove(_find(obj['checkItems'], sub[1]))
+            return {'_value': None}
+        raise FakeTrelloError(404, 'Cannot DELETE')
+
+    def _mark_all_read(self, params):
+        if params.get('ids'):
+            notifications = [self._lookup('notifications', id) for id in params['ids'].split(',')]
+        else:
+            notifications = self._child_objects('notifications', 'idMember', self._lookup('members', 'me')['id'])
+        for notification in notifications:
+            notification['unread'] = False
+        return {'_value': None}
+
+    def notify(self, member_id_or_username, type='commentCard', data=None, when=None):
+        """Adds an unread notification for a member."""
+        with self._lock:
+            member = self._lookup('members', member_id_or_username)
+            notification = {'id': self.new_id(when), 'type': type, 'date': _iso(when or time.time()), 'unread': True, 'idMember': member['id'], 'data': data or {}}
+            self._insert('notifications', notification)
+            return notification
+
+    # -- model helpers ---------------------------------------------------
+
+    def _new_board(self, name, idOrganization=None, when=None):
+        board_id = self.new_id(when)
+        board = {'id': board_id, 'name': name, 'desc': '', 'closed': False, 'idOrganization': idOrganization, 'idMembers': [],
+                 'shortLink': board_id[-8:], 'url': 'https://trello.com/b/{}/{}'.format(board_id[-8:], _slug(name)), 'prefs': {'permissionLevel': 'private'}}
+        self._insert('boards', board)
+        if idOrganization:
+            self._lookup('organizations', idOrganization)['idBoards'].append(board_id)
+        self._member_join(board, self.me['id'])
+        self._record('createBoard', board_id, when=when)
+        return board
+
+    def _member_join(self, board, member_id):
+        if member_id not in board['idMembers']:
+            board['idMembers'].append(member_id)
+            self._objects['members'][member_id]['idBoards'].append(board['id'])
+
+    def _new_list(self, board_id, name, pos=None, when=None):
+        item = {'id': self.new_id(when), 'name': name, 'closed': False, 'idBoard': board_id, 'pos': pos or 16384 * (len(self._children['lists', 'idBoard'][board_id]) + 1)}
+        self._insert('lists', item)
+        self._record('createList', board_id, data={'list': {'id': item['id'], 'name': name}}, when=when)
+        return item
+
+    def _new_card(self, list_id, name, desc='', pos=None, when=None, member=None):
+        board_id = self._objects['lists'][list_id]['idBoard']
+        card_id = self.new_id(when)
+        card = {'id': card_id, 'name': name, 'desc': desc, 'closed': False, 'idBoard': board_id, 'idList': list_id, 'idMembers': [], 'idLabels': [],
+                'pos': pos or 16384 * (len(self._children['cards', 'idList'][list_id]) + 1), 'due': None, 'dueComplete': False,
+                'dateLastActivity': _iso(when or time.time()), 'shortLink': card_id[-8:], 'idShort': len(self._children['cards', 'idBoard'][board_id]) + 1,
+                'url': 'https://trello.com/c/{}/{}'.format(card_id[-8:], _slug(name)), 'attachments': []}
+        self._insert('cards', card)
+        self._record('createCard', board_id, card=card, data={'list': self._list_ref(list_id)}, when=when, member=member)
+        return card
+
+    def _update_card(self, card, values, when=None, member=None):
+        old = dict((field, card.get(field)) for field in values if card.get(field) != values[field])
+        if not old:
+            return card
+        for field, value in values.items():
+            if field in ('idList', 'idBoard'):
+                self._reindex('cards', card, field, value)
+            else:
+                card[field] = value
+        card['dateLastActivity'] = _iso(when or time.time())
+        data = {'old': old}
+        if 'idList' in old:
+            data['listBefore'] = self._list_ref(old['idList'])
+            data['listAfter'] = self._list_ref(card['idList'])
+        self._record('updateCard', card['idBoard'], card=card, data=data, when=when, member=member)
+        return card
+
+    def _list_ref(self, list_id):
+        item = self._objects['lists'].get(list_id)
+        return {'id': list_id, 'name': item['name'] if item else None}
+
+    def _new_checklist(self, card_id, name):
+        card = self._objects['cards'][card_id]
+        checklist = {'id': self.new_id(), 'name': name, 'idBoard': card['idBoard'], 'idCard': card_id, 'pos': 16384, 'checkItems': []}
+        self._insert('checklists', checklist)
+        return checklist
+
+    def _new_check_item(self, checklist, name, state='incomplete'):
+        item = {'id': self.new_id(), 'name': name, 'state': state, 'idChecklist': checklist['id'], 'pos': 16384 * (len(checklist['checkItems']) + 1)}
+        checklist['checkItems'].append(item)
+        return item
+
+    def _new_label(self, board_id, name, color):
+        label = {'id': self.new_id(), 'idBoard': board_id, 'name': name, 'color': color}
+        self._insert('labels', label)
+        return label
+
+    def _record(self, type, board_id, card=None, data=None, when=None, member=None):
+        when = when or time.time()
+        board = self._objects['boards'][board_id]
+        data = dict(data or {})
+        data['board'] = {'id': board_id, 'name': board['name'], 'shortLink': board['shortLink']}
+        if card is not None:
+            data['card'] = {'id': card['id'], 'name': card['name'], 'idShort': card['idShort'], 'shortLink': card['shortLink']}
+            if 'idList' in card and 'list' not in data and 'listAfter' not in data:
+                data['list'] = self._list_ref(card['idList'])
+        action = {'id': self.new_id(when), 'idMemberCreator': member or self.me['id'], 'type': type, 'date': _iso(when), 'data': data}
+        self._objects['actions'][action['id']] = action
+        self._actions.append(action)
+        self._actions_by['boards'][board_id].append(action)
+        if card is not None:
+            self._actions_by['cards'][card['id']].append(action)
+        for key in ('list', 'listAfter', 'listBefore'):
+            if key in data:
+                self._actions_by['lists'][data[key]['id']].append(action)
+        if len(self._actions) > 1 and self._actions[-2]['id'] > action['id']:
+            # Seeding back-dates actions; the indexes are re-sorted the next
+            # time they are read.
+            self._unsorted = True
+        return action
+
+    def _insert(self, kind, obj):
+        self._objects[kind][obj['id']] = obj
+        for field in PARENT_FIELDS.get(kind, ()):
+            if obj.get(field):
+                self._children[kind, field][obj[field]][obj['id']] = None
+
+    def _reindex(self, kind, obj, field, value):
+        siblings = self._children[kind, field]
+        if obj.get(field):
+            siblings[obj[field]].pop(obj['id'], None)
+        obj[field] = value
+        if value:
+            siblings[value][obj['id']] = None
+
+    def _remove(self, kind, obj):
+        for field in PARENT_FIELDS.get(kind, ()):
+            if obj.get(field):
+                self._children[kind, field][obj[field]].pop(obj['id'], None)
+        del self._objects[kind][obj['id']]
+
+    def _child_objects(self, kind, field, parent_id):
+        objects = self._objects[kind]
+        return [objects[child_id] for child_id in self._children[kind, field].get(parent_id, ())]
+
+    def _lookup(self, kind, key):
+        objects = self._objects[kind]
+        obj = objects.get(key)
+        if obj is not None:
+            return obj
+        if kind == 'members':
+            if key == 'me':
+                return self.me
+            for member in objects.values():
+                if member['username'] == key:
+                    return member
+        elif kind in ('boards', 'cards'):
+            for item in objects.values():
+                if item['shortLink'] == key:
+                    return item
+        elif kind == 'organizations':
+            for org in objects.values():
+                if org['name'] == key:
+                    return org
+        raise FakeTrelloError(400 if len(key) != 24 else 404, 'invalid id' if len(key) != 24 else 'The requested resource was not found.')
+
+def _action_matches(action, filters):
+    # "updateCard" matches the type, "updateCard:idList" only updates that
+    # changed the card's list.
+    for name in filters:
+        kind, _, field = name.partition(':')
+        if action['type'] == kind and (not field or field in action['data'].get('old', ())):
+            return True
+    return False
+
+def _filtered(items, value):
+    if value in (None, 'all', 'true'):
+        return list(items)
+    if value == 'none':
+        return []
+    if value in ('open', 'visible'):
+        return [item for item in items if not item.get('closed')]
+    if value == 'closed':
+        return [item for item in items if item.get('closed')]
+    return list(items)
+
+def _fields(obj, fields):
+    if not fields or fields == 'all':
+        return dict((key, value) for key, value in obj.items() if key != 'attachments')
+    wanted = fields.split(',')
+    result = {'id': obj['id']}
+    for field in wanted:
+        if field in obj:
+            result[field] = obj[field]
+    return result
+
+def _values(params, obj):
+    values = {}
+    for field, value in params.items():
+        if field in ('key', 'token') or field.startswith('__'):
+            continue
+        current = obj.get(field)
+        if isinstance(current, bool) or value in ('true', 'false'):
+            value = _truthy(value)
+        elif isinstance(current, list):
+            value = value.split(',') if value else []
+        elif field == 'pos':
+            value = _position(value)
+        values[field] = value
+    return values
+
+def _find(items, item_id):
+    for item in items:
+        if item['id'] == item_id:
+            return item
+    raise FakeTrelloError(404, 'The requested resource was not found.')
+
+def _required(params, name):
+    if not params.get(name):
+        raise FakeTrelloError(400, 'invalid value for {}'.format(name))
+    return params[name]
+
+def _truthy(value):
+    return value in (True, 'true', 'True', '1', 'all', 'open')
+
+def _position(value):
+    if value in (None, '', 'bottom'):
+        return None
+    if value == 'top':
+        return 1
+    return float(value)
+
+def _before(a, b):
+    # Compares action ids or ISO dates the way Trello's before/since do.
+    a = a['id'] if isinstance(a, dict) else a
+    b = b['id'] if isinstance(b, dict) else b
+    if len(a) == 24 and len(b) == 24:
+        return a < b
+    return _timestamp(a) < _timestamp(b)
+
+def _timestamp(value):
+    if len(value) == 24 and 'T' not in value:
+        return int(value[:8], 16)
+    return datetime.strptime(value[:19], '%Y-%m-%dT%H:%M:%S').replace(tzinfo=timezone.utc).timestamp()
+
+def _iso(seconds):
+    return datetime.fromtimestamp(seconds, timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.') + '{:03d}Z'.format(int(seconds * 1000) % 1000)
+
+def _slug(name):
+    return '-'.join(''.join(c if c.isalnum() else ' ' for c in name.lower()).split())
+
+def parse_body(content_type, body):
+    # Form fields of a urlencoded or multipart request body; uploaded files
+    # come back as bytes, with the file name under '__filename__'.
+    if not body:
+        return {}
+    if isinstance(body, str):
+        body = body.encode('utf-8')
+    if content_type and content_type.startswith('multipart/form-data'):
+        message = email.parser.BytesParser().parsebytes(b'Content-Type: ' + content_type.encode() + b'\r\n\r\n' + body)
+        fields = {}
+        for part in message.get_payload():
+            name = part.get_param('name', header='content-disposition')
+            value = part.get_payload(decode=True)
+            if part.get_filename() is not None:
+                fields['__filename__'] = part.get_filename()
+                fields[name] = value
+            else:
+                fields[name] = value.decode('utf-8')
+        return fields
+    return dict(parse_qsl(body.decode('utf-8'), keep_blank_values=True))
+
+def _encode(body):
+    if isinstance(body, bytes):
+        return body
+    if isinstance(body, str):
+        return body.encode('utf-8')
+    return json.dumps(body, separators=(',', ':')).encode('utf-8')
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # Send headers and body in one segment; otherwise Nagle's algorithm and
+    # delayed ACKs add ~40ms to every keep-alive response.
+    disable_nagle_algorithm = True
+    wbufsize = -1
+
+    def log_message(self, *args):
+        pass
+
+    def _handle(self):
+        parts = urlsplit(self.path)
+        params = dict(parse_qsl(parts.query, keep_blank_values=True))
+        length = int(self.headers.get('Content-Length') or 0)
+        params.update(parse_body(self.headers.get('Content-Type'), self.rfile.read(length) if length else b''))
+        if self.headers.get('Range'):
+            params['__range__'] = self.headers['Range']
+        if self.headers.get('If-Range'):
+            params['__if_range__'] = self.headers['If-Range']
+        status, headers, body = self.server.fake.handle(self.command, parts.path, params)
+        content = _encode(body)
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    do_GET = do_PUT = do_POST = do_DELETE = _handle
+
+class FakeTrelloServer(object):
+    """Serves a :class:`FakeTrello` over HTTP on a background thread.
+
+        >>> with FakeTrelloServer(FakeTrello()) as server:
+        ...     api = TrelloApi('key', 'token', transport=Transport(server.url))
+    """
+
+    def __init__(self, fake=None, host='127.0.0.1', port=0):
+        self.fake = fake if fake is not None else FakeTrello()
+        self._server = ThreadingHTTPServer((host, port), _Handler)
+        self._server.daemon_threads = True
+        self._server.fake = self.fake
+        self.url = 'http://{}:{}'.format(*self._server.server_address[:2])
+        self.fake.base_url = self.url
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, name='fake-trello', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+class H2Server(object):
+    # Serves a FakeTrello over HTTPS with hypercorn, which offers HTTP/2 and
+    # HTTP/1.1 through ALPN, as a stand-in for api.trello.com.
+
+    def __init__(self, fake, certfile, keyfile):
+        from hypercorn.config import Config
+        self.fake = fake
+        self._executor = ThreadPoolExecutor(max_workers=256)
+        with socket.socket() as sock:
+            sock.bind(('127.0.0.1', 0))
+            self.port = sock.getsockname()[1]
+        self.config = Config()
+        self.config.bind = ['127.0.0.1:{}'.format(self.port)]
+        self.config.certfile = certfile
+        self.config.keyfile = keyfile
+        self.config.accesslog = self.config.errorlog = None
+        self.url = 'https://127.0.0.1:{}'.format(self.port)
+        fake.base_url = self.url
+
+    async def app(self, scope, receive, send):
+        if scope['type'] != 'http':
+            return
+        body = b''
+        while True:
+            message = await receive()
+            body += message.get('body', b'')
+            if not message.get('more_body'):
+                break
+        headers = dict((k.decode('latin-1'), v.decode('latin-1')) for k, v in scope['headers'])
+        params = dict(parse_qsl(scope['query_string'].decode(), keep_blank_values=True))
+        params.update(parse_body(headers.get('content-type'), body))
+        # FakeTrello sleeps to simulate latency, so keep it off the event loop.
+        loop = asyncio.get_running_loop()
+        status, extra, payload = await loop.run_in_executor(self._executor, self.fake.handle, scope['method'], scope['path'], params)
+        content = json.dumps(payload).encode() if not isinstance(payload, bytes) else payload
+        headers = {'content-type': 'application/json'}
+        headers.update((k.lower(), str(v)) for k, v in extra.items())
+        headers['content-length'] = str(len(content))
+        headers = [(k.encode(), v.encode()) for k, v in headers.items()]
+        await send({'type': 'http.response.start', 'status': status, 'headers': headers})
+        await send({'type': 'http.response.body', 'body': content})
+
+    def __enter__(self):
+        from hypercorn.asyncio import serve
+        self._loop = asyncio.new_event_loop()
+        self._stopped = asyncio.Event()
+        started = threading.Event()
+
+        def run():
+            asyncio.set_event_loop(self._loop)
+            self._loop.call_soon(started.set)
+            self._loop.run_until_complete(serve(self.app, self.config, shutdown_trigger=self._stopped.wait))
+
+        self._thread = threading.Thread(target=run, daemon=True)
+        self._thread.start()
+        started.wait()
+        for _ in range(100):
+            try:
+                socket.create_connection(('127.0.0.1', self.port)).close()
+                break
+            except OSError:
+                time.sleep(0.05)
+        return self
+
+    def __exit__(self, *exc_info):
+        self._loop.call_soon_threadsafe(self._stopped.set)
+        self._thread.join(5)
+        self._executor.shutdown(wait=False)
+
+def self_signed_cert(directory):
+    certfile, keyfile = os.path.join(directory, 'cert.pem'), os.path.join(directory, 'key.pem')
+    subprocess.check_call(
+        ['openssl', 'req', '-x509', '-newkey', 'rsa:2048', '-nodes', '-days', '1', '-subj', '/CN=127.0.0.1',
+         '-addext', 'subjectAltName=IP:127.0.0.1', '-keyout', keyfile, '-out', certfile],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return certfile, keyfile
+
+class FakeTrelloAdapter(BaseAdapter):
+    """A requests adapter answering from a :class:`FakeTrello` in-process.
+
+        >>> transport = Transport()
+        >>> transport.mount('https://', FakeTrelloAdapter(FakeTrello()))
+    """
+
+    def __init__(self, fake=None):
+        super(FakeTrelloAdapter, self).__init__()
+        self.fake = fake if fake is not None else FakeTrello()
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        parts = urlsplit(request.url)
+        params = dict(parse_qsl(parts.query, keep_blank_values=True))
+        body = request.body
+        if body is not None and not isinstance(body, (bytes, str)):
+            body = body.read()
+        params.update(parse_body(request.headers.get('Content-Type'), body))
+        if request.headers.get('Range'):
+            params['__range__'] = request.headers['Range']
+        if request.headers.get('If-Range'):
+            params['__if_range__'] = request.headers['If-Range']
+        status, headers, payload = self.fake.handle(request.method, parts.path, params)
+        resp = requests.Response()
+        resp.status_code = status
+        resp.headers = CaseInsensitiveDict(headers)
+        resp._content = _encode(payload)
+        resp._content_consumed = True
+        resp.encoding = 'utf-8'
+        resp.url = request.url
+        resp.request = request
+        return resp
+
+    def close(self):
+        pass
@@ -0,0 +1,140 @@
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from trello.analytics import ActionHistory, CumulativeFlow
+
+
+@pytest.fixture
+def actions(fake, api):
+    # A board whose cards move around and a third of which end up archived.
+    board = fake.seed_board(cards=60, lists=4, moves_per_card=3)
+    for card in fake._child_objects('cards', 'idBoard', board['id'])[::3]:
+        last = fake._actions_by['cards'][card['id']][-1]
+        fake._update_card(card, {'closed': True}, when=int(last['id'][:8], 16) + 3600)
+    return api.boards.get_action(board['id'], limit=1000)
+
+
+def _events(actions):
+    # {card id: [(time, kind, list id)]} in order, replayed the slow way.
+    events = {}
+    for action in sorted(actions, key=lambda action: (int(action['id'][:8], 16), int(action['id'][-6:], 16))):
+        data = action['data']
+        if 'card' not in data:
+            continue
+        if action['type'] == 'createCard':
+            event = ('created', data['list']['id'])
+        elif action['type'] == 'updateCard' and 'listAfter' in data:
+            event = ('moved', data['listAfter']['id'])
+        elif action['type'] == 'updateCard' and data['old'].get('closed') is False:
+            event = ('left', None)
+        else:
+            continue
+        events.setdefault(data['card']['id'], []).append((int(action['id'][:8], 16),) + event)
+    return events
+
+
+def _first(events, test):
+    return next((time for time, kind, list_id in events if test(kind, list_id)), float('nan'))
+
+
+@pytest.mark.parametrize('done_lists, start_lists', [((), ()), (['List 3'], ['List 1', 'List 2'])])
+def test_card_times_match_a_replay(actions, done_lists, start_lists):
+    history = ActionHistory(done_lists=done_lists, start_lists=start_lists)
+    history.add_actions(actions)
+    names = history.list_names
+    events = _events(actions)
+    expected = dict((name, []) for name in ('created', 'started', 'done'))
+    for card_id in history.cards.ids:
+        card = events[card_id]
+        if done_lists:
+            done = _first(card, lambda kind, list_id: names.get(list_id) in done_lists)
+        else:
+            done = _first(card, lambda kind, list_id: kind == 'left')
+        if start_lists:
+            started = _first(card, lambda kind, list_id: names.get(list_id) in start_lists)
+        else:
+            started = _first(card, lambda kind, list_id: kind == 'moved')
+        if np.isnan(started):
+            started = done
+        expected['created'].append(card[0][0])
+        expected['started'].append(started)
+        expected['done'].append(done)
+    times = history.card_times()
+    for name, values in expected.items():
+        np.testing.assert_equal(times[name], values)
+    leads = np.array(expected['done']) - np.array(expected['created'])
+    leads = leads[~np.isnan(leads)]
+    assert len(leads)
+    stats = history.lead_times()['all']
+    assert stats['count'] == len(leads)
+    assert stats['mean'] == pytest.approx(leads.mean())
+    for q in (50, 85, 95):
+        assert stats['p{}'.format(q)] == pytest.approx(np.percentile(leads, q))
+
+
+def test_time_in_list_matches_a_replay(actions):
+    history = ActionHistory()
+    history.add_actions(actions)
+    visits = {}
+    for card in _events(actions).values():
+        for (start, _, list_id), (end, _, _) in zip(card, card[1:]):
+            if list_id is not None:
+                visits.setdefault(list_id, []).append(end - start)
+    stats = history.time_in_list()
+    assert set(stats) == set(visits)
+    for list_id, seconds in visits.items():
+        assert stats[list_id]['count'] == len(seconds)
+        assert stats[list_id]['mean'] == pytest.approx(np.mean(seconds))
+
+
+def _flow(actions, utc_offset, days):
+    # {list id: [cards on it at the end of every day]}, replayed card by card.
+    counts = {}
+    for card in _events(actions).values():
+        for day_index, day in enumerate(days):
+            on = [list_id for time, _, list_id in card if (time + utc_offset) // 86400 <= day]
+            if on and on[-1] is not None:
+                counts.setdefault(on[-1], [0] * len(days))[day_index] += 1
+    return counts
+
+
+def _check_flow(flow, actions):
+    days, list_ids, matrix = flow.counts()
+    numbers = days.astype(np.int64).tolist()
+    assert numbers == list(range(numbers[0], numbers[-1] + 1))
+    expected = _flow(actions, flow.utc_offset, numbers)
+    assert set(expected) <= set(list_ids)
+    for column, list_id in enumerate(list_ids):
+        assert matrix[:, column].tolist() == expected.get(list_id, [0] * len(numbers))
+
+
+def test_cumulative_flow_matches_a_replay(actions):
+    flow = CumulativeFlow(utc_offset=-5 * 3600)
+    flow.update(actions)
+    _check_flow(flow, actions)
+    days, counts = flow.wip(['List 1', 'List 2'])
+    _, list_ids, matrix = flow.counts(lists=['List 1', 'List 2'])
+    assert counts.tolist() == matrix.sum(axis=1).tolist()
+
+
+def test_cumulative_flow_folds_in_updates(actions, monkeypatch):
+    actions = sorted(actions, key=lambda action: action['id'])
+    flow = CumulativeFlow(utc_offset=3 * 3600)
+    rebuilds = []
+    rebuild = flow._rebuild
+    monkeypatch.setattr(flow, '_rebuild', lambda: rebuilds.append(1) or rebuild())
+    cuts = [0, len(actions) // 2, len(actions) * 3 // 4, len(actions)]
+    for start, end in zip(cuts, cuts[1:]):
+        flow.update(actions[start:end])
+        _check_flow(flow, actions[:end])
+    assert len(rebuilds) == 1
+
+
+def test_cumulative_flow_replays_older_updates(actions):
+    actions = sorted(actions, key=lambda action: action['id'])
+    flow = CumulativeFlow()
+    flow.update(actions[len(actions) // 2:])
+    flow.counts()
+    flow.update(actions[:len(actions) // 2])
+    _check_flow(flow, actions)
@@ -0,0 +1,58 @@
+import os
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from trello.archive import ActionArchive, _segment_numbers
+
+
+@pytest.fixture
+def board(fake):
+    return fake.seed_board(cards=80, lists=4, moves_per_card=2, history_days=120)
+
+
+def _snapshot(archive, board_id, list_id):
+    # What a few queries return, to compare before and after compacting.
+    return (
+        archive.count(),
+        dict((name, values.tolist()) for name, values in archive.query(board=board_id).items()),
+        archive.query(lists=[list_id], since='2000-01-01', columns=('id', 'card'))['id'].tolist(),
+        sorted(action['id'] for action in archive.actions(types=['updateCard'])),
+    )
+
+
+def test_appending_archived_actions_does_nothing(fake, api, board, tmp_path):
+    archive = ActionArchive(str(tmp_path))
+    actions = api.boards.get_action(board['id'], limit=1000)
+    assert archive.append(actions) == len(actions)
+    assert archive.append(actions) == 0
+    # An overlapping page only adds the actions that are new.
+    cards = fake._child_objects('cards', 'idBoard', board['id'])
+    lists = fake._child_objects('lists', 'idBoard', board['id'])
+    for card in cards[:5]:
+        fake._update_card(card, {'idList': lists[-1]['id'] if card['idList'] != lists[-1]['id'] else lists[0]['id']})
+    page = api.boards.get_action(board['id'], limit=1000)
+    assert archive.append([page[:20], page[20:]]) == 5
+    assert archive.count() == len(page)
+    assert sorted(archive.query(columns=('id',))['id'].tolist()) == sorted(action['id'] for action in page)
+    # Another reader sees the same archive.
+    assert ActionArchive(str(tmp_path)).count() == len(page)
+
+
+def test_compact_keeps_every_action(api, board, tmp_path):
+    archive = ActionArchive(str(tmp_path))
+    actions = sorted(api.boards.get_action(board['id'], limit=1000), key=lambda action: action['id'])
+    # Three appends leave most partitions with several segments.
+    for start in range(3):
+        archive.append(actions[start::3])
+    list_id = next(action['data']['listAfter']['id'] for action in actions if 'listAfter' in action['data'])
+    before = _snapshot(archive, board['id'], list_id)
+    assert archive.compact() > 0
+    assert _snapshot(archive, board['id'], list_id) == before
+    assert _snapshot(ActionArchive(str(tmp_path)), board['id'], list_id) == before
+    board_path = os.path.join(str(tmp_path), board['id'])
+    for month in os.listdir(board_path):
+        assert len(_segment_numbers(os.path.join(board_path, month))) == 1
+    assert archive.compact() == 0
+    assert archive.append(actions) == 0
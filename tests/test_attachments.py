@@ -0,0 +1,75 @@
+import os
+
+import pytest
+
+from trello.attachments import _trusted
+
+
+@pytest.fixture
+def setup(fake, api, tmp_path):
+    board = fake.seed_board(cards=1, lists=1)
+    card = api.boards.get_card(board['id'])[0]
+    attachment = api.cards.new_attachment(card['id'], file=b'0123456789' * 100, name='data.bin')
+    path = os.path.join(str(tmp_path), card['id'], '{}-data.bin'.format(attachment['id']))
+    return fake, api, card, attachment, path
+
+
+def test_resumes_a_part_with_a_matching_validator(setup, tmp_path):
+    fake, api, card, attachment, path = setup
+    os.makedirs(os.path.dirname(path))
+    content = fake._files[attachment['id']]
+    with open(path + '.part', 'wb') as fd:
+        fd.write(content[:300])
+    etag = fake.handle('GET', '/files/' + attachment['id'], {})[1]['ETag']
+    with open(path + '.part.validator', 'w') as fd:
+        fd.write(etag)
+    report = api.cards.download_attachments([card['id']], str(tmp_path))
+    assert report.bytes == 700 and not report.failed
+    assert open(path, 'rb').read() == content
+    assert not os.path.exists(path + '.part.validator')
+
+
+def test_restarts_a_stale_part(setup, tmp_path):
+    fake, api, card, attachment, path = setup
+    os.makedirs(os.path.dirname(path))
+    with open(path + '.part', 'wb') as fd:
+        fd.write(b'x' * 300)
+    with open(path + '.part.validator', 'w') as fd:
+        fd.write('"stale"')
+    report = api.cards.download_attachments([card['id']], str(tmp_path))
+    assert report.bytes == 1000
+    assert open(path, 'rb').read() == fake._files[attachment['id']]
+
+
+def test_a_complete_part_is_not_a_failure(setup, tmp_path):
+    fake, api, card, attachment, path = setup
+    os.makedirs(os.path.dirname(path))
+    with open(path + '.part', 'wb') as fd:
+        fd.write(fake._files[attachment['id']])
+    with open(path + '.part.validator', 'w') as fd:
+        fd.write(fake.handle('GET', '/files/' + attachment['id'], {})[1]['ETag'])
+    report = api.cards.download_attachments([card['id']], str(tmp_path))
+    assert not report.failed and report.downloaded == [path]
+
+
+def test_size_mismatch_fails(setup, tmp_path):
+    fake, api, card, attachment, path = setup
+    fake._files[attachment['id']] = b'short'
+    report = api.cards.download_attachments([card['id']], str(tmp_path))
+    assert len(report.failed) == 1
+    assert not os.path.exists(path) and not os.path.exists(path + '.part')
+
+
+def test_credentials_only_go_to_trello_hosts():
+    assert _trusted('https://trello.com/1/cards/x/attachments/y/download/z', 'trello.com')
+    assert _trusted('https://trello-attachments.s3.amazonaws.com/a/b', 'trello.com')
+    assert _trusted('http://127.0.0.1:8000/files/a', '127.0.0.1')
+    assert not _trusted('https://evil.example/trello.com', 'trello.com')
+    assert not _trusted('https://nottrello.com/a', 'trello.com')
+
+
+def test_a_card_that_cannot_be_listed_is_reported_not_raised(setup, tmp_path):
+    fake, api, card, attachment, path = setup
+    report = api.cards.download_attachments([card['id'], 'nosuchcard0'], str(tmp_path))
+    assert report.downloaded == [path]
+    assert [(card_id, attachment_id) for card_id, attachment_id, _ in report.failed] == [('nosuchcard0', None)]
@@ -0,0 +1,100 @@
+import time
+
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+
+from trello import DeadlineExceeded
+from trello.ratelimit import RateLimiter
+from trello.circuit import CLOSED, HALF_OPEN, OPEN, CircuitBreakers, CircuitOpenError
+from tests.fakeserver import FakeTrelloAdapter
+
+ENDPOINT = 'GET /1/boards/{}'
+
+
+@pytest.fixture
+def client(fake, connect):
+    board = fake.seed_board(cards=1, lists=1)
+    breakers = CircuitBreakers(failure_threshold=2, reset_timeout=0.05)
+    return fake, board, breakers, connect(breakers=breakers)
+
+
+def _open(fake, board, api):
+    fake.fail('/1/boards/', status=503, count=2)
+    for _ in range(2):
+        with pytest.raises(requests.HTTPError):
+            api.boards.get(board['id'])
+    with pytest.raises(CircuitOpenError):
+        api.boards.get(board['id'])
+    time.sleep(0.06)
+
+
+def test_server_errors_open_and_a_successful_probe_closes(client):
+    fake, board, breakers, api = client
+    _open(fake, board, api)
+    assert breakers.get(ENDPOINT).state == OPEN
+    api.boards.get(board['id'])
+    assert breakers.get(ENDPOINT).state == CLOSED
+
+
+def test_a_429_probe_neither_closes_nor_holds_the_probe_slot(client):
+    fake, board, breakers, api = client
+    _open(fake, board, api)
+    fake.fail('/1/boards/', status=429, count=1)
+    with pytest.raises(requests.HTTPError):
+        api.boards.get(board['id'])
+    assert breakers.get(ENDPOINT).state == HALF_OPEN
+    api.boards.get(board['id'])
+    assert breakers.get(ENDPOINT).state == CLOSED
+
+
+def test_a_probe_that_raises_something_else_gives_its_slot_back(client):
+    fake, board, breakers, api = client
+    _open(fake, board, api)
+    api._transport.mount('https://', _Broken())
+    with pytest.raises(RuntimeError):
+        api.boards.get(board['id'])
+    assert breakers.get(ENDPOINT).state == HALF_OPEN
+    api._transport.mount('https://', FakeTrelloAdapter(fake))
+    api.boards.get(board['id'])
+    assert breakers.get(ENDPOINT).state == CLOSED
+
+
+def test_client_errors_count_as_answers(client):
+    fake, board, breakers, api = client
+    fake.fail('/1/boards/', status=404, count=3)
+    for _ in range(3):
+        with pytest.raises(requests.HTTPError):
+            api.boards.get(board['id'])
+    assert breakers.get(ENDPOINT).state == CLOSED
+
+
+class _Broken(BaseAdapter):
+    def send(self, request, **kwargs):
+        raise RuntimeError('bug')
+
+    def close(self):
+        pass
+
+
+def test_an_expired_deadline_leaves_a_half_open_breaker_alone(client):
+    fake, board, breakers, api = client
+    _open(fake, board, api)
+    with pytest.raises(DeadlineExceeded):
+        with api.deadline(0.01):
+            time.sleep(0.02)
+            api.boards.get(board['id'])
+    assert breakers.get(ENDPOINT).state == HALF_OPEN
+    api.boards.get(board['id'])
+    assert breakers.get(ENDPOINT).state == CLOSED
+
+
+def test_a_deadline_hit_while_throttled_gives_the_slot_back(connect):
+    limiter = RateLimiter(1, 10)
+    api = connect(key_limiter=limiter)
+    api.members.get('me')
+    for _ in range(3):
+        with pytest.raises(DeadlineExceeded):
+            with api.deadline(0.5):
+                api.members.get('me')
+    assert limiter.reserve() == pytest.approx(10.0, abs=0.1)
@@ -0,0 +1,42 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from trello import TrelloClientPool, Transport
+from trello.aliases import AliasMap
+from trello.metrics import Metrics
+from tests.fakeserver import FakeTrello, FakeTrelloServer
+
+
+def test_identical_gets_under_different_aliases_are_sent_once():
+    fake = FakeTrello(seed=1, latency=0.1)
+    board = fake.seed_board(cards=3, lists=1)
+    with FakeTrelloServer(fake) as server:
+        metrics = Metrics()
+        pool = TrelloClientPool('key', transport=Transport(server.url, metrics=metrics, aliases=AliasMap(), coalesce=True))
+        api = pool.get('token')
+        card = api.boards.get_card(board['id'])[0]
+        metrics.reset()
+        names = [card['url'], card['shortLink'], card['id']] * 8
+        with ThreadPoolExecutor(len(names)) as executor:
+            ids = list(executor.map(lambda name: api.cards.get(name)['id'], names))
+        pool.close()
+    assert set(ids) == {card['id']}
+    statuses = metrics.snapshot()['GET /1/cards/{}']['statuses']
+    assert statuses['coalesced'] >= len(names) - 3
+    assert statuses['200'] + statuses['coalesced'] == len(names)
+
+
+def test_followers_see_the_leaders_error():
+    fake = FakeTrello(seed=1, latency=0.1)
+    with FakeTrelloServer(fake) as server:
+        api = TrelloClientPool('key', transport=Transport(server.url, coalesce=True)).get('token')
+        with ThreadPoolExecutor(4) as executor:
+            results = list(executor.map(lambda _: _error_of(api.cards.get, 'nosuchcard0'), range(4)))
+    assert all(error is not None and error.response.status_code in (400, 404) for error in results)
+
+
+def _error_of(func, *args):
+    try:
+        func(*args)
+    except Exception as error:
+        return error
+    return None
@@ -0,0 +1,75 @@
+import threading
+import time
+
+import pytest
+
+from trello import map_calls
+
+
+def _slow_square(n):
+    time.sleep(0.001 * (n % 5))
+    return n * n
+
+
+def test_ordered_results_keep_input_order():
+    assert list(map_calls(_slow_square, range(50), concurrency=8)) == [n * n for n in range(50)]
+
+
+def test_unordered_results_pair_each_item_with_its_result():
+    pairs = list(map_calls(_slow_square, range(50), concurrency=8, ordered=False))
+    assert sorted(pairs) == [(n, n * n) for n in range(50)]
+
+
+def _fail_on_three(n):
+    if n == 3:
+        raise ValueError(n)
+    return n
+
+
+def test_errors_raise_unless_returned():
+    with pytest.raises(ValueError):
+        list(map_calls(_fail_on_three, range(5), concurrency=2))
+    results = list(map_calls(_fail_on_three, range(5), concurrency=2, return_exceptions=True))
+    assert results[:3] == [0, 1, 2] and results[4] == 4
+    assert isinstance(results[3], ValueError)
+
+
+def test_closing_the_iterator_cancels_work_not_started():
+    started = []
+    lock = threading.Lock()
+
+    def call(n):
+        with lock:
+            started.append(n)
+        time.sleep(0.01)
+        return n
+
+    results = map_calls(call, range(1000), concurrency=4)
+    assert next(results) == 0
+    results.close()
+    time.sleep(0.05)
+    # At most the two windows that were queued ever ran.
+    assert len(started) <= 2 * 4 + 1
+
+
+def test_concurrency_bounds_the_calls_in_flight():
+    running = [0, 0]
+    lock = threading.Lock()
+
+    def call(n):
+        with lock:
+            running[0] += 1
+            running[1] = max(running[1], running[0])
+        time.sleep(0.005)
+        with lock:
+            running[0] -= 1
+
+    list(map_calls(call, range(40), concurrency=3))
+    assert running[1] <= 3
+
+
+def test_api_map_passes_keyword_arguments_through(fake, api):
+    board = fake.seed_board(cards=6, lists=1)
+    card_ids = [card['id'] for card in api.boards.get_card(board['id'])]
+    assert [card['id'] for card in api.map(api.cards.get, card_ids, fields='name')] == card_ids
+    assert set(card_id for card_id, _ in api.map_unordered(api.cards.get, card_ids + ['nosuchcard0'], return_exceptions=True)) == set(card_ids + ['nosuchcard0'])
@@ -0,0 +1,13 @@
+from trello.crawler import OrganizationCrawler
+
+
+def test_workers_use_the_scoped_token(fake, connect):
+    org = fake.add_organization('acme')
+    for _ in range(2):
+        fake.seed_board(cards=20, lists=2, history_days=30, idOrganization=org['id'])
+    tokens = []
+    api = connect(listeners=[lambda call: tokens.append(call.token)])
+    with api.as_token('scoped'):
+        entities = set(entity for entity, _ in OrganizationCrawler(api, workers=4).crawl('acme'))
+    assert entities == {'boards', 'lists', 'cards', 'actions'}
+    assert len(tokens) > 2 and set(tokens) == {'scoped'}
@@ -0,0 +1,52 @@
+import gc
+import json
+
+from trello.decoding import SharedDecoder
+
+
+def test_repeated_objects_and_ids_are_shared(fake, connect):
+    board = fake.seed_board(cards=30, lists=2, members=3)
+    decoder = SharedDecoder()
+    api = connect(decoder=decoder)
+    cards = api.boards.get_card(board['id'], members='true')
+    again = api.boards.get_card(board['id'], members='true')
+    assert cards == json.loads(json.dumps(again))
+    members = {}
+    for card in cards + again:
+        for member in card['members']:
+            assert members.setdefault(member['id'], member) is member
+    assert len(members) == 3
+    # Unchanged cards decode to the objects of the first response.
+    assert all(card is first for card, first in zip(again, cards))
+    # Every copy of an id is the same string.
+    for card in cards:
+        assert card['idBoard'] is cards[0]['idBoard']
+        for member_id, member in zip(card['idMembers'], card['members']):
+            assert member_id is member['id']
+    assert len(decoder) == 30 + 3
+
+
+def test_changed_objects_replace_the_shared_one(fake, connect):
+    board = fake.seed_board(cards=3, lists=1, members=1)
+    decoder = SharedDecoder()
+    api = connect(decoder=decoder)
+    cards = api.boards.get_card(board['id'])
+    api.cards.update_name(cards[0]['id'], 'Renamed')
+    renamed = api.boards.get_card(board['id'])
+    assert renamed[0] is not cards[0]
+    assert cards[0]['name'] == 'Card 0'
+    assert renamed[0]['name'] == 'Renamed'
+    assert api.boards.get_card(board['id'])[0] is renamed[0]
+    assert renamed[1] is cards[1]
+    # Objects nothing refers to any more are dropped.
+    del cards, renamed
+    gc.collect()
+    assert len(decoder) == 0
+
+
+def test_the_string_table_starts_over_when_full():
+    decoder = SharedDecoder(max_strings=2)
+    first = decoder('[{"idList": "list-one"}, {"idList": "list-two"}]')
+    assert decoder('{"idList": "list-one"}')['idList'] is first[0]['idList']
+    decoder('{"idList": "list-three"}')
+    assert decoder('{"idList": "list-one"}')['idList'] is not first[0]['idList']
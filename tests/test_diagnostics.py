@@ -0,0 +1,12 @@
+from trello.diagnostics import CallSiteProfiler
+
+
+def test_calls_from_map_workers_are_blamed_on_the_submitting_line(fake, connect):
+    board = fake.seed_board(cards=5, lists=1)
+    profiler = CallSiteProfiler()
+    api = connect(profiler=profiler)
+    card_ids = [card['id'] for card in api.boards.get_card(board['id'])]
+    list(api.map(api.cards.get, card_ids, concurrency=4))
+    sites = dict((row['endpoint'], row['call_site']) for row in profiler.report())
+    assert __file__ in sites['GET /1/cards/{}']
+    assert 'test_calls_from_map_workers' in sites['GET /1/cards/{}']
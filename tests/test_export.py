@@ -0,0 +1,66 @@
+import json
+import os
+
+import pytest
+
+from trello import TrelloApi, Transport
+
+
+@pytest.fixture
+def org(fake):
+    org = fake.add_organization('acme')
+    boards = [fake.seed_board(name='Board {}'.format(n), cards=30, lists=3, checklists_per_card=1, history_days=30, idOrganization=org['id']) for n in range(3)]
+    return org, boards
+
+
+def _client(server):
+    return TrelloApi('key', 'token', transport=Transport(server.url))
+
+
+def _ids(path):
+    with open(path) as fd:
+        return [json.loads(line)['id'] for line in fd]
+
+
+def _expected(fake, boards, entity):
+    ids = []
+    for board in boards:
+        if entity == 'actions':
+            ids.extend(action['id'] for action in fake._actions if action['data'].get('board', {}).get('id') == board['id'])
+        else:
+            ids.extend(item['id'] for item in fake._child_objects(entity, 'idBoard', board['id']))
+    return sorted(ids)
+
+
+def test_ndjson_export_has_every_record_once(fake, server, org, tmp_path):
+    paths = _client(server).organizations.export('acme', str(tmp_path), workers=2)
+    assert sorted(_ids(paths['boards'])) == sorted(board['id'] for board in org[1])
+    for entity in ('lists', 'cards', 'checklists', 'actions'):
+        assert sorted(_ids(paths[entity])) == _expected(fake, org[1], entity)
+    assert not os.path.exists(os.path.join(str(tmp_path), '.export'))
+
+
+def test_an_interrupted_export_resumes_from_its_checkpoint(fake, server, org, tmp_path):
+    boards = org[1]
+    dest = str(tmp_path)
+    fake.fail('/1/boards/{}/checklists'.format(boards[1]['id']), status=404)
+    with pytest.raises(Exception):
+        _client(server).organizations.export('acme', dest, workers=1)
+    with open(os.path.join(dest, '.export', 'checkpoint.json')) as fd:
+        assert json.load(fd)['done'] == [boards[0]['id']]
+    fake.clear_failures()
+    before = fake.requests
+    paths = _client(server).organizations.export('acme', dest, workers=1)
+    # The finished board is not fetched again (its lists, cards, checklists
+    # and actions would take four requests).
+    assert fake.requests - before == 1 + 2 * 4
+    for entity in ('lists', 'cards', 'checklists', 'actions'):
+        assert sorted(_ids(paths[entity])) == _expected(fake, boards, entity)
+
+
+def test_parquet_export(fake, server, org, tmp_path):
+    pq = pytest.importorskip('pyarrow.parquet')
+    paths = _client(server).organizations.export('acme', str(tmp_path), format='parquet', workers=2)
+    cards = pq.read_table(paths['cards'])
+    assert sorted(cards.column('id').to_pylist()) == _expected(fake, org[1], 'cards')
+    assert len(os.listdir(paths['cards'])) == 3
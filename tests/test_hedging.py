@@ -0,0 +1,54 @@
+import threading
+import time
+
+import pytest
+
+from trello.hedging import HedgePolicy
+from trello.ratelimit import RateLimiter
+from tests.fakeserver import FakeTrelloAdapter
+
+
+class _Delayed(FakeTrelloAdapter):
+    # Sleeps before each request for the next of the given delays.
+
+    def __init__(self, fake, delays):
+        super(_Delayed, self).__init__(fake)
+        self.delays = list(delays)
+        self._lock = threading.Lock()
+
+    def send(self, request, **kwargs):
+        with self._lock:
+            delay = self.delays.pop(0) if self.delays else 0.0
+        time.sleep(delay)
+        return super(_Delayed, self).send(request, **kwargs)
+
+
+@pytest.fixture
+def hedged(fake, connect):
+    # Two quick calls teach the policy a hedging delay of min_delay; the
+    # calls after them take the given delays.
+    def hedged(delays, **options):
+        board = fake.seed_board(cards=1, lists=1)
+        policy = HedgePolicy(min_samples=2, budget=1.0, min_delay=0.02)
+        api = connect(_Delayed(fake, [0.0, 0.0] + delays), hedging=policy, **options)
+        api.boards.get(board['id'])
+        api.boards.get(board['id'])
+        return board['id'], policy, api
+    return hedged
+
+
+def test_a_successful_hedge_beats_a_failed_primary(fake, hedged):
+    board_id, policy, api = hedged([0.05, 0.15])
+    # The primary answers 503 before the hedge's 200 arrives.
+    fake.fail('/1/boards/', status=503, count=1)
+    assert api.boards.get(board_id)['id'] == board_id
+    assert fake.requests == 4
+
+
+def test_a_refused_hedge_keeps_its_budget(fake, hedged):
+    board_id, policy, api = hedged([0.05], key_limiter=RateLimiter(3, 60))
+    api.boards.get(board_id)
+    # The limiter has no slot left for a hedge, so none is sent and the
+    # credit earned by the three calls is all still there.
+    assert policy._credit == 3.0
+    assert fake.requests == 3
@@ -0,0 +1,31 @@
+import shutil
+
+import pytest
+
+from trello import TrelloApi, Transport
+from trello.http2 import http2_available
+from tests.fakeserver import H2Server, self_signed_cert
+
+pytest.importorskip('hypercorn')
+pytestmark = pytest.mark.skipif(not http2_available() or shutil.which('openssl') is None, reason='requires httpx[http2] and openssl')
+
+
+def test_a_concurrent_map_survives_goaway(fake, tmp_path):
+    board = fake.seed_board(cards=50, lists=1)
+    card_ids = [card['id'] for card in fake._child_objects('cards', 'idBoard', board['id'])] * 8
+    certfile, keyfile = self_signed_cert(str(tmp_path))
+    server = H2Server(fake, certfile, keyfile)
+    # The server ends every connection with GOAWAY after 50 requests.
+    server.config.keep_alive_max_requests = 50
+    server.config.graceful_timeout = 0.1
+    with server:
+        transport = Transport(server.url, http2=True, pool_maxsize=32)
+        transport.session.trust_env = False
+        transport.session.verify = certfile
+        api = TrelloApi('key', 'token', transport=transport)
+        try:
+            ids = list(api.map(lambda card_id: api.cards.get(card_id)['id'], card_ids, concurrency=32))
+        finally:
+            transport.close()
+    assert transport.http2
+    assert ids == card_ids
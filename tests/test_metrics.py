@@ -0,0 +1,41 @@
+import pytest
+import requests
+
+from trello.metrics import Metrics
+from trello.cache import ResponseCache
+
+
+def test_calls_are_counted_per_endpoint_and_status(fake, connect):
+    board = fake.seed_board(cards=2, lists=1)
+    metrics = Metrics(buckets=(0.5, 1.0))
+    api = connect(metrics=metrics, cache=ResponseCache())
+    api.boards.get(board['id'])
+    api.boards.get(board['id'])
+    with pytest.raises(requests.HTTPError):
+        api.cards.get('nosuchcard0')
+    snapshot = metrics.snapshot()
+    boards = snapshot['GET /1/boards/{}']
+    assert boards['count'] == 2 and boards['cache_hits'] == 1
+    assert boards['statuses'] == {'200': 1, 'cache': 1}
+    assert boards['latency_seconds']['buckets'][float('inf')] == 2
+    assert list(snapshot['GET /1/cards/{}']['statuses']) == ['400']
+
+
+def test_prometheus_exposition(fake, connect):
+    board = fake.seed_board(cards=1, lists=1)
+    metrics = Metrics(buckets=(0.5, 1.0), prefix='app')
+    api = connect(metrics=metrics)
+    api.boards.get(board['id'])
+    lines = metrics.to_prometheus().splitlines()
+    assert '# TYPE app_request_duration_seconds histogram' in lines
+    assert 'app_request_duration_seconds_bucket{endpoint="GET /1/boards/{}",le="0.5"} 1' in lines
+    assert 'app_request_duration_seconds_bucket{endpoint="GET /1/boards/{}",le="+Inf"} 1' in lines
+    assert 'app_request_duration_seconds_count{endpoint="GET /1/boards/{}"} 1' in lines
+    assert 'app_requests_total{endpoint="GET /1/boards/{}",status="200"} 1' in lines
+    assert 'app_cache_hits_total{endpoint="GET /1/boards/{}"} 0' in lines
+    # Every sample belongs to a family announced before it.
+    families = set(line.split()[2] for line in lines if line.startswith('# TYPE'))
+    for line in lines:
+        if not line.startswith('#'):
+            name = line.split('{')[0]
+            assert name in families or name.rsplit('_', 1)[0] in families
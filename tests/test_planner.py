@@ -0,0 +1,47 @@
+import pytest
+
+from trello.planner import FetchPlanner
+
+
+SHAPE = {'fields': 'name', 'lists': {'cards': {'members': {}, 'checklists': {}}}}
+
+
+@pytest.fixture
+def boards(fake):
+    org = fake.add_organization('acme')
+    return [fake.seed_board(cards=12, lists=3, members=3, checklists_per_card=1, idOrganization=org['id']) for _ in range(3)]
+
+
+def _check_board(fake, board):
+    # Every list holds the cards the fake has for it, each with its
+    # members and checklists; the board's hidden cards and members are gone.
+    assert set(board) == {'id', 'name', 'lists'}
+    assert [l['id'] for l in board['lists']] == [l['id'] for l in fake._child_objects('lists', 'idBoard', board['id'])]
+    for lst in board['lists']:
+        expected = fake._child_objects('cards', 'idList', lst['id'])
+        assert [c['id'] for c in lst['cards']] == [c['id'] for c in expected]
+        for card, source in zip(lst['cards'], expected):
+            assert [m['id'] for m in card['members']] == source['idMembers']
+            assert [c['id'] for c in card['checklists']] == [c['id'] for c in fake._child_objects('checklists', 'idCard', card['id'])]
+
+
+def test_a_board_is_fetched_in_one_request(fake, api, boards):
+    plan = FetchPlanner(api).plan('boards', boards[0]['id'], SHAPE)
+    assert len(plan.steps) == 1
+    result = plan.execute()
+    _check_board(fake, result)
+    assert plan.report == [(1, 'single', 1)]
+    assert fake.requests == 1
+
+
+@pytest.mark.parametrize('request_cost, strategy, requests', [(0.05, 'parallel', 3), (10.0, 'batch', 1)])
+def test_an_organization_is_fetched_per_board(fake, api, boards, request_cost, strategy, requests):
+    plan = FetchPlanner(api, request_cost=request_cost).plan('organizations', 'acme', {'boards': SHAPE})
+    assert len(plan.steps) == 2
+    result = plan.execute()
+    assert [b['id'] for b in result['boards']] == [b['id'] for b in boards]
+    for board in result['boards']:
+        _check_board(fake, board)
+    assert plan.report == [(1, 'single', 1), (3, strategy, requests)]
+    assert fake.requests == 1 + requests
+    assert '2. boards x3 via {}: {} request(s)'.format(strategy, requests) in plan.explain()
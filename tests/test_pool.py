@@ -0,0 +1,40 @@
+import pytest
+
+from trello import TrelloClientPool
+from tests.fakeserver import FakeTrelloAdapter
+
+
+@pytest.fixture
+def pool(fake):
+    pool = TrelloClientPool('key', key_rate=(10, 60), token_rate=(5, 60))
+    pool.transport.mount('https://', FakeTrelloAdapter(fake))
+    yield pool
+    pool.close()
+
+
+def test_clients_share_the_transport_and_cache_per_token(fake, pool):
+    board = fake.seed_board(cards=1, lists=1)
+    a, b = pool.get('tokA'), pool['tokB']
+    assert a._transport is b._transport is pool.transport
+    a.boards.get(board['id'])
+    a.boards.get(board['id'])
+    assert fake.requests == 1
+    # Another token gets its own cache entries...
+    b.boards.get(board['id'])
+    assert fake.requests == 2
+    # ...and a write drops only the writer's.
+    b.boards.update_name(board['id'], 'Renamed')
+    assert a.boards.get(board['id'])['name'] == 'Board'
+    assert b.boards.get(board['id'])['name'] == 'Renamed'
+    assert fake.requests == 4
+
+
+def test_clients_share_the_key_quota_but_not_the_token_quotas(fake, pool):
+    board = fake.seed_board(cards=1, lists=1)
+    # Different fields, so that none of the calls is answered from the cache.
+    for token, fields in (('tokA', 'name'), ('tokB', 'name'), ('tokA', 'closed')):
+        pool.get(token).boards.get(board['id'], fields=fields)
+    transport = pool.transport
+    assert transport.key_limiter._tokens == pytest.approx(7, abs=0.01)
+    assert transport.token_limiters.get('tokA')._tokens == pytest.approx(3, abs=0.01)
+    assert transport.token_limiters.get('tokB')._tokens == pytest.approx(4, abs=0.01)
@@ -0,0 +1,38 @@
+import gc
+
+import pytest
+
+from trello.resolver import NameResolver
+
+
+@pytest.fixture
+def board(fake):
+    return fake.seed_board(cards=1, lists=2, labels=2)
+
+
+def test_names_created_through_the_client_resolve_at_once(api, board):
+    resolver = NameResolver(api)
+    lists = api.boards.get_list(board['id'])
+    assert resolver.list(board['id'], lists[0]['name'].upper()) == lists[0]['id']
+    shipped = api.lists.new('Shipped', board['id'])
+    assert resolver.list(board['id'], 'shipped') == shipped['id']
+    label = api.labels.new('Urgent', 'red', board['id'])
+    assert resolver.label(board['id'], 'urgent') == label['id']
+    card = api.boards.get_card(board['id'])[0]
+    added = api.cards.new_label(card['id'], 'blue', 'Blocked')
+    assert resolver.label(board['id'], 'Blocked') == added['id']
+
+
+def test_unknown_names_raise_key_error(api, board):
+    with pytest.raises(KeyError):
+        NameResolver(api, min_refresh=0).list(board['id'], 'no such list')
+
+
+def test_a_dropped_resolver_stops_listening(api):
+    resolver = NameResolver(api)
+    assert len(api._transport.listeners) == 1
+    del resolver
+    gc.collect()
+    assert api._transport.listeners == []
+    NameResolver(api).close()
+    assert api._transport.listeners == []
@@ -0,0 +1,14 @@
+from trello.streaming import NotificationStream
+
+
+def test_a_poll_pages_back_to_the_cursor(fake, api):
+    stream = NotificationStream(api, min_interval=0.0, budget=None, limit=5)
+    member = fake.me['id']
+    stream.add(member)
+    first = [fake.notify(member)['id'] for _ in range(3)]
+    assert [notification['id'] for _, notification in stream.poll()] == first
+    # Twelve new ones take three pages of five; all arrive, oldest first.
+    later = [fake.notify(member)['id'] for _ in range(12)]
+    assert [notification['id'] for _, notification in stream.poll()] == later
+    assert stream.cursors() == {member: later[-1]}
+    assert stream.poll() == []
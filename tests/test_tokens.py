@@ -0,0 +1,29 @@
+from trello import TrelloApi, TrelloClientPool, map_calls
+
+
+def test_as_token_scopes_only_its_own_client():
+    pool = TrelloClientPool('KEY')
+    a, b = pool.get('tokA'), pool.get('tokB')
+    other = TrelloApi('KEY', 'other')
+    with a.as_token('scoped'):
+        assert a.boards._token == 'scoped'
+        assert b.boards._token == 'tokB'
+        assert other.boards._token == 'other'
+    assert a.boards._token == 'tokA'
+
+
+def test_pool_clients_stay_isolated_across_threads():
+    pool = TrelloClientPool('KEY')
+    a, b = pool.get('tokA'), pool.get('tokB')
+    with a.as_token('scoped'):
+        tokens = list(map_calls(lambda client: client.cards._token, [a, b, a, b], concurrency=4))
+    assert tokens == ['scoped', 'tokB', 'scoped', 'tokB']
+
+
+def test_nested_scopes_restore_the_outer_token():
+    api = TrelloApi('KEY')
+    with api.as_token('outer'):
+        with api.as_token('inner'):
+            assert api.lists._token == 'inner'
+        assert api.lists._token == 'outer'
+    assert api.lists._token is None
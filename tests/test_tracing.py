@@ -0,0 +1,47 @@
+import threading
+
+import pytest
+import requests
+
+from trello.tracing import Tracer, current_span, use_span
+
+
+class _Recorder(Tracer):
+    def __init__(self):
+        self.spans = []
+        self._lock = threading.Lock()
+
+    def start_span(self, call, parent):
+        span = {'endpoint': call.endpoint, 'parent': parent}
+        with self._lock:
+            self.spans.append(span)
+        return span
+
+    def end_span(self, span, call, error=None):
+        span['status'] = call.status
+        span['error'] = error
+
+
+def test_spans_nest_under_the_callers_span(fake, connect):
+    board = fake.seed_board(cards=4, lists=1)
+    tracer = _Recorder()
+    api = connect(tracer=tracer)
+    with use_span('request'):
+        card_ids = [card['id'] for card in api.boards.get_card(board['id'])]
+        list(api.map(api.cards.get, card_ids, concurrency=4))
+        assert current_span() == 'request'
+    assert current_span() is None
+    assert len(tracer.spans) == 5
+    # Calls made from map() worker threads get the same parent.
+    assert all(span['parent'] == 'request' for span in tracer.spans)
+    assert all(span['status'] == 200 and span['error'] is None for span in tracer.spans)
+
+
+def test_failed_calls_end_their_span_with_the_error(connect):
+    tracer = _Recorder()
+    api = connect(tracer=tracer)
+    with pytest.raises(requests.HTTPError) as raised:
+        api.cards.get('nosuchcard0')
+    span, = tracer.spans
+    assert span['parent'] is None
+    assert span['error'] is raised.value and span['status'] == 400
@@ -1,4 +1,9 @@
 from requests.utils import quote
+from .base import ApiResource, resource_property, token_scope
+from .concurrency import DEFAULT_CONCURRENCY, map_calls
+from .timeouts import DeadlineExceeded, deadline_scope, timeout_scope
+from .transport import Transport
+from .upload import Upload
 from .actions import Actions
 from .batches import Batches
 from .boards import Boards
@@ -13,42 +18,68 @@ from .search import Search
 from .tokens import Tokens
 from .types import Types
 from .webhooks import Webhooks
+from .pool import TrelloClientPool
 
 class TrelloApi(object):
-    def __init__(self, apikey, token=None):
+    actions = resource_property(Actions)
+    batches = resource_property(Batches)
+    boards = resource_property(Boards)
+    cards = resource_property(Cards)
+    checklists = resource_property(Checklists)
+    labels = resource_property(Labels)
+    lists = resource_property(Lists)
+    members = resource_property(Members)
+    notifications = resource_property(Notifications)
+    organizations = resource_property(Organizations)
+    search = resource_property(Search)
+    tokens = resource_property(Tokens)
+    types = resource_property(Types)
+    webhooks = resource_property(Webhooks)
+
+    def __init__(self, apikey, token=None, transport=None):
         self._apikey = apikey
         self._token = token
-        self.actions = Actions(apikey, token)
-        self.batches = Batches(apikey, token)
-        self.boards = Boards(apikey, token)
-        self.cards = Cards(apikey, token)
-        self.checklists = Checklists(apikey, token)
-        self.labels = Labels(apikey, token)
-        self.lists = Lists(apikey, token)
-        self.members = Members(apikey, token)
-        self.notifications = Notifications(apikey, token)
-        self.organizations = Organizations(apikey, token)
-        self.search = Search(apikey, token)
-        self.tokens = Tokens(apikey, token)
-        self.types = Types(apikey, token)
-        self.webhooks = Webhooks(apikey, token)
+        self._transport = transport if transport is not None else Transport()
+        # What as_token() scopes tokens by: this client and its resources,
+        # not every client that shares its key or transport.
+        self._scope = object()
 
     def set_token(self, token):
         self._token = token
-        self.actions._token = token
-        self.batches._token = token
-        self.boards._token = token
-        self.cards._token = token
-        self.checklists._token = token
-        self.labels._token = token
-        self.lists._token = token
-        self.members._token = token
-        self.notifications._token = token
-        self.organizations._token = token
-        self.search._token = token
-        self.tokens._token = token
-        self.types._token = token
-        self.webhooks._token = token
+        for resource in self.__dict__.values():
+            if isinstance(resource, ApiResource):
+                resource._token = token
+
+    def as_token(self, token):
+        # Unlike set_token(), this only affects calls made from the current
+        # thread or asyncio task, so one client can serve many users at once:
+        #
+        #     with api.as_token(user_token):
+        #         api.boards.get(board_id)
+        return token_scope(self._scope, token)
+
+    def timeout(self, connect, read=None):
+        # Overrides the transport's (connect, read) timeout for calls made
+        # from the current thread or asyncio task.
+        return timeout_scope(connect, read)
+
+    def deadline(self, seconds):
+        # Every call inside the block -- including retries, pagination and
+        # calls fanned out with map() -- has to finish within seconds in
+        # total; past that, calls raise DeadlineExceeded instead of sending:
+        #
+        #     with api.deadline(2.0):
+        #         sync_board(api, board_id)
+        return deadline_scope(seconds)
+
+    def map(self, func, items, concurrency=DEFAULT_CONCURRENCY, return_exceptions=False, **kwargs):
+        # Fan func out over items on a thread pool and yield the results in
+        # order, e.g. api.map(api.cards.get, card_ids, fields='name')
+        return map_calls(func, items, concurrency=concurrency, return_exceptions=return_exceptions, **kwargs)
+
+    def map_unordered(self, func, items, concurrency=DEFAULT_CONCURRENCY, return_exceptions=False, **kwargs):
+        # Like map(), but yields (item, result) pairs as calls complete.
+        return map_calls(func, items, concurrency=concurrency, ordered=False, return_exceptions=return_exceptions, **kwargs)
 
     def get_token_url(self, app_name, expires='30days', write_access=True):
         return 'https://trello.com/1/authorize?key={}&name={}&expiration={}&response_type=token&scope={}'.format(self._apikey, quote(app_name), expires, 'read,write' if write_access else 'read')
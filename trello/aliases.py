@@ -0,0 +1,107 @@
+import re
+import threading
+from collections import OrderedDict
+
+# https://trello.com/b/<shortlink>/<slug> and https://trello.com/c/<shortlink>/<number>-<slug>
+URL_PATTERN = re.compile(r'^(?:https?://)?(?:www\.)?trello\.com/([bc])/([A-Za-z0-9]{8})(?:[/?#].*)?$')
+SHORTLINK_PATTERN = re.compile(r'^[A-Za-z0-9]{8}$')
+
+# Path segments followed by the id of a board or card.
+ALIASED_COLLECTIONS = ('boards', 'cards')
+
+def parse_url(value):
+    """Returns ``('boards' or 'cards', shortlink)`` for a Trello board or card URL, else ``None``."""
+    match = URL_PATTERN.match(value)
+    if match is None:
+        return None
+    return ('boards' if match.group(1) == 'b' else 'cards'), match.group(2)
+
+class AliasMap(object):
+    """Maps board and card shortlinks and URLs to their canonical ids.
+
+    Mappings are learned from any response object that has both a
+    ``shortLink`` and an ``id`` -- cards, boards, and the card and board
+    references embedded in actions -- or added with :meth:`add`. Given to a
+    :class:`trello.transport.Transport` as ``aliases``, it rewrites the
+    board and card ids in request paths to their canonical form, so the same
+    entity is cached (and coalesced) under one key however it was named. URLs
+    whose id is not known yet are sent as their shortlink, which Trello
+    accepts anywhere an id is.
+
+    Holds up to ``maxsize`` mappings, dropping the least recently used.
+    """
+
+    def __init__(self, maxsize=100000):
+        self.maxsize = maxsize
+        self._ids = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, shortlink, id):
+        with self._lock:
+            self._ids[shortlink] = id
+            self._ids.move_to_end(shortlink)
+            while len(self._ids) > self.maxsize:
+                self._ids.popitem(last=False)
+
+    def canonical(self, value):
+        """Returns the id for a shortlink or URL if known, the shortlink of an unknown URL, or ``value`` unchanged."""
+        if not isinstance(value, str) or len(value) == 24:
+            return value
+        parsed = parse_url(value) if '/' in value else None
+        shortlink = parsed[1] if parsed is not None else value
+        if parsed is None and not SHORTLINK_PATTERN.match(value):
+            return value
+        with self._lock:
+            id = self._ids.get(shortlink)
+            if id is not None:
+                self._ids.move_to_end(shortlink)
+                return id
+        return shortlink
+
+    def canonical_args(self, path, path_args):
+        # The path arguments with board and card aliases replaced.
+        positions = _aliased_positions(path)
+        if not positions:
+            return path_args
+        path_args = list(path_args)
+        for position in positions:
+            if position < len(path_args):
+                path_args[position] = self.canonical(path_args[position])
+        return path_args
+
+    def learn(self, data, depth=3):
+        # Records the shortlinks of the objects in a decoded response,
+        # looking depth levels deep (deep enough for actions' data.card).
+        if isinstance(data, dict):
+            shortlink = data.get('shortLink')
+            if shortlink is not None and 'id' in data:
+                self.add(shortlink, data['id'])
+            if depth:
+                for value in data.values():
+                    if isinstance(value, (dict, list)):
+                        self.learn(value, depth - 1)
+        elif isinstance(data, list) and depth:
+            for item in data:
+                if isinstance(item, (dict, list)):
+                    self.learn(item, depth - 1)
+
+    def __len__(self):
+        return len(self._ids)
+
+_positions = {}
+
+def _aliased_positions(path):
+    # The indexes of the path arguments that follow /boards/ or /cards/ in a
+    # template like "/1/boards/{}/cards/{}".
+    positions = _positions.get(path)
+    if positions is None:
+        positions = []
+        parts = path.split('/')
+        index = 0
+        for previous, part in zip(parts, parts[1:]):
+            if part == '{}':
+                if previous in ALIASED_COLLECTIONS:
+                    positions.append(index)
+                index += 1
+        positions = _positions[path] = tuple(positions)
+    return positions
@@ -0,0 +1,450 @@
+import csv
+from datetime import date
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Actions that put a card on a list, take it off the board, or bring it back.
+CREATE_TYPES = ('createCard', 'copyCard', 'convertToCardFromCheckItem', 'moveCardToBoard')
+LEAVE_TYPES = ('deleteCard', 'moveCardFromBoard')
+
+CREATED, MOVED, LEFT, RESTORED = 0, 1, 2, 3
+
+# Events are buffered in Python lists and converted to arrays this many at
+# a time, which bounds the memory spent on Python objects.
+CHUNK_SIZE = 65536
+
+DEFAULT_PERCENTILES = (50, 85, 95)
+
+DAY = 86400
+
+if np is not None:
+    # The value of every ASCII hex digit, for parsing ids in bulk.
+    _HEX_DIGITS = np.zeros(256, dtype=np.uint8)
+    _HEX_DIGITS[np.frombuffer(b'0123456789abcdef', dtype=np.uint8)] = np.arange(16)
+    _HEX_DIGITS[np.frombuffer(b'ABCDEF', dtype=np.uint8)] = np.arange(10, 16)
+    _HEX_PLACES = 16 ** np.arange(7, -1, -1, dtype=np.uint32)
+
+class ActionHistory(object):
+    """Card list transitions from board action histories, as NumPy columns.
+
+    Feed it actions from :meth:`Boards.get_action` in any order and number
+    with :meth:`add_actions`, and optionally cards (for their members and
+    labels) with :meth:`add_cards`. Only list transitions are kept, one
+    event of four small integers each, with card, list and member ids
+    dictionary-encoded, so millions of actions fit in tens of megabytes.
+
+    Lead time runs from a card's creation to when it is done; cycle time
+    from when work started to when it is done. A card is done when it first
+    enters one of ``done_lists`` (or, without any, when it is archived or
+    leaves the board) and started when it first enters one of
+    ``start_lists`` (or, without any, when it first moves off the list it
+    was created in). Lists can be given by id or name. All times are in
+    seconds. Requires numpy.
+    """
+
+    def __init__(self, done_lists=(), start_lists=()):
+        if np is None:
+            raise ImportError('ActionHistory requires numpy (pip install numpy)')
+        self.done_lists = set(done_lists)
+        self.start_lists = set(start_lists)
+        self.cards = _Codes()
+        self.lists = _Codes()
+        self.members = _Codes()
+        self.labels = _Codes()
+        self.list_names = {}
+        self.label_names = {}
+        self._buffer = ([], [], [], [], [])
+        self._chunks = []
+        self._card_members = ([], [])
+        self._card_labels = ([], [])
+        self._columns = None
+
+    def add_actions(self, actions):
+        ids, cards, lists, members, kinds = self._buffer
+        card_code, list_code, member_code = self.cards.code, self.lists.code, self.members.code
+        list_names = self.list_names
+        for action in actions:
+            event = _transition(action)
+            if event is None:
+                continue
+            kind, card_id, list_ref = event
+            if list_ref is None:
+                lists.append(-1)
+            else:
+                list_id = list_ref['id']
+                lists.append(list_code(list_id))
+                if list_id not in list_names and 'name' in list_ref:
+                    list_names[list_id] = list_ref['name']
+            ids.append(action['id'])
+            cards.append(card_code(card_id))
+            members.append(member_code(action.get('idMemberCreator')))
+            kinds.append(kind)
+            if len(ids) >= CHUNK_SIZE:
+                self._flush()
+        self._columns = None
+
+    def add_cards(self, cards):
+        card_codes, member_codes = self._card_members
+        label_cards, label_codes = self._card_labels
+        for card in cards:
+            code = self.cards.code(card['id'])
+            for member_id in card.get('idMembers') or ():
+                card_codes.append(code)
+                member_codes.append(self.members.code(member_id))
+            for label in card.get('labels') or ():
+                self.label_names[label['id']] = label.get('name') or label.get('color')
+            for label_id in card.get('idLabels') or ():
+                label_cards.append(code)
+                label_codes.append(self.labels.code(label_id))
+
+    def _flush(self):
+        ids, cards, lists, members, kinds = self._buffer
+        if ids:
+            # Trello ids start with the creation time in seconds and end with
+            # a counter, so parsing them gives both the time and the order of
+            # actions within a second without touching the dates.
+            digits = _HEX_DIGITS[np.array(ids, dtype='S24').view(np.uint8).reshape(-1, 24)].astype(np.uint32)
+            self._chunks.append((
+                digits[:, :8] @ _HEX_PLACES[-8:],
+                digits[:, -6:] @ _HEX_PLACES[-6:],
+                np.array(cards, dtype=np.int32),
+                np.array(lists, dtype=np.int32),
+                np.array(members, dtype=np.int32),
+                np.array(kinds, dtype=np.int8)))
+            for column in self._buffer:
+                del column[:]
+
+    def __len__(self):
+        return sum(len(chunk[0]) for chunk in self._chunks) + len(self._buffer[0])
+
+    def columns(self):
+        """Returns the events as ``{'time', 'card', 'list', 'member', 'kind'}`` arrays, sorted by card and time."""
+        if self._columns is None:
+            self._columns = _sorted_events(self._raw())
+        return self._columns
+
+    def _raw(self, start=0):
+        # The events from the start-th one ingested on, in ingestion order.
+        self._flush()
+        if len(self._chunks) > 1:
+            # Keep one chunk so the next call does not concatenate again.
+            self._chunks = [tuple(np.concatenate(column) for column in zip(*self._chunks))]
+        if self._chunks:
+            return tuple(column[start:] for column in self._chunks[0])
+        return tuple(np.zeros(0, dtype) for dtype in (np.uint32, np.uint32, np.int32, np.int32, np.int32, np.int8))
+
+    def intervals(self, now=None):
+        """Returns the time each card spent on each list visit.
+
+        A dict of arrays ``card``, ``list``, ``start``, ``end``, ``seconds``
+        and ``open``; visits still in progress end at ``now`` (default: the
+        latest event) and are marked open.
+        """
+        columns = self.columns()
+        time, card = columns['time'], columns['card']
+        if now is None:
+            now = int(time.max()) if len(time) else 0
+        end = np.empty_like(time)
+        last = np.ones(len(time), dtype=bool)
+        if len(time):
+            last[:-1] = card[1:] != card[:-1]
+            end[:-1] = time[1:]
+        end[last] = now
+        keep = columns['list'] >= 0
+        return {
+            'card': card[keep],
+            'list': columns['list'][keep],
+            'start': time[keep],
+            'end': end[keep],
+            'seconds': (end - time)[keep],
+            'open': last[keep],
+        }
+
+    def card_times(self):
+        """Returns per-card arrays ``card``, ``created``, ``started``, ``done``, ``lead`` and ``cycle`` (NaN where unknown)."""
+        columns = self.columns()
+        time, card, lists, kind = columns['time'], columns['card'], columns['list'], columns['kind']
+        count = len(self.cards.ids)
+        created = _first(card, time, np.ones(len(card), dtype=bool), count)
+        if self.done_lists:
+            done = _first(card, time, np.isin(lists, self._list_codes(self.done_lists)), count)
+        else:
+            done = _first(card, time, kind == LEFT, count)
+        if self.start_lists:
+            started = _first(card, time, np.isin(lists, self._list_codes(self.start_lists)), count)
+        else:
+            started = _first(card, time, kind == MOVED, count)
+        # A card done without passing through a start list started when it
+        # was done, not never.
+        started = np.where(np.isnan(started) & ~np.isnan(done), done, started)
+        return {
+            'card': np.arange(count),
+            'created': created,
+            'started': started,
+            'done': done,
+            'lead': done - created,
+            'cycle': done - started,
+        }
+
+    def _list_codes(self, lists):
+        names = dict((name, list_id) for list_id, name in self.list_names.items())
+        codes = []
+        for value in lists:
+            list_id = names.get(value, value)
+            if list_id in self.lists.codes:
+                codes.append(self.lists.codes[list_id])
+        return np.array(codes, dtype=np.int32)
+
+    def time_in_list(self, percentiles=DEFAULT_PERCENTILES, include_open=False):
+        """Time-in-list statistics per list id: ``{list_id: {'count', 'mean', 'p50', ...}}``."""
+        intervals = self.intervals()
+        keep = np.ones(len(intervals['list']), dtype=bool) if include_open else ~intervals['open']
+        return _grouped_stats(intervals['list'][keep], intervals['seconds'][keep].astype(np.float64), percentiles, self.lists.ids)
+
+    def lead_times(self, percentiles=DEFAULT_PERCENTILES, by=None):
+        """Lead time statistics for done cards, overall or ``by`` ``'member'`` or ``'label'``."""
+        return self._card_stats('lead', percentiles, by)
+
+    def cycle_times(self, percentiles=DEFAULT_PERCENTILES, by=None):
+        """Cycle time statistics for done cards, overall or ``by`` ``'member'`` or ``'label'``."""
+        return self._card_stats('cycle', percentiles, by)
+
+    def _card_stats(self, metric, percentiles, by):
+        values = self.card_times()[metric]
+        if by is None:
+            return _grouped_stats(np.zeros(len(values), dtype=np.int32), values, percentiles, ['all'])
+        if by == 'member':
+            pairs, names = self._card_members, self.members.ids
+        elif by == 'label':
+            pairs, names = self._card_labels, self.labels.ids
+        else:
+            raise ValueError('by must be None, "member" or "label", not {!r}'.format(by))
+        cards = np.array(pairs[0], dtype=np.int64)
+        groups = np.array(pairs[1], dtype=np.int32)
+        return _grouped_stats(groups, values[cards], percentiles, names)
+
+class CumulativeFlow(object):
+    """Cards per list at the end of every day, for cumulative flow diagrams.
+
+    Built from an :class:`ActionHistory` (a new one unless ``history`` is
+    given); days run from midnight UTC shifted by ``utc_offset`` seconds.
+    The first :meth:`counts` replays the whole history with a few array
+    operations; after that, actions passed to :meth:`update` are folded in
+    without replaying anything, as long as they are newer than what came
+    before (older ones, e.g. an earlier page of history, cause one more
+    full replay).
+    """
+
+    def __init__(self, history=None, utc_offset=0):
+        self.history = history if history is not None else ActionHistory()
+        self.utc_offset = utc_offset
+        self._folded = None
+        self._latest = None
+        self._first_day = 0
+        self._diff = np.zeros((0, 0), dtype=np.int64)
+        self._state_list = np.zeros(0, dtype=np.int32)
+        self._state_since = np.zeros(0, dtype=np.int64)
+
+    def update(self, actions):
+        self.history.add_actions(actions)
+
+    def counts(self, start=None, end=None, lists=None):
+        """Returns ``(days, list_ids, matrix)``.
+
+        ``days`` is an array of ``datetime64[D]``, ``matrix[d, l]`` the number
+        of cards on list ``list_ids[l]`` at the end of ``days[d]``. ``start``
+        and ``end`` (dates or ``'YYYY-MM-DD'``, inclusive) default to the days
+        of the first and latest actions; ``lists`` picks and orders the lists
+        by id or name.
+        """
+        self._refresh()
+        if self._latest is None:
+            return np.zeros(0, dtype='datetime64[D]'), [], np.zeros((0, 0), dtype=np.int64)
+        first = self._first_day if start is None else _day_number(start)
+        last = self._day(self._latest) if end is None else _day_number(end)
+        days = max(last - self._first_day + 1, 0)
+        width = len(self.history.lists.ids)
+        diff = np.zeros((days + 1, width), dtype=np.int64)
+        rows = min(len(self._diff), days + 1)
+        diff[:rows, :self._diff.shape[1]] = self._diff[:rows]
+        # Visits still in progress count until the end.
+        current = self._state_list >= 0
+        since = np.clip(self._day(self._state_since[current]) - self._first_day, 0, days)
+        diff += np.bincount(since * width + self._state_list[current], minlength=diff.size).reshape(diff.shape)
+        matrix = np.cumsum(diff, axis=0)[:days]
+        if first < self._first_day:
+            matrix = np.concatenate([np.zeros((self._first_day - first, width), dtype=np.int64), matrix])
+        else:
+            matrix = matrix[first - self._first_day:]
+        columns = np.arange(width) if lists is None else self.history._list_codes(lists)
+        list_ids = [self.history.lists.ids[code] for code in columns]
+        dates = np.arange(first, first + len(matrix)).astype('datetime64[D]')
+        return dates, list_ids, matrix[:, columns]
+
+    def wip(self, lists, start=None, end=None):
+        """Returns ``(days, counts)``: the cards on any of ``lists`` at the end of every day."""
+        days, _, matrix = self.counts(start, end, lists)
+        return days, matrix.sum(axis=1)
+
+    def to_csv(self, path_or_file, start=None, end=None, lists=None):
+        days, list_ids, matrix = self.counts(start, end, lists)
+        fd = open(path_or_file, 'w', newline='') if isinstance(path_or_file, str) else path_or_file
+        try:
+            writer = csv.writer(fd)
+            writer.writerow(['date'] + [self.history.list_names.get(list_id, list_id) for list_id in list_ids])
+            for day, row in zip(days, matrix):
+                writer.writerow([str(day)] + row.tolist())
+        finally:
+            if fd is not path_or_file:
+                fd.close()
+
+    def _day(self, times):
+        return (times + self.utc_offset) // DAY
+
+    def _refresh(self):
+        total = len(self.history)
+        if self._folded is None:
+            self._rebuild()
+        elif total > self._folded:
+            raw = self.history._raw(self._folded)
+            if raw[0].min() < self._latest:
+                self._rebuild()
+            else:
+                self._fold(_sorted_events(raw))
+
+    def _rebuild(self):
+        self._latest = None
+        self._diff = np.zeros((0, 0), dtype=np.int64)
+        self._state_list = np.zeros(0, dtype=np.int32)
+        self._state_since = np.zeros(0, dtype=np.int64)
+        self._fold(self.history.columns())
+
+    def _fold(self, events):
+        # Turns the visits that events close into +1/-1 steps on the day they
+        # start and end, and remembers where every card is now. events are
+        # sorted by card and time and all newer than what was folded before.
+        time, card, lists = events['time'], events['card'], events['list']
+        self._folded = len(self.history)
+        if not len(time):
+            return
+        cards = len(self.history.cards.ids)
+        if len(self._state_list) < cards:
+            grow = cards - len(self._state_list)
+            self._state_list = np.concatenate([self._state_list, np.full(grow, -1, dtype=np.int32)])
+            self._state_since = np.concatenate([self._state_since, np.zeros(grow, dtype=np.int64)])
+        first = np.ones(len(card), dtype=bool)
+        first[1:] = card[1:] != card[:-1]
+        last = np.ones(len(card), dtype=bool)
+        last[:-1] = first[1:]
+        previous_time = np.where(first, self._state_since[card], np.roll(time, 1))
+        previous_list = np.where(first, self._state_list[card], np.roll(lists, 1))
+        closed = previous_list >= 0
+        start_days = self._day(previous_time[closed])
+        end_days = self._day(time[closed])
+        self._grow(int(start_days.min(initial=self._day(time.min()))), int(self._day(time.max())))
+        width = self._diff.shape[1]
+        steps = np.bincount((start_days - self._first_day) * width + previous_list[closed], minlength=self._diff.size)
+        steps -= np.bincount((end_days - self._first_day) * width + previous_list[closed], minlength=self._diff.size)
+        self._diff += steps.reshape(self._diff.shape)
+        self._state_list[card[last]] = lists[last]
+        self._state_since[card[last]] = time[last]
+        latest = int(time.max())
+        self._latest = latest if self._latest is None else max(self._latest, latest)
+
+    def _grow(self, first_day, last_day):
+        # Widens the day x list step matrix to cover the days and lists.
+        width = len(self.history.lists.ids)
+        if self._latest is None:
+            self._first_day = first_day
+        first_day = min(first_day, self._first_day)
+        rows = max(last_day, self._first_day + len(self._diff) - 1) - first_day + 2
+        if (rows, width) != self._diff.shape or first_day != self._first_day:
+            diff = np.zeros((rows, width), dtype=np.int64)
+            offset = self._first_day - first_day
+            diff[offset:offset + self._diff.shape[0], :self._diff.shape[1]] = self._diff
+            self._diff, self._first_day = diff, first_day
+
+class _Codes(object):
+    # Dictionary encoding: each distinct id gets the next small integer.
+
+    def __init__(self):
+        self.ids = []
+        self.codes = {}
+
+    def code(self, value):
+        try:
+            return self.codes[value]
+        except KeyError:
+            code = self.codes[value] = len(self.ids)
+            self.ids.append(value)
+            return code
+
+def _transition(action):
+    # (kind, card id, list ref or None) for actions that move a card between
+    # lists, or None for everything else.
+    type = action.get('type')
+    data = action.get('data') or {}
+    card = data.get('card')
+    if card is None:
+        return None
+    if type in CREATE_TYPES:
+        return CREATED, card['id'], data.get('list')
+    if type in LEAVE_TYPES:
+        return LEFT, card['id'], None
+    if type == 'updateCard':
+        if 'listAfter' in data:
+            return MOVED, card['id'], data['listAfter']
+        old = data.get('old') or {}
+        if 'closed' in old:
+            if old['closed']:
+                return RESTORED, card['id'], data.get('list')
+            return LEFT, card['id'], None
+    return None
+
+def _sorted_events(raw):
+    times, seqs, cards, lists, members, kinds = raw
+    order = np.lexsort((seqs, times, cards))
+    return {
+        'time': times[order].astype(np.int64),
+        'card': cards[order],
+        'list': lists[order],
+        'member': members[order],
+        'kind': kinds[order],
+    }
+
+def _day_number(value):
+    if isinstance(value, date):
+        value = value.isoformat()[:10]
+    return int(np.datetime64(value, 'D').astype(np.int64))
+
+def _first(card, time, mask, count):
+    # The time of the first masked event of every card (NaN for none), given
+    # events sorted by card and time.
+    result = np.full(count, np.nan)
+    cards, index = np.unique(card[mask], return_index=True)
+    result[cards] = time[mask][index]
+    return result
+
+def _grouped_stats(groups, values, percentiles, names):
+    keep = ~np.isnan(values)
+    groups, values = groups[keep], values[keep]
+    if not len(values):
+        return {}
+    order = np.lexsort((values, groups))
+    groups, values = groups[order], values[order]
+    starts = np.flatnonzero(np.r_[True, groups[1:] != groups[:-1]])
+    counts = np.diff(np.r_[starts, len(values)])
+    columns = {'count': counts, 'mean': np.add.reduceat(values, starts) / counts}
+    for q in percentiles:
+        # Linear interpolation between the closest ranks, as np.percentile.
+        position = starts + (counts - 1) * (q / 100.0)
+        low = np.floor(position).astype(np.int64)
+        high = np.ceil(position).astype(np.int64)
+        columns['p{:g}'.format(q)] = values[low] + (values[high] - values[low]) * (position - low)
+    stats = {}
+    for row, group in enumerate(groups[starts]):
+        stats[names[group]] = dict((name, column[row].item()) for name, column in columns.items())
+    return stats
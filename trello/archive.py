@@ -0,0 +1,321 @@
+import json
+import os
+import shutil
+import time
+import zlib
+from datetime import date, datetime, timezone
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Columns of every segment, each a .npy file that readers memory-map.
+# Strings are dictionary-encoded: their column holds int32 codes into the
+# segment's dictionaries, with -1 for none.
+STRING_COLUMNS = ('type', 'member', 'card', 'list')
+COLUMNS = ('id', 'time') + STRING_COLUMNS
+
+# Actions buffered by append() before writing segments, and actions per
+# zlib-compressed block of raw JSON.
+SEGMENT_SIZE = 100000
+BLOCK_SIZE = 256
+
+class ActionArchive(object):
+    """An append-only, columnar store of board actions on disk.
+
+    Actions are partitioned by board and month (``<root>/<board>/<YYYY-MM>``)
+    into immutable segments. A segment holds the id, time, type, member,
+    card and list of every action as memory-mapped NumPy columns, with the
+    strings dictionary-encoded, and the actions themselves as
+    zlib-compressed JSON blocks. Queries only open the partitions in their
+    time range, skip segments whose dictionaries lack the values asked for,
+    and read only the columns they filter on or return.
+
+    Appending an action that is already archived does nothing, so
+    overlapping pages can be appended safely. Only one process should append
+    to (or compact) an archive at a time; any number can read. Requires
+    numpy.
+    """
+
+    def __init__(self, root):
+        if np is None:
+            raise ImportError('ActionArchive requires numpy (pip install numpy)')
+        self.root = root
+        self._segments = {}
+
+    def append(self, actions, board=None):
+        """Archives actions, or pages (lists) of actions, and returns how many were new.
+
+        Actions are filed under the board in their ``data``, or ``board`` for
+        those without one. Takes the output of :meth:`Boards.get_action` and
+        friends, or any iterator over it, as is.
+        """
+        written = 0
+        batch = []
+        for item in actions:
+            if isinstance(item, list):
+                batch.extend(item)
+            else:
+                batch.append(item)
+            if len(batch) >= SEGMENT_SIZE:
+                written += self._append_batch(batch, board)
+                batch = []
+        return written + self._append_batch(batch, board)
+
+    def _append_batch(self, actions, board):
+        partitions = {}
+        for action in actions:
+            board_id = _ref(action.get('data') or {}, 'board') or board
+            if board_id is None:
+                raise ValueError('action {} has no board; pass board='.format(action['id']))
+            month = time.strftime('%Y-%m', time.gmtime(int(action['id'][:8], 16)))
+            partitions.setdefault((board_id, month), {})[action['id']] = action
+        written = 0
+        for (board_id, month), found in partitions.items():
+            path = os.path.join(self.root, board_id, month)
+            numbers = _segment_numbers(path)
+            ids = np.array(sorted(found), dtype='S24')
+            for number in self._live(path, numbers):
+                ids = ids[~np.isin(ids, self._segment(path, number).column('id'))]
+            if len(ids):
+                _write_segment(path, max(numbers, default=-1) + 1, [found[action_id.decode()] for action_id in ids])
+                written += len(ids)
+        return written
+
+    def boards(self):
+        if not os.path.isdir(self.root):
+            return []
+        return sorted(name for name in os.listdir(self.root) if os.path.isdir(os.path.join(self.root, name)))
+
+    def query(self, board=None, since=None, before=None, types=None, members=None, cards=None, lists=None, columns=COLUMNS):
+        """Returns the matching actions as a dict of arrays, one per name in ``columns``.
+
+        ``since`` and ``before`` (inclusive and exclusive; seconds, dates,
+        datetimes or ``'YYYY-MM-DD'``) bound the time; ``types``,
+        ``members``, ``cards`` and ``lists`` are collections of values to
+        keep. Ids and strings come back as arrays of ``str`` (``None`` where
+        an action has no such value), times as seconds. Actions are ordered
+        by board and then time.
+        """
+        parts = dict((name, []) for name in columns)
+        partitions, ids, paths = [], [], []
+        for segment, rows in self._scan(board, since, before, types, members, cards, lists):
+            for name in columns:
+                values = segment.column(name)[rows]
+                if name in STRING_COLUMNS:
+                    values = segment.decode(name, values)
+                parts[name].append(values)
+            path = os.path.dirname(segment.path)
+            if not paths or paths[-1] != path:
+                paths.append(path)
+            partitions.append(np.full(len(rows), len(paths)))
+            ids.append(segment.column('id')[rows])
+        if len(ids) > len(paths):
+            # The segments of a partition overlap in time until compacted:
+            # order the rows of each partition by id, and so by time.
+            order = np.lexsort((np.concatenate(ids), np.concatenate(partitions)))
+            parts = dict((name, [np.concatenate(values)[order]]) for name, values in parts.items())
+        result = {}
+        for name, values in parts.items():
+            if not values:
+                result[name] = np.zeros(0, dtype=object if name in STRING_COLUMNS else np.uint32 if name == 'time' else 'S24')
+            else:
+                result[name] = np.concatenate(values)
+            if name == 'id':
+                result[name] = result[name].astype('U24')
+            elif name == 'time':
+                result[name] = result[name].astype(np.int64)
+        return result
+
+    def actions(self, board=None, since=None, before=None, types=None, members=None, cards=None, lists=None):
+        """Yields the matching actions themselves, taking the same filters as :meth:`query`."""
+        for segment, rows in self._scan(board, since, before, types, members, cards, lists):
+            for action in segment.records(rows):
+                yield action
+
+    def count(self, board=None, since=None, before=None, types=None, members=None, cards=None, lists=None):
+        return sum(len(rows) for _, rows in self._scan(board, since, before, types, members, cards, lists))
+
+    def compact(self, board=None):
+        """Merges the segments of each partition into one; returns the number of partitions merged."""
+        merged = 0
+        for board_id in [board] if board is not None else self.boards():
+            for path in self._partitions(board_id, None, None):
+                numbers = _segment_numbers(path)
+                live = self._live(path, numbers)
+                if len(live) < 2:
+                    continue
+                records = []
+                for number in live:
+                    segment = self._segment(path, number)
+                    records.extend(segment.records(np.arange(len(segment))))
+                records.sort(key=lambda action: action['id'])
+                # The merged segment supersedes every older one, so readers
+                # ignore those even if removing them below is interrupted.
+                _write_segment(path, max(numbers) + 1, records, covers=max(numbers))
+                for number in numbers:
+                    self._segments.pop((path, number), None)
+                    shutil.rmtree(os.path.join(path, _segment_name(number)), ignore_errors=True)
+                merged += 1
+        return merged
+
+    def _scan(self, board, since, before, types, members, cards, lists):
+        # Yields (segment, rows) for every segment with matching rows, rows
+        # being an array of row numbers.
+        since = _seconds(since)
+        before = _seconds(before)
+        filters = [(name, values) for name, values in zip(STRING_COLUMNS, (types, members, cards, lists)) if values is not None]
+        for board_id in [board] if board is not None else self.boards():
+            for path in self._partitions(board_id, since, before):
+                for number in self._live(path, _segment_numbers(path)):
+                    segment = self._segment(path, number)
+                    # Rows are sorted by id, and so by time: bisect the
+                    # memory-mapped time column instead of reading it.
+                    start, stop = 0, len(segment)
+                    if since is not None:
+                        start = int(np.searchsorted(segment.column('time'), since, 'left'))
+                    if before is not None:
+                        stop = int(np.searchsorted(segment.column('time'), before, 'left'))
+                    if start >= stop:
+                        continue
+                    mask = None
+                    for name, values in filters:
+                        codes = segment.codes(name, values)
+                        if not len(codes):
+                            break
+                        found = np.isin(segment.column(name)[start:stop], codes)
+                        mask = found if mask is None else mask & found
+                    else:
+                        rows = np.arange(start, stop) if mask is None else start + np.flatnonzero(mask)
+                        if len(rows):
+                            yield segment, rows
+
+    def _partitions(self, board_id, since, before):
+        path = os.path.join(self.root, board_id)
+        if not os.path.isdir(path):
+            return []
+        first = time.strftime('%Y-%m', time.gmtime(since)) if since is not None else None
+        last = time.strftime('%Y-%m', time.gmtime(before - 1)) if before is not None else None
+        months = sorted(name for name in os.listdir(path) if (first is None or name >= first) and (last is None or name <= last))
+        return [os.path.join(path, month) for month in months]
+
+    def _live(self, path, numbers):
+        # Segment numbers minus those a compacted segment superseded.
+        live = []
+        for number in sorted(numbers, reverse=True):
+            live.append(number)
+            # A compacted segment covers every segment numbered below it.
+            if self._segment(path, number).covers is not None:
+                break
+        return live[::-1]
+
+    def _segment(self, path, number):
+        key = (path, number)
+        segment = self._segments.get(key)
+        if segment is None:
+            segment = self._segments[key] = _Segment(os.path.join(path, _segment_name(number)))
+        return segment
+
+class _Segment(object):
+    # One immutable segment: the columns, memory-mapped on first use, the
+    # dictionaries of the string columns and the compressed raw actions.
+
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, 'segment.json')) as fd:
+            meta = json.load(fd)
+        self.count = meta['count']
+        self.covers = meta.get('covers')
+        self.dictionaries = meta['dictionaries']
+        self._columns = {}
+        self._codes = {}
+
+    def __len__(self):
+        return self.count
+
+    def column(self, name):
+        column = self._columns.get(name)
+        if column is None:
+            column = self._columns[name] = np.load(os.path.join(self.path, name + '.npy'), mmap_mode='r')
+        return column
+
+    def codes(self, name, values):
+        # The codes of those values that occur in this segment.
+        codes = self._codes.get(name)
+        if codes is None:
+            codes = self._codes[name] = dict((value, code) for code, value in enumerate(self.dictionaries[name]))
+        return np.array([codes[value] for value in values if value in codes], dtype=np.int32)
+
+    def decode(self, name, codes):
+        # Code -1 picks the None appended at the end.
+        return np.array(self.dictionaries[name] + [None], dtype=object)[codes]
+
+    def records(self, rows):
+        offsets = self.column('offsets')
+        with open(os.path.join(self.path, 'actions.zlib'), 'rb') as fd:
+            block = lines = None
+            for row in rows:
+                if row // BLOCK_SIZE != block:
+                    block = row // BLOCK_SIZE
+                    fd.seek(offsets[block])
+                    lines = zlib.decompress(fd.read(offsets[block + 1] - offsets[block])).split(b'\n')
+                yield json.loads(lines[row % BLOCK_SIZE])
+
+def _write_segment(path, number, actions, covers=None):
+    # Writes the actions, sorted by id, as segment number of the partition at
+    # path. The segment is built in a hidden directory and renamed into place,
+    # so readers never see half of one.
+    tmp = os.path.join(path, '.' + _segment_name(number) + '.tmp')
+    shutil.rmtree(tmp, ignore_errors=True)
+    os.makedirs(tmp)
+    dictionaries = dict((name, {}) for name in STRING_COLUMNS)
+    codes = dict((name, []) for name in STRING_COLUMNS)
+    for action in actions:
+        data = action.get('data') or {}
+        values = (action.get('type'), action.get('idMemberCreator'), _ref(data, 'card'), _ref(data, 'listAfter') or _ref(data, 'list'))
+        for name, value in zip(STRING_COLUMNS, values):
+            if value is None:
+                codes[name].append(-1)
+            else:
+                codes[name].append(dictionaries[name].setdefault(value, len(dictionaries[name])))
+    ids = np.array([action['id'] for action in actions], dtype='S24')
+    np.save(os.path.join(tmp, 'id.npy'), ids)
+    np.save(os.path.join(tmp, 'time.npy'), np.array([int(action_id[:8], 16) for action_id in ids], dtype=np.uint32))
+    for name in STRING_COLUMNS:
+        np.save(os.path.join(tmp, name + '.npy'), np.array(codes[name], dtype=np.int32))
+    offsets = [0]
+    with open(os.path.join(tmp, 'actions.zlib'), 'wb') as fd:
+        for start in range(0, len(actions), BLOCK_SIZE):
+            block = b'\n'.join(json.dumps(action, separators=(',', ':')).encode('utf-8') for action in actions[start:start + BLOCK_SIZE])
+            offsets.append(offsets[-1] + fd.write(zlib.compress(block)))
+    np.save(os.path.join(tmp, 'offsets.npy'), np.array(offsets, dtype=np.int64))
+    meta = {'count': len(actions), 'dictionaries': dict((name, list(values)) for name, values in dictionaries.items())}
+    if covers is not None:
+        meta['covers'] = covers
+    with open(os.path.join(tmp, 'segment.json'), 'w') as fd:
+        json.dump(meta, fd, separators=(',', ':'))
+    os.replace(tmp, os.path.join(path, _segment_name(number)))
+
+def _segment_name(number):
+    return '{:06d}'.format(number)
+
+def _segment_numbers(path):
+    if not os.path.isdir(path):
+        return []
+    return sorted(int(name) for name in os.listdir(path) if name.isdigit())
+
+def _ref(data, key):
+    value = data.get(key)
+    return value.get('id') if isinstance(value, dict) else None
+
+def _seconds(value):
+    if value is None or isinstance(value, (int, float)):
+        return value
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.timestamp()
+    if isinstance(value, date):
+        value = value.isoformat()
+    return int(np.datetime64(value, 's').astype(np.int64))
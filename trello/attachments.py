@@ -0,0 +1,207 @@
+import calendar
+import os
+import re
+import time
+from urllib.parse import urlsplit
+
+import requests
+
+from .concurrency import map_calls
+from .upload import Upload
+
+class CardsAttachments(object):
+    # Mixed into the generated Cards class (see MIXINS in trello_api_gen.py).
+
+    def upload_attachments(self, uploads, concurrency=8, return_exceptions=False, progress=None):
+        """Attach many files to many cards in parallel.
+
+        ``uploads`` is an iterable of ``(card_id_or_shortlink, source)`` or
+        ``(card_id_or_shortlink, source, name)`` tuples, where ``source`` is a
+        path, a binary file object or an :class:`Upload`. Files are streamed,
+        never read into memory whole, and the uploads share the client's
+        connection pool and rate limiters. ``progress``, if given, is called
+        as ``progress(card_id_or_shortlink, bytes_sent, total_bytes)``.
+
+        Yields the new attachments in the order of ``uploads``.
+        """
+        def upload(job):
+            card_id_or_shortlink, source = job[0], job[1]
+            name = job[2] if len(job) > 2 else None
+            if not isinstance(source, Upload):
+                on_progress = None
+                if progress is not None:
+                    on_progress = lambda sent, total: progress(card_id_or_shortlink, sent, total)
+                source = Upload(source, progress=on_progress)
+            try:
+                return self.new_attachment(card_id_or_shortlink, file=source, name=name)
+            finally:
+                source.close()
+
+        return map_calls(upload, uploads, concurrency=concurrency, return_exceptions=return_exceptions)
+
+    def download_attachments(self, card_ids, dest_dir, concurrency=8):
+        """Download the uploaded attachments of ``card_ids`` into ``dest_dir``.
+
+        Files are streamed to ``dest_dir/<card>/<attachment id>-<name>`` in
+        chunks. A file already on disk with the attachment's size and date is
+        skipped, and an interrupted download resumes from its ``.part`` file
+        with an HTTP range request, unless the file changed in the meantime
+        (checked with its ETag or Last-Modified date). Finished files must
+        have the attachment's size. The client's credentials are only sent
+        to Trello's hosts. Returns a :class:`DownloadReport`; a card whose
+        attachments cannot be listed (say, a deleted one) is reported as
+        failed with an attachment id of ``None``.
+        """
+        card_ids = list(card_ids)
+        report = DownloadReport()
+        started = time.monotonic()
+        token = self._token
+        auth = {'Authorization': 'OAuth oauth_consumer_key="{}", oauth_token="{}"'.format(self._apikey, token)}
+        api_host = urlsplit(self._transport.base_url).hostname
+
+        def attachments():
+            listings = map_calls(lambda card: self.get_attachment(card, fields=ATTACHMENT_FIELDS), card_ids, concurrency=concurrency, return_exceptions=True)
+            for card, listing in zip(card_ids, listings):
+                if isinstance(listing, Exception):
+                    report.failed.append((card, None, listing))
+                    continue
+                for attachment in listing:
+                    if attachment.get('isUpload'):
+                        yield card, attachment
+
+        def download(job):
+            card, attachment = job
+            path = os.path.join(dest_dir, str(card), '{}-{}'.format(attachment['id'], _safe_name(attachment['name'])))
+            size = attachment.get('bytes')
+            mtime = _timestamp(attachment.get('date'))
+            if _unchanged(path, size, mtime):
+                return path, 0, False
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            part = path + '.part'
+            # The credentials only go to Trello, never to whatever host an
+            # attachment URL happens to name.
+            headers = dict(auth) if _trusted(attachment['url'], api_host) else {}
+            offset, validator = _resumable(part, size)
+            if offset:
+                # If-Range makes the server send the whole file again if it
+                # changed since the part was started.
+                headers['Range'] = 'bytes={}-'.format(offset)
+                headers['If-Range'] = validator
+            received = 0
+            try:
+                resp = self._transport.stream(attachment['url'], token, headers)
+            except requests.HTTPError as error:
+                # 416: the part already holds the whole file.
+                if not offset or error.response is None or error.response.status_code != 416:
+                    raise
+                resp = None
+            if resp is not None:
+                with resp:
+                    if resp.status_code != 206:
+                        offset = 0
+                    validator = resp.headers.get('ETag') or resp.headers.get('Last-Modified')
+                    _save_validator(part, validator)
+                    with open(part, 'ab' if offset else 'wb') as fd:
+                        for chunk in resp.iter_content(DOWNLOAD_CHUNK_SIZE):
+                            fd.write(chunk)
+                            received += len(chunk)
+            if size is not None and os.path.getsize(part) != size:
+                actual = os.path.getsize(part)
+                _discard(part)
+                raise IOError('downloaded {} bytes of {} for attachment {}, expected {}'.format(actual, attachment['name'], attachment['id'], size))
+            os.replace(part, path)
+            _discard(part)
+            if mtime is not None:
+                os.utime(path, (mtime, mtime))
+            return path, received, True
+
+        # Pair every result with its job so failures can be reported per file.
+        results = map_calls(lambda job: (job, _attempt(download, job)), attachments(), concurrency=concurrency)
+        for (card, attachment), (result, error) in results:
+            if error is not None:
+                report.failed.append((card, attachment['id'], error))
+                continue
+            path, size, fetched = result
+            if fetched:
+                report.downloaded.append(path)
+                report.bytes += size
+            else:
+                report.skipped.append(path)
+        report.seconds = time.monotonic() - started
+        return report
+
+def _attempt(func, job):
+    try:
+        return func(job), None
+    except Exception as error:
+        return None, error
+
+def _safe_name(name):
+    return re.sub(r'[\\/:*?"<>|\x00-\x1f]', '_', name or 'attachment')
+
+def _timestamp(date):
+    if not date:
+        return None
+    return calendar.timegm(time.strptime(date[:19], '%Y-%m-%dT%H:%M:%S'))
+
+def _trusted(url, api_host):
+    host = (urlsplit(url).hostname or '').lower()
+    return host == api_host or any(host == trusted or host.endswith('.' + trusted) for trusted in TRUSTED_DOWNLOAD_HOSTS)
+
+def _resumable(part, size):
+    # (bytes to resume from, validator) for a .part file, or (0, None) if it
+    # has to start over: no part, no validator to check it against, or more
+    # bytes than the attachment has.
+    try:
+        offset = os.path.getsize(part)
+        with open(part + '.validator') as fd:
+            validator = fd.read().strip()
+    except OSError:
+        return 0, None
+    if not offset or not validator or (size is not None and offset > size):
+        return 0, None
+    return offset, validator
+
+def _save_validator(part, validator):
+    if validator:
+        with open(part + '.validator', 'w') as fd:
+            fd.write(validator)
+    elif os.path.exists(part + '.validator'):
+        os.remove(part + '.validator')
+
+def _discard(part):
+    # Removes what is left of a .part file and its validator.
+    for leftover in (part, part + '.validator'):
+        try:
+            os.remove(leftover)
+        except OSError:
+            pass
+
+def _unchanged(path, size, mtime):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return False
+    return size is not None and stat.st_size == size and (mtime is None or int(stat.st_mtime) == mtime)
+
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+ATTACHMENT_FIELDS = 'id,name,url,bytes,date,isUpload'
+# Hosts (and their subdomains) that may receive the client's credentials
+# with a download, besides the API host itself.
+TRUSTED_DOWNLOAD_HOSTS = ('trello.com', 'trellocdn.com', 'trello-attachments.s3.amazonaws.com')
+
+class DownloadReport(object):
+    def __init__(self):
+        self.downloaded = []
+        self.skipped = []
+        self.failed = []
+        self.bytes = 0
+        self.seconds = 0.0
+
+    @property
+    def bytes_per_second(self):
+        return self.bytes / self.seconds if self.seconds else 0.0
+
+    def __repr__(self):
+        return '<DownloadReport downloaded={} skipped={} failed={} {:.1f} MB/s>'.format(
+            len(self.downloaded), len(self.skipped), len(self.failed), self.bytes_per_second / 1e6)
@@ -0,0 +1,55 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from .transport import Transport
+
+# Tokens set with token_scope() for the current thread or asyncio task, keyed
+# by the scope of the client they were set on, so they never reach other
+# clients -- not even clients from the same pool or with the same API key.
+_scoped_tokens = ContextVar('trello_scoped_tokens', default={})
+
+@contextmanager
+def token_scope(scope, token):
+    scoped = dict(_scoped_tokens.get())
+    scoped[scope] = token
+    reset = _scoped_tokens.set(scoped)
+    try:
+        yield
+    finally:
+        _scoped_tokens.reset(reset)
+
+class ApiResource(object):
+    __module__ = 'trello'
+
+    def __init__(self, apikey, token=None, transport=None, scope=None):
+        self._apikey = apikey
+        self._default_token = token
+        self._transport = transport if transport is not None else Transport()
+        self._scope = scope if scope is not None else object()
+
+    @property
+    def _token(self):
+        return _scoped_tokens.get().get(self._scope, self._default_token)
+
+    @_token.setter
+    def _token(self, token):
+        self._default_token = token
+
+    def _request(self, method, path, path_args, params=None, data=None):
+        return self._transport.request(method, path, path_args, params=params, data=data)
+
+class resource_property(object):
+    # Builds the resource the first time it is accessed on a client, so a
+    # client only pays for the resources it actually uses.
+
+    def __init__(self, cls):
+        self.cls = cls
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, api, owner=None):
+        if api is None:
+            return self
+        resource = api.__dict__[self.name] = self.cls(api._apikey, api._token, api._transport, api._scope)
+        return resource
@@ -1,15 +1,8 @@
-import json
-import requests
+from .base import ApiResource
 
-class Batches(object):
+class Batches(ApiResource):
     __module__ = 'trello'
 
-    def __init__(self, apikey, token=None):
-        self._apikey = apikey
-        self._token = token
-
     def get(self, urls):
-        resp = requests.get("https://trello.com/1/batch".format(), params={"key": self._apikey, "token": self._token, "urls": urls}, data=None)
-        resp.raise_for_status()
-        return json.loads(resp.text)
+        return self._request("get", "/1/batch", [], params={"key": self._apikey, "token": self._token, "urls": urls}, data=None)
 
@@ -0,0 +1,50 @@
+import threading
+import time
+from collections import OrderedDict
+
+class ResponseCache(object):
+    """LRU cache of raw GET response bodies with a time-to-live.
+
+    Keys include the user token, so clients for different users sharing one
+    cache never see each other's responses.
+    """
+
+    def __init__(self, maxsize=1024, ttl=30.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(token, url, params):
+        return (token, url, tuple(sorted((k, str(v)) for k, v in params.items() if k not in ('key', 'token'))))
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, content = entry
+            if expires < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return content
+
+    def set(self, key, content):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, content)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, token=None):
+        with self._lock:
+            if token is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if key[0] == token]:
+                del self._entries[key]
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,128 @@
+import threading
+import time
+
+import requests
+
+from .timeouts import DeadlineExceeded
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half-open'
+
+# What a call says about the health of its endpoint.
+SUCCESS = 'success'
+FAILURE = 'failure'
+NEUTRAL = 'neutral'
+
+class CircuitOpenError(requests.exceptions.RequestException):
+    """Raised without sending anything while an endpoint's breaker is open."""
+
+    def __init__(self, endpoint, retry_after):
+        super(CircuitOpenError, self).__init__('circuit open for {}; retry in {:.1f}s'.format(endpoint, retry_after))
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+
+class CircuitBreaker(object):
+    """Fails fast after an endpoint keeps failing, then probes for recovery.
+
+    ``failure_threshold`` consecutive failures -- server errors, connection
+    errors and timeouts, or calls slower than ``latency_threshold`` seconds if
+    one is set -- open the breaker. While open, calls raise
+    :class:`CircuitOpenError` immediately. After ``reset_timeout`` seconds up
+    to ``half_open_calls`` probe calls are let through; a success closes the
+    breaker again and a failure re-opens it. Calls that say nothing about
+    the endpoint's health (see :func:`outcome`) change neither, but give
+    their probe slot back.
+    """
+
+    def __init__(self, endpoint, failure_threshold=5, reset_timeout=30.0, latency_threshold=None, half_open_calls=1):
+        self.endpoint = endpoint
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.latency_threshold = latency_threshold
+        self.half_open_calls = half_open_calls
+        self.state = CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+        self._lock = threading.Lock()
+
+    def allow(self):
+        with self._lock:
+            if self.state == CLOSED:
+                return
+            now = time.monotonic()
+            if self.state == OPEN:
+                remaining = self._opened_at + self.reset_timeout - now
+                if remaining > 0:
+                    raise CircuitOpenError(self.endpoint, remaining)
+                self.state = HALF_OPEN
+                self._probes = 0
+            if self._probes >= self.half_open_calls:
+                raise CircuitOpenError(self.endpoint, self.reset_timeout)
+            self._probes += 1
+
+    def record(self, result, elapsed=0.0):
+        # result is SUCCESS, FAILURE or NEUTRAL, e.g. from outcome().
+        if result == SUCCESS and self.latency_threshold is not None and elapsed > self.latency_threshold:
+            result = FAILURE
+        with self._lock:
+            if result == NEUTRAL:
+                if self.state == HALF_OPEN and self._probes:
+                    self._probes -= 1
+                return
+            if result == SUCCESS:
+                self.state = CLOSED
+                self.failures = 0
+                return
+            self.failures += 1
+            if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = OPEN
+                self._opened_at = time.monotonic()
+
+class CircuitBreakers(object):
+    """One :class:`CircuitBreaker` per endpoint template, created on demand.
+
+    Pass as ``breakers`` to :class:`trello.transport.Transport`; an outage of
+    one endpoint (say ``GET /1/search``) then fails fast on its own while the
+    others keep their full throughput. ``family``, if given, maps an endpoint
+    template to the key to group breakers by instead.
+    """
+
+    def __init__(self, family=None, **options):
+        self.family = family
+        self.options = options
+        self._breakers = {}
+        self._lock = threading.Lock()
+
+    def get(self, endpoint):
+        key = self.family(endpoint) if self.family is not None else endpoint
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.get(key)
+                if breaker is None:
+                    breaker = self._breakers[key] = CircuitBreaker(key, **self.options)
+        return breaker
+
+    def states(self):
+        return dict((key, breaker.state) for key, breaker in self._breakers.items())
+
+def outcome(error):
+    # What a call that raised error (None if it did not) says about its
+    # endpoint: server errors, connection errors and timeouts are failures;
+    # an answer, even a 4xx, is a success; being over quota (429), the
+    # caller's deadline running out or anything else that went wrong on our
+    # side is neutral.
+    if error is None:
+        return SUCCESS
+    if isinstance(error, DeadlineExceeded):
+        return NEUTRAL
+    if isinstance(error, requests.exceptions.HTTPError):
+        status = error.response.status_code if error.response is not None else None
+        if status is None or status == 429:
+            return NEUTRAL
+        return FAILURE if status >= 500 else SUCCESS
+    if isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+        return FAILURE
+    return NEUTRAL
@@ -0,0 +1,61 @@
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
+
+from .diagnostics import submission_context
+
+DEFAULT_CONCURRENCY = 32
+
+def map_calls(func, items, concurrency=DEFAULT_CONCURRENCY, ordered=True, return_exceptions=False, **kwargs):
+    """Call ``func(item, **kwargs)`` for every item on a bounded thread pool.
+
+    Yields results in input order, or ``(item, result)`` pairs as they
+    complete when ``ordered`` is false. Items are pulled from ``items`` lazily,
+    so at most a couple of windows of work are ever queued. A failed call
+    raises from the iterator unless ``return_exceptions`` is true, in which
+    case the exception is yielded in place of the result. Closing the iterator
+    (or breaking out of the loop) cancels everything not yet started.
+
+    Each call runs in a copy of the caller's context, so a token set with
+    :meth:`TrelloApi.as_token` applies to the worker threads too.
+    """
+    items = iter(items)
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='trello-map')
+    pending = deque() if ordered else {}
+
+    def submit(batch):
+        for item in batch:
+            future = executor.submit(submission_context().run, func, item, **kwargs)
+            if ordered:
+                pending.append(future)
+            else:
+                pending[future] = item
+
+    try:
+        if ordered:
+            # Keep a second window queued so a slow item at the head does not
+            # leave the workers idle while we wait for it.
+            submit(islice(items, 2 * concurrency))
+            while pending:
+                future = pending.popleft()
+                submit(islice(items, 1))
+                yield _outcome(future, return_exceptions)
+        else:
+            submit(islice(items, concurrency))
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    item = pending.pop(future)
+                    submit(islice(items, 1))
+                    yield item, _outcome(future, return_exceptions)
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+def _outcome(future, return_exceptions):
+    if return_exceptions:
+        error = future.exception()
+        if error is not None:
+            return error
+    return future.result()
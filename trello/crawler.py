@@ -0,0 +1,203 @@
+import queue
+import random
+import threading
+import time
+from collections import deque
+
+from .diagnostics import submission_context
+
+CRAWL_ENTITIES = ('lists', 'cards', 'checklists', 'actions')
+ACTIONS_PAGE_SIZE = 1000
+
+class OrganizationCrawler(object):
+    """Crawls every board of an organization on a work-stealing thread pool.
+
+    Boards are split into small units of work -- the board's lists, each
+    list's cards, the board's checklists and time ranges of its actions --
+    so one huge board keeps every worker busy instead of one. An actions
+    range that fills a whole page is split in two by time and the halves are
+    crawled in parallel. Workers take their newest unit first and steal the
+    oldest unit of another worker when they run dry. All requests go through
+    the client's transport, so they share its rate limiters (and
+    ``limiter``, a :class:`trello.ratelimit.RateLimiter`, if given); with
+    enough workers the crawl is bound by the quota rather than by the
+    largest board. Workers run in a copy of the context ``crawl()`` is
+    iterated in, so :meth:`trello.TrelloApi.as_token`, ``timeout`` and
+    ``deadline`` around the loop apply to their requests too.
+
+        >>> crawler = OrganizationCrawler(api, workers=16)
+        >>> for entity, record in crawler.crawl('acme'):
+        ...     store(entity, record)
+    """
+
+    def __init__(self, api, workers=16, entities=CRAWL_ENTITIES, action_slices=4, limiter=None, buffer=10000):
+        self.api = api
+        self.workers = workers
+        self.entities = entities
+        self.action_slices = action_slices
+        self.limiter = limiter
+        self.buffer = buffer
+        self.stats = {'units': 0, 'steals': 0, 'requests': 0}
+        self._lock = threading.Lock()
+
+    def crawl(self, idOrg_or_name, board_filter='all'):
+        """Yields ``(entity, record)`` for the boards of the organization and everything on them."""
+        boards = self._call(self.api.organizations.get_board, idOrg_or_name, filter=board_filter)
+        results = queue.Queue(maxsize=self.buffer)
+        pool = _WorkStealingPool(self.workers, results, self.stats, submission_context())
+        for board in boards:
+            yield 'boards', board
+            pool.submit(lambda emit, spawn, board_id=board['id']: self._board(board_id, emit, spawn))
+        pool.start()
+        try:
+            while True:
+                item = results.get()
+                if item is _DONE:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            pool.stop()
+
+    def _call(self, method, *args, **kwargs):
+        if self.limiter is not None:
+            self.limiter.acquire()
+        with self._lock:
+            self.stats['requests'] += 1
+        return method(*args, **kwargs)
+
+    def _board(self, board_id, emit, spawn):
+        if 'lists' in self.entities or 'cards' in self.entities:
+            spawn(lambda emit, spawn: self._lists(board_id, emit, spawn))
+        if 'checklists' in self.entities:
+            spawn(lambda emit, spawn: self._emit_all('checklists', self._call(self.api.boards.get_checklist, board_id), emit))
+        if 'actions' in self.entities:
+            # Trello ids start with their creation time, so no action on a
+            # board is older than the board itself.
+            start, end = int(board_id[:8], 16), int(time.time()) + 1
+            step = max((end - start) // self.action_slices, 1)
+            for since in range(start, end, step):
+                spawn(lambda emit, spawn, since=since: self._actions(board_id, since, _id_at(min(since + step, end)), emit, spawn))
+
+    def _lists(self, board_id, emit, spawn):
+        lists = self._call(self.api.boards.get_list, board_id, filter='all')
+        if 'lists' in self.entities:
+            self._emit_all('lists', lists, emit)
+        if 'cards' in self.entities:
+            for item in lists:
+                spawn(lambda emit, spawn, list_id=item['id']: self._emit_all('cards', self._call(self.api.lists.get_card, list_id, filter='all'), emit))
+
+    def _actions(self, board_id, since, before, emit, spawn):
+        # Actions of board_id newer than the second since and older than the
+        # id before, newest first.
+        while True:
+            page = self._call(self.api.boards.get_action, board_id, filter='all', limit=ACTIONS_PAGE_SIZE, since=_id_at(since), before=before)
+            self._emit_all('actions', page, emit)
+            if len(page) < ACTIONS_PAGE_SIZE:
+                return
+            before = page[-1]['id']
+            end = int(before[:8], 16)
+            if end - since >= 2:
+                break
+            # Too narrow to split; keep paging through it here.
+        middle = (since + end) // 2
+        spawn(lambda emit, spawn: self._actions(board_id, since, _id_at(middle), emit, spawn))
+        spawn(lambda emit, spawn: self._actions(board_id, middle, before, emit, spawn))
+
+    def _emit_all(self, entity, records, emit):
+        for record in records:
+            emit((entity, record))
+
+def _id_at(seconds):
+    # The smallest possible id created at the given second, usable as a
+    # before/since bound.
+    return '{:08x}{}'.format(seconds, '0' * 16)
+
+_DONE = object()
+
+class _WorkStealingPool(object):
+    # One deque of units per worker. A worker pushes the units it spawns onto
+    # its own deque and pops the newest, which keeps a board's work together;
+    # an idle worker steals the oldest unit from a random other worker, which
+    # tends to be a big one. Results and errors go to the results queue,
+    # followed by _DONE once everything has finished. Every worker runs in
+    # its own copy of context (one context cannot be entered by two threads).
+
+    def __init__(self, workers, results, stats, context):
+        self.results = results
+        self.stats = stats
+        self._deques = [deque() for _ in range(workers)]
+        self._next = 0
+        self._pending = 0
+        self._stopped = False
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._threads = [threading.Thread(target=context.copy().run, args=(self._run, index), name='trello-crawl-{}'.format(index), daemon=True) for index in range(workers)]
+
+    def submit(self, unit):
+        with self._lock:
+            index = getattr(self._local, 'index', None)
+            if index is None:
+                index = self._next = (self._next + 1) % len(self._deques)
+            self._deques[index].append(unit)
+            self._pending += 1
+            self.stats['units'] += 1
+            self._wakeup.notify()
+
+    def start(self):
+        # results.put() may block on a full queue, so never under the lock.
+        with self._lock:
+            idle = not self._pending
+        if idle:
+            self.results.put(_DONE)
+            return
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self):
+        with self._lock:
+            self._stopped = True
+            self._wakeup.notify_all()
+
+    def _take(self, index):
+        own = self._deques[index]
+        if own:
+            return own.pop()
+        others = [i for i in range(len(self._deques)) if i != index and self._deques[i]]
+        if others:
+            self.stats['steals'] += 1
+            return self._deques[random.choice(others)].popleft()
+        return None
+
+    def _run(self, index):
+        self._local.index = index
+        while True:
+            with self._lock:
+                unit = self._take(index)
+                while unit is None and self._pending and not self._stopped:
+                    self._wakeup.wait()
+                    unit = self._take(index)
+                if unit is None or self._stopped:
+                    return
+            try:
+                unit(self._emit, self.submit)
+            except BaseException as error:
+                self.stop()
+                self.results.put(error)
+            with self._lock:
+                self._pending -= 1
+                finished = not self._pending
+                if finished:
+                    self._wakeup.notify_all()
+            if finished:
+                self.results.put(_DONE)
+
+    def _emit(self, item):
+        while not self._stopped:
+            try:
+                self.results.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
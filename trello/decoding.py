@@ -0,0 +1,66 @@
+import json
+import sys
+import weakref
+
+# Distinct id strings kept for sharing before the table starts over.
+MAX_STRINGS = 1000000
+
+class SharedDecoder(object):
+    """Decodes responses so that repeated objects and ids are stored once.
+
+    Given to a :class:`trello.transport.Transport` as ``decoder``, it
+    replaces ``json.loads``. Keys are interned; ids (the values of ``id``
+    and ``id*`` keys, including lists like ``idMembers``) are shared
+    through a table of up to ``MAX_STRINGS`` strings. Objects with an
+    ``id`` are kept in an identity map of weak references: an object equal
+    to one decoded before, such as a member embedded in every card of a
+    board, is replaced by that one, so it exists once however many cards
+    and responses refer to it, and is freed once none do.
+
+    Shared objects are shared: treat decoded responses as read-only, or
+    copy an object before changing it. Decoding takes somewhat longer than
+    with ``json.loads``.
+    """
+
+    def __init__(self, max_strings=MAX_STRINGS):
+        self.max_strings = max_strings
+        self._objects = weakref.WeakValueDictionary()
+        self._strings = {}
+
+    def __call__(self, content):
+        return json.loads(content, object_pairs_hook=self._object)
+
+    def __len__(self):
+        return len(self._objects)
+
+    def _object(self, pairs):
+        obj = _Object()
+        for key, value in pairs:
+            if key[:2] == 'id':
+                if isinstance(value, str):
+                    value = self._string(value)
+                elif isinstance(value, list):
+                    value = [self._string(item) if isinstance(item, str) else item for item in value]
+            obj[sys.intern(key)] = value
+        id = obj.get('id')
+        if not isinstance(id, str):
+            return obj
+        shared = self._objects.get(id)
+        if shared is not None and shared == obj:
+            return shared
+        # New, or changed since: the latest version is the one shared.
+        self._objects[id] = obj
+        return obj
+
+    def _string(self, value):
+        strings = self._strings
+        shared = strings.get(value)
+        if shared is None:
+            if len(strings) >= self.max_strings:
+                strings.clear()
+            shared = strings[value] = value
+        return shared
+
+class _Object(dict):
+    # Plain dicts cannot be weakly referenced.
+    __slots__ = ('__weakref__',)
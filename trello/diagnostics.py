@@ -0,0 +1,156 @@
+import atexit
+import contextvars
+import os
+import random
+import sys
+import sysconfig
+import threading
+import time
+from collections import deque
+
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__)) + os.sep
+_STDLIB_DIR = os.path.abspath(sysconfig.get_paths()['stdlib']) + os.sep
+
+# Where work running on a worker thread was submitted from.
+_submitted_from = contextvars.ContextVar('trello_submitted_from', default=None)
+
+# What to call instead of issuing one of these requests per entity.
+ALTERNATIVES = {
+    'GET /1/cards/{}': "Boards.get_card(board_id, ...) or Lists.get_card(list_id, ...) fetch every card of a board or list at once",
+    'GET /1/cards/{}/members': "Boards.get_card(board_id, members='true') embeds each card's members",
+    'GET /1/cards/{}/checklists': "Boards.get_card(board_id, checklists='all') or Boards.get_checklist(board_id)",
+    'GET /1/cards/{}/attachments': "Boards.get_card(board_id, attachments='true')",
+    'GET /1/cards/{}/actions': "Boards.get_action(board_id, filter=...) returns the actions of every card on the board",
+    'GET /1/cards/{}/stickers': "Boards.get_card(board_id, stickers='true')",
+    'GET /1/cards/{}/checkItemStates': "Boards.get_card(board_id, checkItemStates='true')",
+    'GET /1/cards/{}/list': "Boards.get_list(board_id) once, then look lists up by card['idList']",
+    'GET /1/cards/{}/board': "Boards.get(board_id) once, then look boards up by card['idBoard']",
+    'GET /1/lists/{}': "Boards.get_list(board_id) fetches every list of the board",
+    'GET /1/lists/{}/cards': "Boards.get_card(board_id) or Boards.get_list(board_id, cards='open')",
+    'GET /1/checklists/{}': "Boards.get_checklist(board_id) or Cards.get_checklist(card_id)",
+    'GET /1/labels/{}': "Boards.get_label(board_id) fetches every label of the board",
+    'GET /1/members/{}': "Boards.get_member(board_id) or Organizations.get_member(idOrg), or members='true' on the parent call",
+    'GET /1/boards/{}': "Organizations.get_board(idOrg) or Members.get_board('me') fetch all boards at once",
+    'GET /1/boards/{}/lists': "Organizations.get_board(idOrg, lists='open') embeds each board's lists",
+    'GET /1/actions/{}': "Boards.get_action(board_id) or Cards.get_action(card_id)",
+}
+BATCH_ALTERNATIVE = 'Batches.get(urls=...) combines up to 10 GET requests into one call'
+
+class _Site(object):
+    __slots__ = ('calls', 'recent', 'peak', 'first', 'last')
+
+    def __init__(self, now):
+        self.calls = 0
+        self.recent = deque()
+        self.peak = 0
+        self.first = now
+        self.last = now
+
+class CallSiteProfiler(object):
+    """Finds code that issues many same-shape requests (N+1 patterns).
+
+    Pass one as ``profiler`` to :class:`trello.transport.Transport`. Calls are
+    grouped by the first stack frame outside this package and the standard
+    library (for calls from the worker threads of :func:`trello.map_calls`
+    and :class:`trello.crawler.OrganizationCrawler`, the code that submitted
+    the work) and by endpoint template; a call site that makes at least
+    ``threshold`` calls to one endpoint within ``window`` seconds is
+    flagged, together with the nested parameter or batch call that would
+    replace it. Only ``sample_rate`` of calls are inspected (counts are
+    scaled back up), so it is cheap enough to leave on in staging.
+    """
+
+    def __init__(self, sample_rate=1.0, window=10.0, threshold=20):
+        self.sample_rate = sample_rate
+        self.window = window
+        self.threshold = threshold
+        self._sites = {}
+        self._lock = threading.Lock()
+
+    def observe(self, call):
+        if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            return
+        key = (_call_site(), call.endpoint)
+        now = time.monotonic()
+        with self._lock:
+            site = self._sites.get(key)
+            if site is None:
+                site = self._sites[key] = _Site(now)
+            site.calls += 1
+            site.last = now
+            recent = site.recent
+            recent.append(now)
+            while recent[0] < now - self.window:
+                recent.popleft()
+            if len(recent) > site.peak:
+                site.peak = len(recent)
+
+    def report(self):
+        """Returns the call sites, busiest first, as a list of dicts."""
+        scale = 1.0 / self.sample_rate
+        with self._lock:
+            items = [(key, site.calls, site.peak, site.last - site.first) for key, site in self._sites.items()]
+        rows = []
+        for (location, endpoint), calls, peak, span in items:
+            flagged = peak * scale >= self.threshold
+            suggestion = None
+            if flagged:
+                suggestion = ALTERNATIVES.get(endpoint, BATCH_ALTERNATIVE if endpoint.startswith('GET ') else None)
+            rows.append({
+                'call_site': location,
+                'endpoint': endpoint,
+                'calls': int(round(calls * scale)),
+                'peak_per_window': int(round(peak * scale)),
+                'seconds': span,
+                'flagged': flagged,
+                'suggestion': suggestion,
+            })
+        rows.sort(key=lambda row: (not row['flagged'], -row['calls']))
+        return rows
+
+    def format_report(self, limit=20):
+        rows = self.report()[:limit]
+        if not rows:
+            return 'No Trello API calls recorded.\n'
+        lines = ['Trello API calls by call site (window {:g}s, threshold {}):'.format(self.window, self.threshold)]
+        for row in rows:
+            lines.append('{:>7} calls  peak {:>5}/window  {}{}  {}'.format(
+                row['calls'], row['peak_per_window'], '[N+1] ' if row['flagged'] else '', row['endpoint'], row['call_site']))
+            if row['suggestion']:
+                lines.append('         -> {}'.format(row['suggestion']))
+        return '\n'.join(lines) + '\n'
+
+    def report_at_exit(self, path=None):
+        # Write the ranked report to path (or stderr) when the process exits.
+        def write():
+            text = self.format_report()
+            if path is None:
+                sys.stderr.write(text)
+            else:
+                with open(path, 'w') as fd:
+                    fd.write(text)
+        atexit.register(write)
+        return self
+
+def submission_context():
+    # A copy of the current context to run work on another thread with (see
+    # map_calls and the crawler), remembering the call site that submitted the work for calls
+    # made from there.
+    context = contextvars.copy_context()
+    context.run(_submitted_from.set, _call_site())
+    return context
+
+def _call_site():
+    frame = sys._getframe(1)
+    while frame is not None and _is_internal(frame.f_code.co_filename):
+        frame = frame.f_back
+    if frame is None:
+        # Only this package and the standard library on the stack: a worker
+        # thread, which the call site that submitted the work is blamed for.
+        return _submitted_from.get() or '<unknown>'
+    return '{}:{} in {}'.format(frame.f_code.co_filename, frame.f_lineno, frame.f_code.co_name)
+
+def _is_internal(filename):
+    if filename.startswith(_PACKAGE_DIR):
+        return True
+    return filename.startswith(_STDLIB_DIR) and 'site-packages' not in filename and 'dist-packages' not in filename
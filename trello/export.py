@@ -0,0 +1,221 @@
+import json
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from .pool import KEY_RATE, TOKEN_RATE
+from .ratelimit import KeyedRateLimiter, RateLimiter
+from .transport import Transport
+
+EXPORT_ENTITIES = ('lists', 'cards', 'checklists', 'actions')
+ACTIONS_PAGE_SIZE = 1000
+PARQUET_BATCH_SIZE = 10000
+# A worker retries a request rejected with 429 at least this many times.
+EXPORT_RETRIES = 3
+
+class OrganizationsExport(object):
+    # Mixed into the generated Organizations class (see MIXINS in
+    # trello_api_gen.py).
+
+    def export(self, idOrg_or_name, dest, format='ndjson', workers=4, entities=EXPORT_ENTITIES, board_filter='all'):
+        """Export every board of an organization to ``dest``.
+
+        Boards are crawled in parallel worker processes. A worker fetches a
+        board's lists, cards and checklists with one request each and its
+        actions page by page, writing them to disk as they arrive. The
+        workers split the client's per-key and per-token rate limits between
+        them and retry 429s. With ``format='ndjson'`` each entity
+        type ends up in its own ``<entity>.ndjson`` file; with
+        ``format='parquet'`` (requires pyarrow) each entity type gets a
+        directory with one Parquet file per board. Progress is checkpointed
+        after every board, so running the same export again resumes where an
+        interrupted one stopped.
+        """
+        if format not in ('ndjson', 'parquet'):
+            raise ValueError('format must be "ndjson" or "parquet", not {!r}'.format(format))
+        if format == 'parquet':
+            _require_pyarrow()
+        state_dir = os.path.join(dest, '.export')
+        os.makedirs(state_dir, exist_ok=True)
+        checkpoint = _Checkpoint(os.path.join(state_dir, 'checkpoint.json'))
+        checkpoint.restore(dest, entities, format)
+
+        boards = self.get_board(idOrg_or_name, filter=board_filter)
+        _write_entity(dest, 'boards', boards, format)
+        todo = [board['id'] for board in boards if board['id'] not in checkpoint.done]
+
+        workers = max(min(workers, len(todo)), 1)
+        job = (self._apikey, self._token, self._transport.base_url, entities, format, _worker_limits(self._transport, workers))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_export_board, job, board_id, os.path.join(state_dir, board_id)) for board_id in todo]
+            for future in as_completed(futures):
+                board_id, part_dir = future.result()
+                if format == 'ndjson':
+                    for entity in entities:
+                        _append_part(os.path.join(dest, entity + '.ndjson'), os.path.join(part_dir, entity + '.ndjson'))
+                else:
+                    for entity in entities:
+                        os.makedirs(os.path.join(dest, entity), exist_ok=True)
+                        os.replace(os.path.join(part_dir, entity + '.parquet'), os.path.join(dest, entity, board_id + '.parquet'))
+                checkpoint.mark_done(board_id, dest, entities, format)
+                shutil.rmtree(part_dir, ignore_errors=True)
+        shutil.rmtree(state_dir, ignore_errors=True)
+        return dict((entity, _entity_path(dest, entity, format)) for entity in ('boards',) + tuple(entities))
+
+def _export_board(job, board_id, part_dir):
+    # Runs in a worker process, so it builds its own client from plain values.
+    from . import TrelloApi
+    apikey, token, base_url, entities, format, limits = job
+    key_rate, token_rate, retries, timeout = limits
+    transport = Transport(base_url, key_limiter=RateLimiter(*key_rate), token_limiters=KeyedRateLimiter(*token_rate), retries=retries, timeout=timeout)
+    api = TrelloApi(apikey, token, transport=transport)
+    os.makedirs(part_dir, exist_ok=True)
+    for entity in entities:
+        path = os.path.join(part_dir, entity + '.ndjson')
+        with open(path, 'w') as fd:
+            for record in _fetch(api, entity, board_id):
+                fd.write(json.dumps(record, separators=(',', ':')))
+                fd.write('\n')
+        if format == 'parquet':
+            _ndjson_to_parquet(path, os.path.join(part_dir, entity + '.parquet'))
+            os.remove(path)
+    api._transport.close()
+    return board_id, part_dir
+
+def _worker_limits(transport, workers):
+    # Each worker process gets its own transport, so the quotas the client's
+    # limiters enforce (or Trello's, without them) are split between them.
+    key_rate = (transport.key_limiter.rate, transport.key_limiter.per) if transport.key_limiter is not None else KEY_RATE
+    token_rate = (transport.token_limiters.rate, transport.token_limiters.per) if transport.token_limiters is not None else TOKEN_RATE
+    return ((key_rate[0] / workers, key_rate[1]), (token_rate[0] / workers, token_rate[1]), max(transport.retries, EXPORT_RETRIES), transport.timeout)
+
+def _fetch(api, entity, board_id):
+    if entity == 'lists':
+        return api.boards.get_list(board_id, filter='all')
+    if entity == 'cards':
+        return api.boards.get_card(board_id, filter='all')
+    if entity == 'checklists':
+        return api.boards.get_checklist(board_id)
+    if entity == 'actions':
+        return _iter_actions(api, board_id)
+    raise ValueError('cannot export {!r}'.format(entity))
+
+def _iter_actions(api, board_id):
+    before = None
+    while True:
+        page = api.boards.get_action(board_id, filter='all', limit=ACTIONS_PAGE_SIZE, before=before)
+        for action in page:
+            yield action
+        if len(page) < ACTIONS_PAGE_SIZE:
+            return
+        before = page[-1]['id']
+
+def _entity_path(dest, entity, format):
+    return os.path.join(dest, entity + '.ndjson') if format == 'ndjson' else os.path.join(dest, entity)
+
+def _write_entity(dest, entity, records, format):
+    path = os.path.join(dest, entity + '.ndjson')
+    with open(path, 'w') as fd:
+        for record in records:
+            fd.write(json.dumps(record, separators=(',', ':')))
+            fd.write('\n')
+    if format == 'parquet':
+        os.makedirs(os.path.join(dest, entity), exist_ok=True)
+        _ndjson_to_parquet(path, os.path.join(dest, entity, entity + '.parquet'))
+        os.remove(path)
+
+def _append_part(path, part):
+    with open(path, 'ab') as out, open(part, 'rb') as fd:
+        shutil.copyfileobj(fd, out)
+
+class _Checkpoint(object):
+    # Records finished boards together with the size of every NDJSON file at
+    # that point, so a resumed export can cut off a half-appended board.
+
+    def __init__(self, path):
+        self.path = path
+        self.done = set()
+        self.sizes = {}
+
+    def restore(self, dest, entities, format):
+        if os.path.exists(self.path):
+            with open(self.path) as fd:
+                state = json.load(fd)
+            self.done = set(state['done'])
+            self.sizes = state['sizes']
+        if format == 'ndjson':
+            for entity in entities:
+                path = os.path.join(dest, entity + '.ndjson')
+                with open(path, 'ab') as fd:
+                    fd.truncate(self.sizes.get(entity, 0))
+
+    def mark_done(self, board_id, dest, entities, format):
+        self.done.add(board_id)
+        if format == 'ndjson':
+            for entity in entities:
+                self.sizes[entity] = os.path.getsize(os.path.join(dest, entity + '.ndjson'))
+        tmp = self.path + '.tmp'
+        with open(tmp, 'w') as fd:
+            json.dump({'done': sorted(self.done), 'sizes': self.sizes}, fd)
+            fd.flush()
+            os.fsync(fd.fileno())
+        os.replace(tmp, self.path)
+
+def _require_pyarrow():
+    try:
+        import pyarrow.parquet  # noqa: F401
+    except ImportError:
+        raise ImportError('exporting to Parquet requires pyarrow (pip install pyarrow)')
+
+def _ndjson_to_parquet(src, dest):
+    # Two passes over the NDJSON part keep memory bounded: the first settles
+    # one schema for the whole file, the second writes it in batches. Nested
+    # values are stored as JSON text.
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    kinds = {}
+    with open(src) as fd:
+        for line in fd:
+            for key, value in json.loads(line).items():
+                kinds.setdefault(key, set()).add(_kind(value))
+    schema = pa.schema([(key, _arrow_type(pa, kinds[key])) for key in sorted(kinds)])
+    with pq.ParquetWriter(dest, schema) as writer, open(src) as fd:
+        batch = []
+        for line in fd:
+            batch.append(_flatten(json.loads(line), schema))
+            if len(batch) >= PARQUET_BATCH_SIZE:
+                writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+                batch = []
+        if batch or not schema:
+            writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+
+def _kind(value):
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        return 'bool'
+    if isinstance(value, (int, float)):
+        return 'float' if isinstance(value, float) else 'int'
+    if isinstance(value, str):
+        return 'str'
+    return 'json'
+
+def _arrow_type(pa, kinds):
+    kinds = kinds - set([None])
+    if kinds == set(['bool']):
+        return pa.bool_()
+    if kinds == set(['int']):
+        return pa.int64()
+    if kinds and kinds <= set(['int', 'float']):
+        return pa.float64()
+    return pa.string()
+
+def _flatten(record, schema):
+    row = {}
+    for field in schema:
+        value = record.get(field.name)
+        if value is not None and str(field.type) == 'string' and not isinstance(value, str):
+            value = json.dumps(value, separators=(',', ':'))
+        row[field.name] = value
+    return row
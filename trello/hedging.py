@@ -0,0 +1,56 @@
+import threading
+from collections import deque
+
+class HedgePolicy(object):
+    """Decides when a slow GET gets a second, hedged attempt.
+
+    Keeps the last ``window`` latencies of every endpoint; once an endpoint
+    has ``min_samples`` of them, a GET that has not answered within the
+    ``percentile`` latency (but at least ``min_delay`` seconds) is sent again
+    and whichever response arrives first is used. Hedges are paid for out of
+    a budget that grows by ``budget`` per request, so they add at most that
+    share of extra load (5% by default). ``endpoints``, if given, limits
+    hedging to those endpoint templates.
+    """
+
+    def __init__(self, percentile=0.95, min_samples=20, window=200, budget=0.05, min_delay=0.01, endpoints=None):
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.window = window
+        self.budget = budget
+        self.min_delay = min_delay
+        self.endpoints = set(endpoints) if endpoints is not None else None
+        self._latencies = {}
+        self._thresholds = {}
+        self._counts = {}
+        self._credit = 0.0
+        self._lock = threading.Lock()
+
+    def applies_to(self, endpoint):
+        return endpoint.startswith('GET ') and (self.endpoints is None or endpoint in self.endpoints)
+
+    def delay(self, endpoint):
+        # The hedging delay for endpoint, or None while it is still learning.
+        threshold = self._thresholds.get(endpoint)
+        return max(threshold, self.min_delay) if threshold is not None else None
+
+    def observe(self, endpoint, latency):
+        with self._lock:
+            self._credit = min(self._credit + self.budget, 10.0)
+            samples = self._latencies.get(endpoint)
+            if samples is None:
+                samples = self._latencies[endpoint] = deque(maxlen=self.window)
+            samples.append(latency)
+            # Re-sorting the window costs a few microseconds; doing it every
+            # tenth sample keeps the threshold fresh enough.
+            count = self._counts[endpoint] = self._counts.get(endpoint, 0) + 1
+            if len(samples) >= self.min_samples and (count % 10 == 0 or endpoint not in self._thresholds):
+                ordered = sorted(samples)
+                self._thresholds[endpoint] = ordered[min(int(len(ordered) * self.percentile), len(ordered) - 1)]
+
+    def try_spend(self):
+        with self._lock:
+            if self._credit >= 1.0:
+                self._credit -= 1.0
+                return True
+            return False
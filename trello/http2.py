@@ -0,0 +1,157 @@
+import os
+import ssl
+import threading
+from collections.abc import Iterator
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+# Methods that can be sent again after a server dropped the connection, and
+# how many times.
+IDEMPOTENT_METHODS = ('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE')
+GOAWAY_RETRIES = 3
+
+def http2_available():
+    try:
+        import h2  # noqa: F401
+        import httpx  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+class HTTP2Adapter(BaseAdapter):
+    """A requests adapter that sends requests through an HTTP/2 httpx client.
+
+    Requires ``httpx`` with HTTP/2 support (pip install httpx[http2]).
+    Concurrent requests to a host are multiplexed over up to
+    ``max_connections`` connections instead of needing one socket each.
+    HTTP/2 is negotiated per host with ALPN, so hosts that only speak
+    HTTP/1.1 keep working over HTTP/1.1; plain ``http://`` URLs always use
+    HTTP/1.1 unless ``prior_knowledge`` is set.
+    """
+
+    def __init__(self, max_connections=8, prior_knowledge=False):
+        super(HTTP2Adapter, self).__init__()
+        try:
+            import httpx
+            import h2  # noqa: F401
+        except ImportError:
+            raise ImportError('HTTP2Adapter requires httpx with HTTP/2 support (pip install httpx[http2])')
+        self._httpx = httpx
+        self.max_connections = max_connections
+        self.prior_knowledge = prior_knowledge
+        self._clients = {}
+        self._lock = threading.Lock()
+
+    def _client(self, verify, cert, proxy):
+        # One client (and connection pool) per TLS and proxy setting; almost
+        # always just one.
+        key = (verify, cert, proxy)
+        client = self._clients.get(key)
+        if client is None:
+            with self._lock:
+                client = self._clients.get(key)
+                if client is None:
+                    if isinstance(verify, str):
+                        # requests takes a CA bundle path, httpx an SSLContext.
+                        if os.path.isdir(verify):
+                            verify = ssl.create_default_context(capath=verify)
+                        else:
+                            verify = ssl.create_default_context(cafile=verify)
+                    limits = self._httpx.Limits(max_connections=self.max_connections, max_keepalive_connections=self.max_connections)
+                    client = self._clients[key] = self._httpx.Client(
+                        http1=not self.prior_knowledge,
+                        http2=True,
+                        verify=verify,
+                        cert=cert,
+                        proxy=proxy,
+                        limits=limits,
+                        timeout=None)
+        return client
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        httpx = self._httpx
+        proxy = requests.utils.select_proxy(request.url, proxies or {})
+        client = self._client(verify, cert, proxy)
+        if isinstance(timeout, tuple):
+            timeout = httpx.Timeout(timeout[1], connect=timeout[0])
+        body = request.body
+        if body is not None and not isinstance(body, (bytes, str)):
+            body = iter(body)
+        # A server may end a connection (GOAWAY, or just closing it once
+        # it has served its quota of requests) with requests still in flight
+        # or about to be written on it; idempotent requests whose body can
+        # be sent again are retried on another connection.
+        retries = GOAWAY_RETRIES if request.method in IDEMPOTENT_METHODS and not isinstance(body, Iterator) else 0
+        while True:
+            outgoing = client.build_request(request.method, request.url, headers=dict(request.headers), content=body, timeout=timeout)
+            try:
+                incoming = client.send(outgoing, stream=stream)
+                break
+            except httpx.ConnectTimeout as error:
+                raise requests.exceptions.ConnectTimeout(error, request=request)
+            except httpx.TimeoutException as error:
+                raise requests.exceptions.ReadTimeout(error, request=request)
+            except (httpx.NetworkError, httpx.RemoteProtocolError) as error:
+                failure = error
+            except httpx.HTTPError as error:
+                raise requests.exceptions.ConnectionError(error, request=request)
+            except Exception as error:
+                # h2 and hpack can trip over their own state while a
+                # connection is torn down under many streams ("deque mutated
+                # during iteration"); callers only ever see requests errors.
+                failure = error
+            if not retries:
+                raise requests.exceptions.ConnectionError(failure, request=request)
+            retries -= 1
+        return self._build_response(request, incoming, stream)
+
+    def _build_response(self, request, incoming, stream):
+        resp = requests.Response()
+        resp.status_code = incoming.status_code
+        resp.headers = CaseInsensitiveDict(incoming.headers.items())
+        resp.encoding = get_encoding_from_headers(resp.headers)
+        resp.reason = incoming.reason_phrase
+        resp.url = request.url
+        resp.request = request
+        resp.connection = self
+        if stream:
+            resp.raw = _RawStream(incoming)
+        else:
+            resp._content = incoming.content
+            resp._content_consumed = True
+        return resp
+
+    def close(self):
+        with self._lock:
+            clients, self._clients = list(self._clients.values()), {}
+        for client in clients:
+            client.close()
+
+class _RawStream(object):
+    # Just enough of urllib3's response for Response.iter_content() and
+    # Response.close() on a streamed httpx response.
+
+    def __init__(self, incoming):
+        self._incoming = incoming
+        self._chunks = incoming.iter_bytes()
+        self._buffer = b''
+
+    def read(self, amt=None, decode_content=True):
+        while amt is None or len(self._buffer) < amt:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+        if amt is None:
+            data, self._buffer = self._buffer, b''
+        else:
+            data, self._buffer = self._buffer[:amt], self._buffer[amt:]
+        return data
+
+    def close(self):
+        self._incoming.close()
+
+    release_conn = close
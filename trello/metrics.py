@@ -0,0 +1,131 @@
+import threading
+from bisect import bisect_left
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+class _EndpointStats(object):
+    __slots__ = ('buckets', 'count', 'latency', 'request_bytes', 'response_bytes', 'statuses', 'retries', 'hedges', 'rate_limit_wait', 'cache_hits')
+
+    def __init__(self, size):
+        self.buckets = [0] * size
+        self.count = 0
+        self.latency = 0.0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.statuses = {}
+        self.retries = 0
+        self.hedges = 0
+        self.rate_limit_wait = 0.0
+        self.cache_hits = 0
+
+class Metrics(object):
+    """Per-endpoint call statistics, labeled by URL template.
+
+    Pass one to :class:`trello.transport.Transport` (or share one between
+    transports) and read it back with :meth:`snapshot` or
+    :meth:`to_prometheus`. Recording a call costs a dict lookup, a bisect and
+    a few additions under a lock.
+    """
+
+    def __init__(self, buckets=LATENCY_BUCKETS, prefix='trello'):
+        self.bucket_bounds = tuple(buckets)
+        self.prefix = prefix
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def observe(self, call):
+        endpoint = call.endpoint
+        status = 'cache' if call.cache_hit else 'coalesced' if call.coalesced else str(call.status or 'error')
+        with self._lock:
+            stats = self._stats.get(endpoint)
+            if stats is None:
+                stats = self._stats[endpoint] = _EndpointStats(len(self.bucket_bounds) + 1)
+            stats.buckets[bisect_left(self.bucket_bounds, call.elapsed)] += 1
+            stats.count += 1
+            stats.latency += call.elapsed
+            stats.request_bytes += call.request_bytes
+            stats.response_bytes += call.response_bytes
+            stats.statuses[status] = stats.statuses.get(status, 0) + 1
+            stats.retries += call.retries
+            stats.hedges += call.hedges
+            stats.rate_limit_wait += call.waited
+            stats.cache_hits += call.cache_hit
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+    def snapshot(self):
+        """Returns ``{endpoint: {...}}`` with cumulative latency buckets."""
+        with self._lock:
+            items = [(endpoint, _copy(stats)) for endpoint, stats in self._stats.items()]
+        snapshot = {}
+        for endpoint, stats in sorted(items):
+            cumulative, total = [], 0
+            for count in stats.buckets:
+                total += count
+                cumulative.append(total)
+            snapshot[endpoint] = {
+                'count': stats.count,
+                'latency_seconds': {
+                    'sum': stats.latency,
+                    'buckets': dict(zip(self.bucket_bounds + (float('inf'),), cumulative)),
+                },
+                'request_bytes': stats.request_bytes,
+                'response_bytes': stats.response_bytes,
+                'statuses': stats.statuses,
+                'retries': stats.retries,
+                'hedges': stats.hedges,
+                'rate_limit_wait_seconds': stats.rate_limit_wait,
+                'cache_hits': stats.cache_hits,
+            }
+        return snapshot
+
+    def to_prometheus(self):
+        """Renders the metrics in the Prometheus text exposition format."""
+        p = self.prefix
+        lines = []
+        snapshot = self.snapshot()
+
+        def family(name, kind, help_text, samples):
+            lines.append('# HELP {}_{} {}'.format(p, name, help_text))
+            lines.append('# TYPE {}_{} {}'.format(p, name, kind))
+            lines.extend(samples)
+
+        family('request_duration_seconds', 'histogram', 'Time spent in API calls, including retries and rate limit waits.', [
+            sample for endpoint, stats in snapshot.items() for sample in _histogram_samples(p, endpoint, stats)])
+        family('requests_total', 'counter', 'API calls by response status ("cache" for cache hits).', [
+            '{}_requests_total{{endpoint="{}",status="{}"}} {}'.format(p, _escape(endpoint), status, count)
+            for endpoint, stats in snapshot.items() for status, count in sorted(stats['statuses'].items())])
+        for name, key, help_text in (
+                ('request_bytes_total', 'request_bytes', 'Request body bytes sent.'),
+                ('response_bytes_total', 'response_bytes', 'Response body bytes received.'),
+                ('retries_total', 'retries', 'Requests retried after a 429.'),
+                ('hedges_total', 'hedges', 'Hedged second attempts sent for slow GETs.'),
+                ('rate_limit_wait_seconds_total', 'rate_limit_wait_seconds', 'Time spent waiting for the rate limiters.'),
+                ('cache_hits_total', 'cache_hits', 'Calls answered from the response cache.')):
+            family(name, 'counter', help_text, [
+                '{}_{}{{endpoint="{}"}} {}'.format(p, name, _escape(endpoint), _number(stats[key]))
+                for endpoint, stats in snapshot.items()])
+        return '\n'.join(lines) + '\n'
+
+def _copy(stats):
+    copy = _EndpointStats(0)
+    for name in _EndpointStats.__slots__:
+        setattr(copy, name, getattr(stats, name))
+    copy.buckets = list(stats.buckets)
+    copy.statuses = dict(stats.statuses)
+    return copy
+
+def _histogram_samples(p, endpoint, stats):
+    label = _escape(endpoint)
+    for bound, count in stats['latency_seconds']['buckets'].items():
+        yield '{}_request_duration_seconds_bucket{{endpoint="{}",le="{}"}} {}'.format(p, label, '+Inf' if bound == float('inf') else bound, count)
+    yield '{}_request_duration_seconds_sum{{endpoint="{}"}} {}'.format(p, label, _number(stats['latency_seconds']['sum']))
+    yield '{}_request_duration_seconds_count{{endpoint="{}"}} {}'.format(p, label, stats['count'])
+
+def _escape(value):
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def _number(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
@@ -0,0 +1,367 @@
+import inspect
+import math
+from urllib.parse import urlencode
+
+from .concurrency import map_calls
+
+# Prefix Trello puts in front of a nested resource's parameters, e.g. a
+# board's cards=open reads card_fields, card_checklists...
+SINGULAR = {
+    'actions': 'action_',
+    'attachments': 'attachment_',
+    'boards': 'board_',
+    'cards': 'card_',
+    'checklists': 'checklist_',
+    'labels': 'label_',
+    'lists': 'list_',
+    'members': 'member_',
+    'organizations': 'organization_',
+}
+
+# The value that asks for a nested resource, unless the shape gives a filter.
+# A card's members and attachments are flags rather than filters.
+DEFAULT_FILTERS = {'boards': 'open', 'cards': 'open', 'lists': 'open'}
+FLAGS = {('cards', 'members'), ('cards', 'attachments')}
+
+# Children that can be fetched once per board and grouped by a foreign key,
+# instead of with one request per parent.
+REGROUP = {('lists', 'cards'): 'idList', ('cards', 'checklists'): 'idCard'}
+
+# Related objects that can be fetched once per board and looked up by id.
+JOIN = {('cards', 'members'): 'idMembers'}
+
+# Rough counts per parent, for estimates until the real numbers are known.
+SIZES = {'actions': 50, 'boards': 10, 'cards': 200, 'checklists': 2, 'labels': 8, 'lists': 8, 'members': 10, 'organizations': 2}
+
+# Trello's /1/batch takes at most this many URLs.
+BATCH_SIZE = 10
+
+class FetchPlanner(object):
+    """Fetches an object graph with as few requests as the API allows.
+
+    Describe the graph as a nested dict of relations, each with an optional
+    ``fields`` and ``filter``::
+
+        {'boards': {'fields': 'name', 'lists': {'cards': {'members': {}, 'checklists': {}}}}}
+
+    The planner embeds as much as each endpoint's nested-resource parameters
+    allow, fetches cards and checklists per board and groups them by their
+    parent id rather than asking every list or card, looks card members up
+    in the board's member list, and fetches whatever is left per object,
+    either through ``/1/batch`` or as parallel calls, whichever its cost
+    estimate prefers. ``latency`` is the expected round trip in seconds,
+    ``item_cost`` the server time per returned object and ``request_cost``
+    what one request of quota is worth in seconds.
+    """
+
+    def __init__(self, api, concurrency=8, latency=0.15, item_cost=0.0005, request_cost=0.05):
+        self.api = api
+        self.concurrency = concurrency
+        self.latency = latency
+        self.item_cost = item_cost
+        self.request_cost = request_cost
+        self._signatures = {}
+
+    def plan(self, kind, id, shape):
+        root = _Node(kind, None, None, shape or {})
+        plan = FetchPlan(self, root, id)
+        step = plan.add_step(root)
+        if root.fields and 'fields' in self.parameters(kind):
+            step.params['fields'] = root.fields
+        self._embed_children(plan, step, '', root, root.children)
+        return plan
+
+    def fetch(self, kind, id, shape):
+        return self.plan(kind, id, shape).execute()
+
+    def parameters(self, kind):
+        params = self._signatures.get(kind)
+        if params is None:
+            method = getattr(self.api, kind).get
+            params = self._signatures[kind] = frozenset(list(inspect.signature(method).parameters)[1:])
+        return params
+
+    def _embed_children(self, plan, step, prefix, owner, children):
+        for child in children:
+            if not self._embed(plan, step, prefix, owner, child):
+                self._plan_elsewhere(plan, owner, child)
+
+    def _embed(self, plan, step, prefix, owner, node):
+        params = self.parameters(step.owner.kind)
+        name = prefix + node.relation
+        if name not in params:
+            return False
+        if node.filter is not None:
+            value = node.filter
+        elif (owner.kind, node.relation) in FLAGS:
+            value = 'true'
+        else:
+            value = DEFAULT_FILTERS.get(node.relation, 'all')
+        step.params[name] = value
+        nested = prefix + SINGULAR.get(node.relation, node.relation + '_')
+        if node.fields and nested + 'fields' in params:
+            step.params[nested + 'fields'] = node.fields
+        step.embedded.append(node)
+        node.source = step
+        self._embed_children(plan, step, nested, node, node.children)
+        return True
+
+    def _plan_elsewhere(self, plan, owner, node):
+        key = (owner.kind, node.relation)
+        board = owner.ancestor('boards')
+        if board is not None and (key in REGROUP or key in JOIN):
+            if key in REGROUP:
+                # Fetch the children once per board, with the node's own
+                # children planned under the board, then group them.
+                hidden = board.hidden_child(node.relation, node.children, node.fields, node.filter)
+                plan.links.append(('group', board, hidden, owner, node.relation, REGROUP[key]))
+            else:
+                hidden = board.hidden_child(node.relation, [], None, None)
+                plan.links.append(('join', board, hidden, owner, node.relation, JOIN[key]))
+            if hidden.source is None:
+                self._attach(plan, board, hidden)
+            elif key in REGROUP:
+                self._embed_children(plan, hidden.source, hidden.source.prefix_of(hidden), hidden, node.children)
+            return
+        step = plan.step_for(owner)
+        if step is None:
+            step = plan.add_step(owner)
+        if not self._embed(plan, step, '', owner, node):
+            raise ValueError('cannot fetch {} of {}'.format(node.relation, owner.kind))
+
+    def _attach(self, plan, owner, node):
+        # Embeds node where owner is fetched if that endpoint can, otherwise
+        # in a step of its own that fetches owner's objects again.
+        source = owner.source
+        if source is not None and source.owner is owner and self._embed(plan, source, '', owner, node):
+            return
+        if source is not None and source.owner is not owner and self._embed(plan, source, source.prefix_of(owner), owner, node):
+            return
+        self._plan_elsewhere(plan, owner, node)
+
+    def choose(self, count, weight):
+        # Returns (strategy, requests, seconds) for fetching count objects
+        # that each return about weight objects.
+        per_call = self.latency + weight * self.item_cost
+        if count <= 1:
+            return 'single', 1, per_call
+        options = []
+        requests = count
+        seconds = math.ceil(count / float(self.concurrency)) * per_call
+        options.append((seconds + requests * self.request_cost, 'parallel', requests, seconds))
+        requests = int(math.ceil(count / float(BATCH_SIZE)))
+        # Trello answers the URLs of a batch one after another.
+        seconds = math.ceil(requests / float(self.concurrency)) * (self.latency + min(count, BATCH_SIZE) * weight * self.item_cost)
+        options.append((seconds + requests * self.request_cost, 'batch', requests, seconds))
+        _, strategy, requests, seconds = min(options)
+        return strategy, requests, seconds
+
+    def get_many(self, kind, ids, params, strategy):
+        # {id: object} for ids, fetched the way strategy says.
+        resource = getattr(self.api, kind)
+        if strategy == 'single':
+            return dict((id, resource.get(id, **params)) for id in ids)
+        if strategy == 'parallel':
+            return dict(zip(ids, self.api.map(resource.get, ids, concurrency=self.concurrency, **params)))
+        query = urlencode(sorted(params.items()))
+        urls = ['/{}/{}?{}'.format(kind, id, query) if query else '/{}/{}'.format(kind, id) for id in ids]
+        chunks = [urls[start:start + BATCH_SIZE] for start in range(0, len(urls), BATCH_SIZE)]
+        results = []
+        for answers in map_calls(lambda chunk: self.api.batches.get(','.join(chunk)), chunks, concurrency=self.concurrency):
+            for answer in answers:
+                if '200' not in answer:
+                    raise BatchError(answer)
+                results.append(answer['200'])
+        return dict(zip(ids, results))
+
+class BatchError(Exception):
+    def __init__(self, answer):
+        super(BatchError, self).__init__('{} in /1/batch: {}'.format(answer.get('statusCode'), answer.get('message')))
+        self.answer = answer
+
+class FetchPlan(object):
+    """The requests :class:`FetchPlanner` chose for one graph.
+
+    :meth:`explain` describes them with estimated request counts, and with
+    what actually happened once :meth:`execute` has run.
+    """
+
+    def __init__(self, planner, root, id):
+        self.planner = planner
+        self.root = root
+        self.id = id
+        self.steps = []
+        self.links = []
+        self.report = None
+
+    def add_step(self, owner):
+        step = _Step(owner)
+        owner.steps.append(step)
+        self.steps.append(step)
+        if owner.source is None:
+            owner.source = step
+        return step
+
+    def step_for(self, owner):
+        for step in owner.steps:
+            if step.owner is owner:
+                return step
+        return None
+
+    def estimate(self):
+        # [(step, count, strategy, requests, seconds)]
+        estimates = []
+        for step in self.steps:
+            count = step.owner.estimated_count()
+            estimates.append((step, count) + self.planner.choose(count, step.weight()))
+        return estimates
+
+    def explain(self):
+        lines = []
+        total = 0
+        for number, (step, count, strategy, requests, seconds) in enumerate(self.estimate(), 1):
+            if self.report is not None:
+                count, strategy, requests = self.report[number - 1]
+                how = 'x{} via {}: {} request(s)'.format(count, strategy, requests)
+            else:
+                how = 'x~{} via {}: ~{} request(s), ~{:.2f}s'.format(count, strategy, requests, seconds)
+            total += requests
+            lines.append('{}. {} {}'.format(number, step.owner.path() or self.root.kind, how))
+            if step.params:
+                lines.append('   ' + ' '.join('{}={}'.format(k, v) for k, v in sorted(step.params.items())))
+            for node in step.embedded:
+                lines.append('   embeds {}'.format(node.path()))
+        for op, board, hidden, owner, relation, key in self.links:
+            verb = 'grouped by' if op == 'group' else 'looked up by'
+            lines.append('then {}.{} from {} {} {}'.format(owner.path(), relation, hidden.path(), verb, key))
+        lines.insert(0, '{} {}: {} step(s), {}{} request(s)'.format(self.root.kind, self.id, len(self.steps), '' if self.report is not None else '~', total))
+        return '\n'.join(lines)
+
+    def execute(self):
+        planner = self.planner
+        result = {}
+        report = []
+        for step in self.steps:
+            if step.owner is self.root:
+                objects = [result]
+                ids = [self.id]
+            else:
+                objects = self.root.collect(result, step.owner)
+                ids = list(dict.fromkeys(obj['id'] for obj in objects))
+            strategy, requests, _ = planner.choose(len(ids), step.weight())
+            fetched = planner.get_many(step.owner.kind, ids, step.params, strategy) if ids else {}
+            report.append((len(ids), strategy, requests if ids else 0))
+            if step.owner is self.root:
+                result.update(fetched[self.id])
+                continue
+            relations = [node.relation for node in step.embedded if node.parent is step.owner]
+            for obj in objects:
+                source = fetched[obj['id']]
+                for relation in relations:
+                    obj[relation] = source.get(relation, [])
+        for op, board, hidden, owner, relation, key in self.links:
+            for board_obj in self.root.collect(result, board):
+                items = board_obj.get(hidden.relation, [])
+                if op == 'group':
+                    groups = {}
+                    for item in items:
+                        groups.setdefault(item.get(key), []).append(item)
+                    for obj in board.collect(board_obj, owner):
+                        obj[relation] = groups.get(obj['id'], [])
+                else:
+                    index = dict((item['id'], item) for item in items)
+                    for obj in board.collect(board_obj, owner):
+                        obj[relation] = [index[id] for id in obj.get(key, ()) if id in index]
+        # Drop what was only fetched to be grouped or looked up.
+        for board in set(link[1] for link in self.links):
+            for relation in board.hidden:
+                if relation not in [child.relation for child in board.children]:
+                    for board_obj in self.root.collect(result, board):
+                        board_obj.pop(relation, None)
+        self.report = report
+        return result
+
+class _Step(object):
+    def __init__(self, owner):
+        self.owner = owner
+        self.params = {}
+        self.embedded = []
+
+    def weight(self):
+        # Objects one response is expected to carry.
+        weight = 1
+        for node in self.embedded:
+            weight += node.estimated_count() // max(self.owner.estimated_count(), 1)
+        return weight
+
+    def prefix_of(self, node):
+        prefix = ''
+        for ancestor in node.lineage(self.owner):
+            prefix += SINGULAR.get(ancestor.relation, ancestor.relation + '_')
+        return prefix
+
+class _Node(object):
+    # One relation of the requested shape, e.g. the cards of each list.
+
+    def __init__(self, kind, relation, parent, shape):
+        self.kind = kind
+        self.relation = relation
+        self.parent = parent
+        shape = shape if isinstance(shape, dict) else {}
+        self.fields = shape.get('fields')
+        self.filter = shape.get('filter')
+        self.children = [_Node(name, name, self, value) for name, value in shape.items() if name not in ('fields', 'filter')]
+        self.hidden = {}
+        self.source = None
+        self.steps = []
+
+    def hidden_child(self, relation, children, fields, filter):
+        node = self.hidden.get(relation)
+        if node is None:
+            node = self.hidden[relation] = _Node(relation, relation, self, {'fields': fields, 'filter': filter})
+        for child in children:
+            child.parent = node
+            node.children.append(child)
+        return node
+
+    def ancestor(self, kind):
+        node = self.parent
+        while node is not None and node.kind != kind:
+            node = node.parent
+        return node
+
+    def lineage(self, top):
+        # Nodes from just below top down to self.
+        nodes = []
+        node = self
+        while node is not top:
+            nodes.append(node)
+            node = node.parent
+        return list(reversed(nodes))
+
+    def path(self):
+        return '.'.join(node.relation for node in self.lineage(self.root()))
+
+    def root(self):
+        node = self
+        while node.parent is not None:
+            node = node.parent
+        return node
+
+    def estimated_count(self):
+        count = 1
+        for node in self.lineage(self.root()):
+            count *= SIZES.get(node.relation, 10)
+        return count
+
+    def collect(self, obj, node):
+        # The objects for node below obj, which holds self's data.
+        objects = [obj]
+        for step in node.lineage(self):
+            children = []
+            for parent in objects:
+                value = parent.get(step.relation)
+                if isinstance(value, list):
+                    children.extend(value)
+            objects = children
+        return objects
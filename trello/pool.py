@@ -0,0 +1,58 @@
+from .cache import ResponseCache
+from .ratelimit import KeyedRateLimiter, RateLimiter
+from .timeouts import DEFAULT_TIMEOUT
+from .transport import Transport
+
+# Trello allows 300 requests per 10 seconds for each API key and 100 requests
+# per 10 seconds for each token.
+KEY_RATE = (300, 10)
+TOKEN_RATE = (100, 10)
+
+class TrelloClientPool(object):
+    """Hands out cheap per-token clients that share one :class:`Transport`.
+
+    Every client from a pool shares its connection pool, response cache and
+    rate limiters; the limiters track the API key quota and each token's
+    quota separately. A client holds only its token and builds resource
+    objects on first use.
+
+        >>> pool = TrelloClientPool(TRELLO_APP_KEY)
+        >>> pool.get(user_token).boards.get(board_id)
+    """
+
+    def __init__(self, apikey, transport=None, cache_ttl=30.0, cache_size=4096, key_rate=KEY_RATE, token_rate=TOKEN_RATE, retries=3, pool_maxsize=64, metrics=None, tracer=None, profiler=None, breakers=None, hedging=None, timeout=DEFAULT_TIMEOUT, http2=False, aliases=None, coalesce=False, decoder=None, pin_environment=False):
+        self._apikey = apikey
+        if transport is None:
+            transport = Transport(
+                cache=ResponseCache(cache_size, cache_ttl) if cache_ttl else None,
+                key_limiter=RateLimiter(*key_rate) if key_rate else None,
+                token_limiters=KeyedRateLimiter(*token_rate) if token_rate else None,
+                retries=retries,
+                pool_maxsize=pool_maxsize,
+                metrics=metrics,
+                tracer=tracer,
+                profiler=profiler,
+                breakers=breakers,
+                hedging=hedging,
+                timeout=timeout,
+                http2=http2,
+                aliases=aliases,
+                coalesce=coalesce,
+                decoder=decoder,
+                pin_environment=pin_environment)
+        self.transport = transport
+
+    def get(self, token=None):
+        from . import TrelloApi
+        return TrelloApi(self._apikey, token, transport=self.transport)
+
+    __getitem__ = get
+
+    def close(self):
+        self.transport.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,91 @@
+import threading
+import time
+from collections import OrderedDict
+
+class RateLimiter(object):
+    """Token bucket allowing ``rate`` requests every ``per`` seconds."""
+
+    def __init__(self, rate, per):
+        self.rate = float(rate)
+        self.per = float(per)
+        self._tokens = self.rate
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        self._tokens = min(self.rate, self._tokens + (now - self._updated) * self.rate / self.per)
+        self._updated = now
+
+    def reserve(self):
+        # Take a slot now and return how long the caller has to wait before
+        # using it. Reserving (rather than polling) keeps waiters in FIFO order.
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens * self.per / self.rate
+
+    def acquire(self):
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def try_acquire(self):
+        # Take a slot only if one is free right now; never waits.
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+    def refund(self):
+        with self._lock:
+            self._tokens = min(self.rate, self._tokens + 1)
+
+    def penalize(self, seconds):
+        # The server told us to back off (429 / Retry-After): drain the bucket
+        # so every waiter sharing this limiter backs off too.
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self._tokens, 0.0) - seconds * self.rate / self.per
+
+    def is_idle(self):
+        with self._lock:
+            self._refill(time.monotonic())
+            return self._tokens >= self.rate
+
+class KeyedRateLimiter(object):
+    """One :class:`RateLimiter` per key (e.g. per user token), created lazily.
+
+    Buckets that have refilled completely carry no state, so they are dropped
+    once more than ``max_idle`` keys are being tracked.
+    """
+
+    def __init__(self, rate, per, max_idle=1024):
+        self.rate = rate
+        self.per = per
+        self.max_idle = max_idle
+        self._limiters = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            limiter = self._limiters.get(key)
+            if limiter is None:
+                limiter = self._limiters[key] = RateLimiter(self.rate, self.per)
+                if len(self._limiters) > self.max_idle:
+                    self._prune()
+            else:
+                self._limiters.move_to_end(key)
+            return limiter
+
+    def _prune(self):
+        for key in list(self._limiters)[:-self.max_idle]:
+            if self._limiters[key].is_idle():
+                del self._limiters[key]
+
+    def __len__(self):
+        return len(self._limiters)
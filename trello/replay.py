@@ -0,0 +1,150 @@
+import base64
+import gzip
+import hashlib
+import json
+import random
+import threading
+import time
+from collections import defaultdict
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+REDACTED = 'REDACTED'
+_KEPT_HEADERS = ('Content-Type', 'Retry-After', 'Content-Range')
+
+class ReplayMissError(requests.exceptions.RequestException):
+    pass
+
+class RecordingAdapter(BaseAdapter):
+    """Records every request/response pair sent through it to ``path``.
+
+    The corpus is gzipped NDJSON, one exchange per line. API keys and tokens
+    are stripped from URLs (and replaced wherever else they appear in the
+    path), and only a hash of each request body is kept. Mount it on a
+    transport in place of the default adapter::
+
+        transport.mount('https://', RecordingAdapter('corpus.ndjson.gz'))
+    """
+
+    def __init__(self, path, adapter=None):
+        super(RecordingAdapter, self).__init__()
+        self.path = path
+        self.adapter = adapter if adapter is not None else HTTPAdapter()
+        self._fd = gzip.open(path, 'at')
+        self._lock = threading.Lock()
+
+    def send(self, request, **kwargs):
+        started = time.perf_counter()
+        resp = self.adapter.send(request, **kwargs)
+        content = resp.content
+        entry = {
+            'method': request.method,
+            'url': normalize_url(request.url),
+            'body': body_hash(request.body),
+            'status': resp.status_code,
+            'reason': resp.reason,
+            'headers': dict((name, resp.headers[name]) for name in _KEPT_HEADERS if name in resp.headers),
+            'elapsed': round(time.perf_counter() - started, 6),
+        }
+        try:
+            entry['text'] = content.decode('utf-8')
+        except UnicodeDecodeError:
+            entry['base64'] = base64.b64encode(content).decode('ascii')
+        line = json.dumps(entry, separators=(',', ':')) + '\n'
+        with self._lock:
+            self._fd.write(line)
+        return resp
+
+    def close(self):
+        with self._lock:
+            if not self._fd.closed:
+                self._fd.close()
+        self.adapter.close()
+
+class ReplayAdapter(BaseAdapter):
+    """Serves responses from a corpus written by :class:`RecordingAdapter`.
+
+    Requests are matched on method, URL (minus key and token) and body; when
+    nothing matches exactly, any response recorded for the same method and
+    path is used. Repeated requests walk through the recorded responses in
+    order and then keep returning the last one. Each response is delayed by
+    ``latency`` seconds (``'recorded'`` to reuse the recorded timings) plus
+    or minus up to ``jitter`` seconds.
+    """
+
+    def __init__(self, path, latency=0.0, jitter=0.0, seed=None):
+        super(ReplayAdapter, self).__init__()
+        self.latency = latency
+        self.jitter = jitter
+        self._random = random.Random(seed)
+        self._exact = defaultdict(list)
+        self._loose = defaultdict(list)
+        self._served = defaultdict(int)
+        self._lock = threading.Lock()
+        with gzip.open(path, 'rt') as fd:
+            for line in fd:
+                entry = json.loads(line)
+                self._exact[(entry['method'], entry['url'], entry['body'])].append(entry)
+                self._loose[(entry['method'], urlsplit(entry['url']).path)].append(entry)
+
+    def send(self, request, **kwargs):
+        url = normalize_url(request.url)
+        key = (request.method, url, body_hash(request.body))
+        candidates = self._exact.get(key)
+        if not candidates:
+            key = (request.method, urlsplit(url).path)
+            candidates = self._loose.get(key)
+        if not candidates:
+            raise ReplayMissError('no recorded response for {} {}'.format(request.method, url), request=request)
+        with self._lock:
+            index = self._served[key]
+            self._served[key] = index + 1
+        entry = candidates[min(index, len(candidates) - 1)]
+        delay = entry['elapsed'] if self.latency == 'recorded' else self.latency
+        if self.jitter:
+            delay += self._random.uniform(-self.jitter, self.jitter)
+        if delay > 0:
+            time.sleep(delay)
+        return _build_response(request, entry)
+
+    def close(self):
+        pass
+
+def _build_response(request, entry):
+    resp = requests.Response()
+    resp.status_code = entry['status']
+    resp.reason = entry.get('reason')
+    resp.headers = CaseInsensitiveDict(entry['headers'])
+    if 'text' in entry:
+        resp._content = entry['text'].encode('utf-8')
+    else:
+        resp._content = base64.b64decode(entry['base64'])
+    resp._content_consumed = True
+    resp.encoding = 'utf-8'
+    resp.url = request.url
+    resp.request = request
+    return resp
+
+def normalize_url(url):
+    # Drop the key and token query parameters and redact the token wherever
+    # else it appears (e.g. /1/tokens/<token>), keeping the rest comparable.
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    secrets = [value for name, value in query if name in ('key', 'token') and value]
+    path = parts.path
+    for secret in secrets:
+        path = path.replace(secret, REDACTED)
+    query = sorted((name, value) for name, value in query if name not in ('key', 'token'))
+    return '{}{}'.format(path, '?' + urlencode(query) if query else '')
+
+def body_hash(body):
+    if body is None:
+        return None
+    if isinstance(body, str):
+        body = body.encode('utf-8')
+    if not isinstance(body, bytes):
+        return None
+    return hashlib.sha1(body).hexdigest()
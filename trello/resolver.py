@@ -0,0 +1,234 @@
+import threading
+import time
+import weakref
+
+# Board actions (as delivered to webhooks) that can change the names of a
+# board's labels, lists or members, or the boards themselves.
+INVALIDATING_ACTIONS = {
+    'createLabel': 'labels', 'updateLabel': 'labels', 'deleteLabel': 'labels',
+    'createList': 'lists', 'updateList': 'lists', 'moveListFromBoard': 'lists', 'moveListToBoard': 'lists',
+    'addMemberToBoard': 'members', 'removeMemberFromBoard': 'members', 'makeNormalMemberOfBoard': 'members', 'updateMember': 'members',
+    'createBoard': 'boards', 'updateBoard': 'boards', 'deleteBoard': 'boards', 'addToOrganizationBoard': 'boards', 'removeFromOrganizationBoard': 'boards',
+}
+
+class NameResolver(object):
+    """Resolves names of labels, lists, members and boards to ids.
+
+    The first lookup on a board fetches all of the board's labels (or lists,
+    or members) in one request and caches a case-insensitive name -> id map,
+    so resolving any number of names costs one request per board and kind.
+    A name that is not in the map triggers one refresh, at most every
+    ``min_refresh`` seconds, in case it was just created or renamed; maps
+    are refetched after ``ttl`` seconds regardless. Maps are kept per token,
+    like :class:`trello.cache.ResponseCache`.
+
+    Writes made through the client's transport that may rename, add or
+    remove something drop the affected maps, and so do the board actions
+    passed to :meth:`handle_webhook`. The resolver only watches the
+    transport while it is in use: once it is garbage collected (or
+    :meth:`close` is called) it stops.
+
+    Labels are found by name, or by color if they have none; members by
+    username, full name or id; lists and boards only if they are open.
+    Lookups of names that do not exist raise ``KeyError``.
+    """
+
+    def __init__(self, api, ttl=300.0, min_refresh=10.0):
+        self.api = api
+        self.ttl = ttl
+        self.min_refresh = min_refresh
+        self._maps = {}
+        self._owners = {}
+        self._lock = threading.Lock()
+        self._fetching = {}
+        # The transport, possibly shared by a whole pool, holds the
+        # listener but not the resolver, so resolvers made per request do
+        # not pile up on it.
+        listener = _observer(weakref.ref(self))
+        _add_listener(api._transport, listener)
+        self._unregister = weakref.finalize(self, _remove_listener, api._transport, listener)
+
+    def label(self, board_id, name):
+        return self.resolve('labels', board_id, name)
+
+    def list(self, board_id, name):
+        return self.resolve('lists', board_id, name)
+
+    def member(self, name, board_id=None):
+        # Without board_id, members are looked up with Search.get_member.
+        if board_id is None:
+            return self._search_member(name)
+        return self.resolve('members', board_id, name)
+
+    def board(self, name, organization=None):
+        # Boards of the organization, or of the token's member without one.
+        return self.resolve('boards', organization, name)
+
+    def resolve(self, kind, scope, name):
+        names = self._names(kind, scope)
+        key = _key(name)
+        if key not in names.ids and names.age() >= self.min_refresh:
+            names = self._names(kind, scope, refresh=True)
+        try:
+            return names.ids[key]
+        except KeyError:
+            raise KeyError('no {} named {!r} in {}'.format(kind[:-1], name, scope or 'me'))
+
+    def resolve_many(self, kind, scope, names):
+        """Returns ``{name: id}`` for many names at once, with ``None`` for names that do not exist."""
+        resolved = {}
+        for name in names:
+            try:
+                resolved[name] = self.resolve(kind, scope, name)
+            except KeyError:
+                resolved[name] = None
+        return resolved
+
+    def invalidate(self, board_id=None, kind=None):
+        # Drops the cached maps of a board (or organization) and/or kind;
+        # with no arguments, all of them.
+        with self._lock:
+            for key in list(self._maps):
+                if (board_id is None or key[2] == board_id) and (kind is None or key[1] == kind):
+                    del self._maps[key]
+
+    def handle_webhook(self, payload):
+        # Takes the body of a webhook request (or a single action).
+        action = payload.get('action', payload)
+        kind = INVALIDATING_ACTIONS.get(action.get('type'))
+        if kind == 'boards':
+            self.invalidate(kind='boards')
+        elif kind is not None:
+            self.invalidate(((action.get('data') or {}).get('board') or {}).get('id'), kind)
+
+    def close(self):
+        self._unregister()
+
+    def _names(self, kind, scope, refresh=False):
+        token = self.api.boards._token
+        key = (token, kind, scope)
+        names = self._maps.get(key)
+        if names is not None and not refresh and names.age() < self.ttl:
+            return names
+        # One fetch per map at a time; other threads wait for it.
+        with self._lock:
+            fetching = self._fetching.get(key)
+            if fetching is None:
+                fetching = self._fetching[key] = threading.Lock()
+        with fetching:
+            current = self._maps.get(key)
+            if current is not None and current is not names and current.age() < self.ttl:
+                return current
+            names = _Names(kind, self._fetch(kind, scope))
+            with self._lock:
+                self._maps[key] = names
+                for item_id in names.item_ids:
+                    self._owners[item_id] = scope
+                self._fetching.pop(key, None)
+            return names
+
+    def _fetch(self, kind, scope):
+        if kind == 'labels':
+            return self.api.boards.get_label(scope, fields='name,color', limit=1000)
+        if kind == 'lists':
+            return self.api.boards.get_list(scope, filter='open', fields='name')
+        if kind == 'members':
+            return self.api.boards.get_member(scope, fields='username,fullName')
+        if kind == 'boards':
+            if scope is None:
+                return self.api.members.get_board('me', filter='open', fields='name')
+            return self.api.organizations.get_board(scope, filter='open', fields='name')
+        raise ValueError('cannot resolve {!r}'.format(kind))
+
+    def _search_member(self, name):
+        names = self._maps.get((self.api.boards._token, 'members', None))
+        key = _key(name)
+        if names is not None and key in names.ids:
+            return names.ids[key]
+        for member in self.api.search.get_member(name, limit=20):
+            if _key(member.get('username')) == key or _key(member.get('fullName')) == key:
+                with self._lock:
+                    names = self._maps.setdefault((self.api.boards._token, 'members', None), _Names('members', []))
+                    names.ids[key] = member['id']
+                return member['id']
+        raise KeyError('no member named {!r}'.format(name))
+
+    def _observe(self, call):
+        # Drops the maps a successful write through the transport may have
+        # changed, including those it added a name to: a miss refreshes a
+        # map at most every min_refresh seconds, too late for a name the
+        # caller just created.
+        if call.method == 'get' or call.status is None or call.status >= 400:
+            return
+        parts = call.path.split('/')
+        if len(parts) < 3:
+            return
+        collection = parts[2]
+        if collection == 'boards':
+            if len(parts) > 4 and parts[4] in ('labels', 'lists', 'members', 'memberships'):
+                self.invalidate(call.path_args[0], 'members' if parts[4] == 'memberships' else parts[4])
+            else:
+                self.invalidate(kind='boards')
+        elif collection in ('labels', 'lists'):
+            scope = self._owners.get(call.path_args[0]) if call.path_args else None
+            if scope is not None:
+                self.invalidate(scope, collection)
+            # Creates (POST /1/lists, /1/labels) name their board in the
+            # form, and so do moves to another board.
+            data = call.data or {}
+            board_id = data.get('value') if parts[-1] == 'idBoard' else data.get('idBoard')
+            if board_id is not None:
+                self.invalidate(board_id, collection)
+        elif collection == 'cards' and len(parts) > 4 and parts[4] == 'labels':
+            # A label created on a card, whose board is not in the request.
+            self.invalidate(kind='labels')
+        elif collection == 'members':
+            self.invalidate(kind='members')
+        elif collection == 'organizations':
+            self.invalidate(kind='boards')
+
+class _Names(object):
+    __slots__ = ('ids', 'item_ids', 'fetched')
+
+    def __init__(self, kind, items):
+        self.ids = {}
+        self.item_ids = []
+        self.fetched = time.monotonic()
+        for item in items:
+            self.item_ids.append(item['id'])
+            if kind == 'labels':
+                keys = (item.get('name') or item.get('color'),)
+            elif kind == 'members':
+                keys = (item.get('username'), item.get('fullName'), item['id'])
+            else:
+                keys = (item.get('name'), item['id'])
+            for key in keys:
+                # The first of several items with the same name wins, as in
+                # the Trello UI's ordering.
+                if key:
+                    self.ids.setdefault(_key(key), item['id'])
+
+    def age(self):
+        return time.monotonic() - self.fetched
+
+_listeners_lock = threading.Lock()
+
+def _observer(ref):
+    def observe(call):
+        resolver = ref()
+        if resolver is not None:
+            resolver._observe(call)
+    return observe
+
+def _add_listener(transport, listener):
+    # Copy on write: the transport may be iterating over its listeners in
+    # other threads.
+    with _listeners_lock:
+        transport.listeners = transport.listeners + [listener]
+
+def _remove_listener(transport, listener):
+    with _listeners_lock:
+        transport.listeners = [item for item in transport.listeners if item is not listener]
+
+def _key(name):
+    return ' '.join(name.split()).casefold() if name else name
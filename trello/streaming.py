@@ -0,0 +1,186 @@
+import asyncio
+import heapq
+import random
+import threading
+import time
+
+from .concurrency import map_calls
+from .ratelimit import RateLimiter
+
+# Notification ids marked read per POST /1/notifications/all/read.
+MARK_READ_BATCH = 100
+
+class NotificationsStreaming(object):
+    # Mixed into the generated Notifications class (see MIXINS in
+    # trello_api_gen.py).
+
+    def mark_read(self, ids):
+        # Marks many notifications read with one request per MARK_READ_BATCH
+        # ids, instead of one update_unread() each.
+        ids = list(ids)
+        if len(ids) == 1:
+            return self.update_unread(ids[0], 'false')
+        for start in range(0, len(ids), MARK_READ_BATCH):
+            self._request("post", "/1/notifications/all/read", [], params={"key": self._apikey, "token": self._token, "ids": ','.join(ids[start:start + MARK_READ_BATCH])}, data=None)
+
+class NotificationStream(object):
+    """Polls many members' notifications and yields the new ones.
+
+    Add members with :meth:`add`, each with the token to poll them with, then
+    iterate (``for member, notification in stream``, or ``async for`` in
+    asyncio code). Each member keeps a ``since`` cursor, so a poll only
+    returns notifications it has not seen (all of them, ``limit`` per
+    request), and its own poll interval between
+    ``min_interval`` and ``max_interval`` seconds: halved after a poll that
+    found something, stretched by ``backoff`` after one that did not. Due
+    members are polled oldest-due first, ``concurrency`` at a time, and all
+    polls share a ``budget`` of ``(requests, per_seconds)`` so the stream
+    leaves the rest of the API key's quota alone.
+
+    Notifications passed to :meth:`ack` are marked read in batches, every
+    ``flush_interval`` seconds or once ``MARK_READ_BATCH`` have queued up.
+    """
+
+    def __init__(self, api, min_interval=10.0, max_interval=300.0, backoff=1.5, budget=(100, 10), concurrency=8, read_filter='unread', limit=50, flush_interval=5.0):
+        self.api = api
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.concurrency = concurrency
+        self.read_filter = read_filter
+        self.limit = limit
+        self.flush_interval = flush_interval
+        self._limiter = RateLimiter(*budget) if budget else None
+        self._members = {}
+        self._due = []
+        self._acks = {}
+        self._flushed = time.monotonic()
+        self._closed = False
+        self._lock = threading.Lock()
+
+    def add(self, member, token=None, since=None):
+        with self._lock:
+            state = self._members[member] = _Member(member, token, since, self.min_interval)
+            heapq.heappush(self._due, (state.due, member))
+
+    def remove(self, member):
+        with self._lock:
+            self._members.pop(member, None)
+
+    def cursors(self):
+        # {member: since} to persist and pass back to add() after a restart.
+        with self._lock:
+            return dict((member, state.since) for member, state in self._members.items())
+
+    def poll(self):
+        """Polls the members that are due and returns ``(member, notification)`` pairs, oldest first."""
+        now = time.monotonic()
+        due = []
+        with self._lock:
+            while self._due and self._due[0][0] <= now and len(due) < 4 * self.concurrency:
+                when, member = heapq.heappop(self._due)
+                state = self._members.get(member)
+                # Entries left behind by remove() or a second add() are stale.
+                if state is not None and state.due == when:
+                    due.append(state)
+        found = []
+        for state, result in map_calls(self._poll_member, due, concurrency=self.concurrency, ordered=False, return_exceptions=True):
+            if isinstance(result, Exception):
+                # Probably a revoked token or an outage; try again much later.
+                state.interval = self.max_interval
+                result = []
+            elif result:
+                state.since = result[0]['id']
+                state.interval = max(self.min_interval, state.interval / 2)
+            else:
+                state.interval = min(self.max_interval, state.interval * self.backoff)
+            # A little jitter keeps members added together from being polled
+            # in lockstep forever.
+            state.due = time.monotonic() + state.interval * random.uniform(0.9, 1.1)
+            with self._lock:
+                if self._members.get(state.member) is state:
+                    heapq.heappush(self._due, (state.due, state.member))
+            found.extend((state.member, notification) for notification in reversed(result))
+        if time.monotonic() - self._flushed >= self.flush_interval:
+            self.flush()
+        return found
+
+    def _poll_member(self, state):
+        # Returns the new notifications, newest first. More than limit of
+        # them since the last poll take several pages, fetched backwards
+        # with before= until one comes back short; the cursor only moves
+        # once all of them are in. A first poll, without a cursor, just
+        # takes the newest page.
+        with self.api.as_token(state.token or self.api._token):
+            page = result = self._page(state, None)
+            while state.since is not None and page and len(page) >= self.limit:
+                page = self._page(state, page[-1]['id'])
+                result = result + page
+        return result
+
+    def _page(self, state, before):
+        if self._limiter is not None:
+            self._limiter.acquire()
+        return self.api.members.get_notification(state.member, read_filter=self.read_filter, since=state.since, before=before, limit=self.limit)
+
+    def ack(self, member, notification):
+        # Queues a notification (or its id) to be marked read.
+        state = self._members.get(member)
+        token = state.token if state is not None and state.token else self.api._token
+        with self._lock:
+            pending = self._acks.setdefault(token, [])
+            pending.append(notification['id'] if isinstance(notification, dict) else notification)
+            full = len(pending) >= MARK_READ_BATCH
+        if full:
+            self.flush()
+
+    def flush(self):
+        with self._lock:
+            acks, self._acks = self._acks, {}
+            self._flushed = time.monotonic()
+        for token, ids in acks.items():
+            with self.api.as_token(token):
+                self.api.notifications.mark_read(ids)
+
+    def next_due(self):
+        # Seconds until the next member is due, or None with no members.
+        with self._lock:
+            if not self._due:
+                return None
+            return max(self._due[0][0] - time.monotonic(), 0.0)
+
+    def close(self):
+        self._closed = True
+        self.flush()
+
+    def _wait(self):
+        wait = self.next_due()
+        return min(wait if wait is not None else self.flush_interval, self.flush_interval)
+
+    def __iter__(self):
+        while not self._closed:
+            found = self.poll()
+            for item in found:
+                yield item
+            if not found:
+                time.sleep(self._wait())
+
+    async def __aiter__(self):
+        loop = asyncio.get_running_loop()
+        while not self._closed:
+            found = await loop.run_in_executor(None, self.poll)
+            for item in found:
+                yield item
+            if not found:
+                await asyncio.sleep(self._wait())
+
+class _Member(object):
+    __slots__ = ('member', 'token', 'since', 'interval', 'due')
+
+    def __init__(self, member, token, since, interval):
+        self.member = member
+        self.token = token
+        self.since = since
+        self.interval = interval
+        # Spread the first polls out instead of sending them all at once.
+        self.due = time.monotonic() + random.uniform(0, interval)
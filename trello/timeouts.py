@@ -0,0 +1,62 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+import requests
+
+# (connect, read) seconds used when neither the call nor the transport sets
+# one; requests on its own waits forever for a stalled connection.
+DEFAULT_TIMEOUT = (10.0, 60.0)
+
+# Overrides and deadlines for the current thread or asyncio task. Both are
+# copied into the workers of TrelloApi.map(), so fanned out calls share them.
+_timeout_override = ContextVar('trello_timeout_override', default=None)
+_deadline = ContextVar('trello_deadline', default=None)
+
+class DeadlineExceeded(requests.exceptions.Timeout):
+    """Raised instead of sending (or retrying) a call once the deadline has passed."""
+
+@contextmanager
+def timeout_scope(connect, read=None):
+    reset = _timeout_override.set((connect, read if read is not None else connect))
+    try:
+        yield
+    finally:
+        _timeout_override.reset(reset)
+
+@contextmanager
+def deadline_scope(seconds):
+    # A nested deadline can only shorten the one it is nested in.
+    deadline = time.monotonic() + seconds
+    outer = _deadline.get()
+    reset = _deadline.set(deadline if outer is None else min(outer, deadline))
+    try:
+        yield
+    finally:
+        _deadline.reset(reset)
+
+def remaining():
+    # Seconds left before the current deadline, or None without one.
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+def effective_timeout(default):
+    # The (connect, read) timeout for a call made now: the scoped override or
+    # the transport default, capped by what is left of the deadline.
+    timeout = _timeout_override.get() or default
+    left = remaining()
+    if left is None:
+        return timeout
+    if left <= 0:
+        raise DeadlineExceeded('deadline exceeded')
+    if timeout is None:
+        return (left, left)
+    return (min(timeout[0], left), min(timeout[1], left))
+
+def check_deadline(wait=0.0):
+    # Raises if waiting another ``wait`` seconds would run past the deadline.
+    left = remaining()
+    if left is not None and left <= wait:
+        raise DeadlineExceeded('deadline exceeded')
@@ -0,0 +1,82 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# The span of the API call in progress (or one the caller set with
+# use_span()), so spans started in this thread or task -- including calls that
+# map() fans out to worker threads -- can be linked to it.
+_current_span = ContextVar('trello_current_span', default=None)
+
+def current_span():
+    return _current_span.get()
+
+@contextmanager
+def use_span(span):
+    # Make span the parent of the spans of API calls made inside the block.
+    reset = _current_span.set(span)
+    try:
+        yield span
+    finally:
+        _current_span.reset(reset)
+
+class Tracer(object):
+    """Tracing hook for :class:`trello.transport.Transport`.
+
+    ``start_span`` is called before each API call with its
+    :class:`trello.transport.Call` and the current parent span (or None) and
+    returns a span object; ``end_span`` is called with that span once the
+    call has finished, and the exception if it failed. This base class
+    records nothing.
+    """
+
+    def start_span(self, call, parent):
+        return None
+
+    def end_span(self, span, call, error=None):
+        pass
+
+def start_attributes(call):
+    return {
+        'http.method': call.method.upper(),
+        'http.url': call.url,
+        'trello.endpoint': call.endpoint,
+        'trello.entity_ids': [str(arg) for arg in call.path_args],
+    }
+
+def end_attributes(call):
+    attributes = {
+        'trello.attempts': call.attempts,
+        'trello.hedges': call.hedges,
+        'trello.cache_hit': call.cache_hit,
+        'trello.request_bytes': call.request_bytes,
+        'trello.response_bytes': call.response_bytes,
+        'trello.rate_limit_wait': call.waited,
+    }
+    if call.status is not None:
+        attributes['http.status_code'] = call.status
+    return attributes
+
+class OpenTelemetryTracer(Tracer):
+    """Reports API calls as OpenTelemetry client spans.
+
+    Requires ``opentelemetry-api``. Spans are children of the caller's current
+    OpenTelemetry span unless a parent is set with :func:`use_span`.
+    """
+
+    def __init__(self, tracer_provider=None):
+        try:
+            from opentelemetry import trace
+        except ImportError:
+            raise ImportError('OpenTelemetryTracer requires opentelemetry-api (pip install opentelemetry-api)')
+        self._trace = trace
+        self._tracer = trace.get_tracer('trello', tracer_provider=tracer_provider)
+
+    def start_span(self, call, parent):
+        context = self._trace.set_span_in_context(parent) if parent is not None else None
+        return self._tracer.start_span(call.endpoint, context=context, kind=self._trace.SpanKind.CLIENT, attributes=start_attributes(call))
+
+    def end_span(self, span, call, error=None):
+        span.set_attributes(end_attributes(call))
+        if error is not None:
+            span.record_exception(error)
+            span.set_status(self._trace.Status(self._trace.StatusCode.ERROR, str(error)))
+        span.end()
@@ -0,0 +1,443 @@
+import json
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .cache import ResponseCache
+from .circuit import NEUTRAL, SUCCESS, outcome
+from .http2 import HTTP2Adapter, http2_available
+from .timeouts import DEFAULT_TIMEOUT, DeadlineExceeded, check_deadline, effective_timeout, remaining
+from .tracing import _current_span, current_span
+from .upload import MultipartEncoder, has_uploads
+
+BASE_URL = 'https://trello.com'
+
+# Each HTTP/2 connection carries up to ~100 concurrent requests, so a handful
+# covers any pool_maxsize.
+HTTP2_CONNECTIONS = 4
+
+# Threads for the primary attempts of hedged GETs. Idle threads are reused,
+# so this only bounds how many can be in flight before they queue.
+PRIMARY_THREADS = 1024
+
+class Transport(object):
+    """Sends requests for one or more clients over a shared connection pool.
+
+    Optionally throttles through a per-key ``key_limiter`` and per-token
+    ``token_limiters`` (:mod:`trello.ratelimit`), caches GET responses in a
+    ``cache`` (:class:`trello.cache.ResponseCache`) and retries responses that
+    were rejected with 429 up to ``retries`` times. Every call is recorded in
+    ``metrics`` (:class:`trello.metrics.Metrics`) and reported to ``tracer``
+    (:class:`trello.tracing.Tracer`) and ``profiler``
+    (:class:`trello.diagnostics.CallSiteProfiler`) if they are given. With
+    ``breakers`` (:class:`trello.circuit.CircuitBreakers`) calls to an
+    endpoint that keeps failing fail fast until it recovers, and with
+    ``hedging`` (:class:`trello.hedging.HedgePolicy`) slow GETs are retried
+    in parallel and the first response wins. Every callable in ``listeners``
+    is called with each finished :class:`Call`.
+
+    With ``aliases`` (:class:`trello.aliases.AliasMap`) board and card
+    shortlinks and URLs in request paths are replaced by ids learned from
+    earlier responses. With ``coalesce`` a GET that is already in flight is
+    not sent again; the second caller waits for the first one's response.
+    Responses are decoded by ``decoder`` (e.g.
+    :class:`trello.decoding.SharedDecoder`) instead of ``json.loads`` if it
+    is given.
+
+    ``timeout`` is the ``(connect, read)`` timeout in seconds (or one number
+    for both) used unless a call runs inside :meth:`trello.TrelloApi.timeout`;
+    either is cut short by an enclosing :meth:`trello.TrelloApi.deadline`.
+
+    With ``http2`` HTTPS requests go through :class:`trello.http2.HTTP2Adapter`
+    if httpx with HTTP/2 support is installed, multiplexing concurrent calls
+    over a few connections; otherwise, and for servers that do not offer
+    HTTP/2, they use HTTP/1.1. ``self.http2`` says which one was picked.
+
+    With ``pin_environment`` the proxy and CA bundle settings for
+    ``base_url`` are read from the environment once instead of on every
+    request. That saves time per call, but ``NO_PROXY`` exceptions for other
+    hosts (such as attachment downloads), ``.netrc`` credentials and later
+    changes to the environment are then ignored.
+    """
+
+    def __init__(self, base_url=BASE_URL, session=None, cache=None, key_limiter=None, token_limiters=None, retries=0, pool_maxsize=64, metrics=None, tracer=None, profiler=None, breakers=None, hedging=None, timeout=DEFAULT_TIMEOUT, http2=False, listeners=(), aliases=None, coalesce=False, decoder=None, pin_environment=False):
+        self.base_url = base_url
+        self.timeout = timeout if timeout is None or isinstance(timeout, tuple) else (timeout, timeout)
+        self.cache = cache
+        self.key_limiter = key_limiter
+        self.token_limiters = token_limiters
+        self.retries = retries
+        self.metrics = metrics
+        self.tracer = tracer
+        self.profiler = profiler
+        self.breakers = breakers
+        self.hedging = hedging
+        self.listeners = list(listeners)
+        self.aliases = aliases
+        self.decoder = decoder if decoder is not None else json.loads
+        self._flights = {} if coalesce else None
+        self._flights_lock = threading.Lock()
+        self._primary_executor = None
+        self._hedge_executor = None
+        self._executor_lock = threading.Lock()
+        self._pool_maxsize = pool_maxsize
+        self.http2 = False
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_maxsize)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            if http2 and http2_available():
+                session.mount('https://', HTTP2Adapter(max_connections=HTTP2_CONNECTIONS))
+                self.http2 = True
+            if pin_environment:
+                # Read proxy and CA bundle settings from the environment once;
+                # with trust_env requests rescans os.environ on every request,
+                # which can cost more than the rest of the call put together.
+                settings = session.merge_environment_settings(base_url, {}, None, None, None)
+                session.proxies.update(settings['proxies'])
+                session.verify = settings['verify']
+                session.trust_env = False
+        self.session = session
+
+    def request(self, method, path, path_args=(), params=None, data=None):
+        if self.aliases is not None:
+            path_args = self.aliases.canonical_args(path, path_args)
+        url = self.base_url + path.format(*path_args)
+        params = _compact(params)
+        data = _compact(data) or None
+        token = params.get('token')
+        fields = data
+        headers = None
+        if data and has_uploads(data):
+            data = MultipartEncoder(data)
+            headers = {'Content-Type': data.content_type}
+
+        call = Call(method, path, path_args, url, token)
+        call.data = fields
+        span = reset = error = None
+        if self.tracer is not None:
+            span = self.tracer.start_span(call, current_span())
+            reset = _current_span.set(span)
+        try:
+            key = None
+            if self.cache is not None and method == 'get':
+                key = self.cache.make_key(token, url, params)
+                content = self.cache.get(key)
+                if content is not None:
+                    call.cache_hit = True
+                    call.response_bytes = len(content)
+                    return self._decode(content)
+
+            if self._flights is not None and method == 'get':
+                content = self._coalesced(call, key if key is not None else ResponseCache.make_key(token, url, params), params)
+            elif self.breakers is None:
+                content = self._send(call, params, data, headers).content
+            else:
+                content = self._send_guarded(call, params, data, headers).content
+            if key is not None:
+                self.cache.set(key, content)
+            elif self.cache is not None:
+                self.cache.invalidate(token)
+            return self._decode(content)
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            call.elapsed = time.perf_counter() - call.started
+            if self.metrics is not None:
+                self.metrics.observe(call)
+            if self.profiler is not None:
+                self.profiler.observe(call)
+            for listener in self.listeners:
+                listener(call)
+            if self.tracer is not None:
+                _current_span.reset(reset)
+                self.tracer.end_span(span, call, error)
+
+    def _decode(self, content):
+        result = self.decoder(content)
+        if self.aliases is not None:
+            self.aliases.learn(result)
+        return result
+
+    def _coalesced(self, call, key, params):
+        # Sends the GET unless an identical one is in flight, in which case
+        # it waits for that one's response instead.
+        with self._flights_lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+        if not leader:
+            call.coalesced = True
+            if not flight.done.wait(remaining()):
+                raise DeadlineExceeded('deadline exceeded during {}'.format(call.endpoint))
+            if flight.error is not None:
+                raise flight.error
+            call.status = flight.status
+            call.response_bytes = len(flight.content)
+            return flight.content
+        try:
+            if self.breakers is None:
+                flight.content = self._send(call, params, None).content
+            else:
+                flight.content = self._send_guarded(call, params, None, None).content
+            flight.status = call.status
+            return flight.content
+        except Exception as error:
+            flight.error = error
+            raise
+        finally:
+            with self._flights_lock:
+                del self._flights[key]
+            flight.done.set()
+
+    def _send(self, call, params, data, headers=None):
+        while True:
+            call.waited += self._throttle(call.token)
+            if call.attempts and isinstance(data, MultipartEncoder):
+                data.rewind()
+            call.attempts += 1
+            timeout = effective_timeout(self.timeout)
+            try:
+                if self.hedging is not None and self.hedging.applies_to(call.endpoint):
+                    resp = self._hedged_request(call, params, timeout)
+                else:
+                    resp = self.session.request(call.method, call.url, params=params, data=data, headers=headers, timeout=timeout)
+            except requests.exceptions.Timeout as error:
+                left = remaining()
+                if left is not None and left <= 0:
+                    raise DeadlineExceeded('deadline exceeded during {}'.format(call.endpoint)) from error
+                raise
+            call.status = resp.status_code
+            call.request_bytes += _body_size(resp.request.body)
+            call.response_bytes = len(resp.content)
+            if resp.status_code == 429 and call.attempts <= self.retries:
+                delay = _retry_after(resp, call.attempts)
+                left = remaining()
+                # A retry that cannot finish before the deadline would only
+                # add load; report the 429 instead.
+                if left is None or delay < left:
+                    call.waited += self._back_off(call.token, delay)
+                    continue
+            resp.raise_for_status()
+            return resp
+
+    def _send_guarded(self, call, params, data, headers):
+        breaker = self.breakers.get(call.endpoint)
+        breaker.allow()
+        started = time.perf_counter()
+        # Anything that is neither a response nor a request error -- an
+        # interrupt, a bug -- leaves the breaker as it was.
+        result = NEUTRAL
+        try:
+            resp = self._send(call, params, data, headers)
+            result = SUCCESS
+            return resp
+        except requests.exceptions.RequestException as error:
+            result = outcome(error)
+            raise
+        finally:
+            breaker.record(result, time.perf_counter() - started - call.waited)
+
+    def _hedged_request(self, call, params, timeout):
+        policy = self.hedging
+        delay = policy.delay(call.endpoint)
+        started = time.perf_counter()
+        if delay is None:
+            resp = self.session.request('get', call.url, params=params, timeout=timeout)
+            policy.observe(call.endpoint, time.perf_counter() - started)
+            return resp
+        # The primary gets a thread of its own as soon as it is sent; queued
+        # behind other calls it would look slow and be hedged for nothing.
+        # (It cannot run on this thread, which has to be free to return the
+        # hedge's response if that arrives first.) The delay counts from the
+        # moment it is actually sent.
+        sending = threading.Event()
+
+        def send():
+            sending.set()
+            return self.session.request('get', call.url, params=params, timeout=timeout)
+
+        primary = self._executor('_primary_executor', PRIMARY_THREADS, 'trello-primary').submit(send)
+        sending.wait()
+        done, _ = wait([primary], timeout=delay)
+        if done or not self._try_hedge(call.token):
+            resp = primary.result()
+            policy.observe(call.endpoint, time.perf_counter() - started)
+            return resp
+        call.hedges += 1
+        hedge = self._executor('_hedge_executor', self._pool_maxsize, 'trello-hedge').submit(self.session.request, 'get', call.url, params=params, timeout=timeout)
+        # The first 2xx response wins. Errors and other statuses (a 429, a
+        # 503) are only returned if neither attempt did better; a response
+        # beats an exception.
+        pending = set([primary, hedge])
+        fallback = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None and future.result().status_code < 300:
+                    policy.observe(call.endpoint, time.perf_counter() - started)
+                    return future.result()
+                if fallback is None or fallback.exception() is not None:
+                    fallback = future
+        policy.observe(call.endpoint, time.perf_counter() - started)
+        return fallback.result()
+
+    def _try_hedge(self, token):
+        # Only hedge if the rate limiters have a slot free right now, so
+        # hedges never cause throttling, and the budget allows it. The
+        # limiters go first: a refused hedge must not use up budget.
+        if not self._try_throttle(token):
+            return False
+        if self.hedging.try_spend():
+            return True
+        self._refund(token)
+        return False
+
+    def _executor(self, name, max_workers, prefix):
+        executor = getattr(self, name)
+        if executor is None:
+            with self._executor_lock:
+                executor = getattr(self, name)
+                if executor is None:
+                    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=prefix)
+                    setattr(self, name, executor)
+        return executor
+
+    def _try_throttle(self, token):
+        if self.key_limiter is not None and not self.key_limiter.try_acquire():
+            return False
+        if self.token_limiters is not None and token is not None and not self.token_limiters.get(token).try_acquire():
+            if self.key_limiter is not None:
+                self.key_limiter.refund()
+            return False
+        return True
+
+    def _refund(self, token):
+        # Gives back the slots taken by a successful _try_throttle().
+        if self.key_limiter is not None:
+            self.key_limiter.refund()
+        if self.token_limiters is not None and token is not None:
+            self.token_limiters.get(token).refund()
+
+    def stream(self, url, token=None, headers=None):
+        # Raw streamed GET for file downloads; goes through the same rate
+        # limiters but bypasses the cache and JSON decoding.
+        self._throttle(token)
+        resp = self.session.get(url, headers=headers, stream=True, timeout=effective_timeout(self.timeout))
+        try:
+            resp.raise_for_status()
+        except requests.HTTPError:
+            resp.close()
+            raise
+        return resp
+
+    def _throttle(self, token):
+        waited = 0.0
+        if self.key_limiter is not None:
+            waited += _acquire(self.key_limiter)
+        if self.token_limiters is not None and token is not None:
+            waited += _acquire(self.token_limiters.get(token))
+        return waited
+
+    def _back_off(self, token, delay):
+        # Returns the time slept here; when a limiter is penalized instead the
+        # wait shows up in the next _throttle().
+        if self.token_limiters is not None and token is not None:
+            self.token_limiters.get(token).penalize(delay)
+        elif self.key_limiter is not None:
+            self.key_limiter.penalize(delay)
+        else:
+            time.sleep(delay)
+            return delay
+        return 0.0
+
+    def mount(self, prefix, adapter):
+        # Route requests for URLs starting with prefix through a requests
+        # adapter, e.g. trello.replay.RecordingAdapter or ReplayAdapter.
+        self.session.mount(prefix, adapter)
+
+    def close(self):
+        for executor in (self._primary_executor, self._hedge_executor):
+            if executor is not None:
+                executor.shutdown(wait=False)
+        self.session.close()
+
+class Call(object):
+    # What happened during one API call, for instrumentation.
+    __slots__ = ('method', 'path', 'path_args', 'url', 'token', 'started', 'elapsed', 'attempts', 'hedges', 'waited', 'status', 'request_bytes', 'response_bytes', 'cache_hit', 'coalesced', 'data')
+
+    def __init__(self, method, path, path_args, url, token):
+        self.method = method
+        self.path = path
+        self.path_args = path_args
+        self.url = url
+        self.token = token
+        self.started = time.perf_counter()
+        self.elapsed = 0.0
+        self.attempts = 0
+        self.hedges = 0
+        self.waited = 0.0
+        self.status = None
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.cache_hit = False
+        self.coalesced = False
+        # The form fields sent with a write, if any, for listeners.
+        self.data = None
+
+    @property
+    def endpoint(self):
+        # The URL template, e.g. "GET /1/boards/{}/cards", which (unlike the
+        # URL) has few enough values to label metrics with.
+        return '{} {}'.format(self.method.upper(), self.path)
+
+    @property
+    def retries(self):
+        return max(self.attempts - 1, 0)
+
+class _Flight(object):
+    # A GET in flight that identical requests can wait for.
+    __slots__ = ('done', 'content', 'status', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.content = self.status = self.error = None
+
+def _acquire(limiter):
+    # RateLimiter.acquire(), but giving up rather than sleeping past the
+    # deadline.
+    wait = limiter.reserve()
+    if wait > 0:
+        try:
+            check_deadline(wait)
+        except DeadlineExceeded:
+            # The slot was never used; let the next caller have it.
+            limiter.refund()
+            raise
+        time.sleep(wait)
+    return wait
+
+def _body_size(body):
+    if body is None:
+        return 0
+    try:
+        return len(body)
+    except TypeError:
+        return 0
+
+def _compact(values):
+    if not values:
+        return {}
+    return dict((k, v) for k, v in values.items() if v is not None)
+
+def _retry_after(resp, attempt):
+    try:
+        return float(resp.headers['Retry-After'])
+    except (KeyError, ValueError):
+        return min(2.0 ** attempt, 30.0)
@@ -1,15 +1,8 @@
-import json
-import requests
+from .base import ApiResource
 
-class Types(object):
+class Types(ApiResource):
     __module__ = 'trello'
 
-    def __init__(self, apikey, token=None):
-        self._apikey = apikey
-        self._token = token
-
     def get(self, team_or_user_id):
-        resp = requests.get("https://trello.com/1/types/{}".format(team_or_user_id), params={"key": self._apikey, "token": self._token}, data=None)
-        resp.raise_for_status()
-        return json.loads(resp.text)
+        return self._request("get", "/1/types/{}", [team_or_user_id], params={"key": self._apikey, "token": self._token}, data=None)
 
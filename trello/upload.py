@@ -0,0 +1,136 @@
+import mimetypes
+import os
+import uuid
+
+CHUNK_SIZE = 64 * 1024
+
+class Upload(object):
+    """A file to send as a multipart form field without reading it into memory.
+
+    ``source`` is a path or a binary file object. ``progress``, if given, is
+    called as ``progress(bytes_sent, total_bytes)`` while the file streams.
+    Files opened from a path are closed once they have been sent; file
+    objects passed in are left open.
+    """
+
+    def __init__(self, source, filename=None, content_type=None, progress=None):
+        self.source = source
+        if isinstance(source, (str, bytes, os.PathLike)):
+            self._path = os.fspath(source)
+            self.size = os.path.getsize(self._path)
+            self._start = 0
+            self._fd = None
+        else:
+            self._path = None
+            self._fd = source
+            self._start = source.tell()
+            self.size = _remaining(source, self._start)
+        name = filename or os.path.basename(self._path or getattr(source, 'name', '') or 'file')
+        self.filename = os.fsdecode(name)
+        self.content_type = content_type or mimetypes.guess_type(self.filename)[0] or 'application/octet-stream'
+        self.progress = progress
+        self.sent = 0
+
+    def rewind(self):
+        if self._path is not None:
+            self.close()
+            self._fd = open(self._path, 'rb')
+        else:
+            self._fd.seek(self._start)
+        self.sent = 0
+
+    def read(self, size):
+        chunk = self._fd.read(min(size, self.size - self.sent))
+        self.sent += len(chunk)
+        if self.progress is not None:
+            self.progress(self.sent, self.size)
+        if self.sent >= self.size and self._path is not None:
+            self.close()
+        return chunk
+
+    def close(self):
+        if self._path is not None and self._fd is not None:
+            self._fd.close()
+            self._fd = None
+
+def _remaining(fd, start):
+    try:
+        return os.fstat(fd.fileno()).st_size - start
+    except (AttributeError, OSError, ValueError):
+        end = fd.seek(0, os.SEEK_END)
+        fd.seek(start)
+        return end - start
+
+def has_uploads(data):
+    return any(isinstance(value, Upload) or hasattr(value, 'read') for value in data.values())
+
+class MultipartEncoder(object):
+    """Streams ``multipart/form-data`` for a dict of form fields.
+
+    Values that are :class:`Upload` instances (or plain file objects) are read
+    in chunks as the request body is sent, so the length of the body is known
+    up front but the body itself is never held in memory.
+    """
+
+    def __init__(self, fields, boundary=None):
+        self.boundary = boundary or uuid.uuid4().hex
+        self.content_type = 'multipart/form-data; boundary={}'.format(self.boundary)
+        self._parts = []
+        for name, value in fields.items():
+            for item in (value if isinstance(value, (list, tuple)) else [value]):
+                self._add(name, item)
+        self._parts.append('--{}--\r\n'.format(self.boundary).encode())
+        self.len = sum(part.size if isinstance(part, Upload) else len(part) for part in self._parts)
+        self.rewind()
+
+    def _add(self, name, value):
+        if not isinstance(value, Upload) and hasattr(value, 'read'):
+            value = Upload(value)
+        if isinstance(value, Upload):
+            header = '--{}\r\nContent-Disposition: form-data; name="{}"; filename="{}"\r\nContent-Type: {}\r\n\r\n'.format(
+                self.boundary, name, value.filename.replace('"', '%22'), value.content_type)
+            self._parts.extend([header.encode(), value, b'\r\n'])
+        else:
+            if not isinstance(value, bytes):
+                value = str(value).encode('utf-8')
+            header = '--{}\r\nContent-Disposition: form-data; name="{}"\r\n\r\n'.format(self.boundary, name)
+            self._parts.append(header.encode() + value + b'\r\n')
+
+    def rewind(self):
+        # Called before every attempt, so a retried request resends the body
+        # from the start.
+        for part in self._parts:
+            if isinstance(part, Upload):
+                part.rewind()
+        self._index = 0
+        self._offset = 0
+
+    def __len__(self):
+        return self.len
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            size = self.len
+        out = []
+        while size > 0 and self._index < len(self._parts):
+            part = self._parts[self._index]
+            if isinstance(part, Upload):
+                chunk = part.read(size)
+                if not chunk or part.sent >= part.size:
+                    self._index += 1
+            else:
+                chunk = part[self._offset:self._offset + size]
+                self._offset += len(chunk)
+                if self._offset >= len(part):
+                    self._index += 1
+                    self._offset = 0
+            out.append(chunk)
+            size -= len(chunk)
+        return b''.join(out)
+
+    def __iter__(self):
+        while True:
+            chunk = self.read(CHUNK_SIZE)
+            if not chunk:
+                return
+            yield chunk
@@ -17,6 +17,13 @@ METHOD_LOOKUP = {
     'DELETE': 'delete',
 }
 
+# Hand-written helpers mixed into the generated classes: module -> [(helper module, class)]
+MIXINS = {
+    'cards': [('attachments', 'CardsAttachments')],
+    'notifications': [('streaming', 'NotificationsStreaming')],
+    'organizations': [('export', 'OrganizationsExport')],
+}
+
 def get_soup(url):
     resp = requests.get(url)
     resp.raise_for_status()
@@ -113,6 +120,12 @@ class ApiClass(object):
     def class_name(self):
         return self.module.title()
 
+    def mixins(self):
+        return [{'module': module, 'class': cls} for module, cls in MIXINS.get(self.module, [])]
+
+    def bases(self):
+        return ', '.join([mixin['class'] for mixin in self.mixins()] + ['ApiResource'])
+
     def methods(self):
         methods = []
         for action in self.actions:
@@ -128,7 +141,7 @@ class ApiClass(object):
             def_args = function_args(url_args, id_arg, req_args, opt_args)
             args = request_args(action[0].upper(), req_args, opt_args)
             method = action[0].lower()
-            url = '"https://trello.com{}".format({})'.format(re.sub(r'\[.*?\]', '{}', action[1]), ', '.join([id_arg] + url_args if id_arg else url_args))
+            url = '"{}", [{}]'.format(re.sub(r'\[.*?\]', '{}', action[1]), ', '.join([id_arg] + url_args if id_arg else url_args))
             methods.append(dict(def_args=def_args, args=args, method=method, url=url, name=method_name))
         return methods
 